@@ -0,0 +1,235 @@
+"""
+Configuración de los benchmarks de latencia de las páginas Index.
+Se ejecutan aparte de la suite funcional:
+
+    pytest benchmarks --stub-server
+    pytest benchmarks --bench-throwaway-db --bench-save
+
+Solo una línea base medida contra la aplicación hace fallar un benchmark; con
+--stub-server se mide el servidor simulado y la comparación es informativa
+(autoprueba de la medición, no de la aplicación). Contra la aplicación las
+filas se envían por los formularios y no se borran, así que se exige
+--bench-throwaway-db: la aplicación debe usar una base descartable y vacía
+(ver README). Los tamaños de 10k y 100k filas se miden solo con --bench-large.
+"""
+import asyncio
+import os
+from collections import defaultdict, namedtuple
+
+import pytest
+
+from utils.benchmark import (
+    DEFAULT_EXPONENT_TOLERANCE, DEFAULT_GROWTH_TOLERANCE, META_KEY, load_baseline,
+    save_results, synthetic_row
+)
+from pages.http_pages import HttpBasePage
+from utils.load_generator import FORMS, form_values, seed_rows
+
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+# Línea base por destino medido: la del servidor simulado es una autoprueba
+BASELINE_FILES = {"app": "index_latency_app.json", "stub": "index_latency_stub_selftest.json"}
+STUB_BASELINE_DESCRIPTION = (
+    "Autoprueba del servidor simulado (utils/stub_server.py): no mide la aplicación "
+    "y no hace fallar los benchmarks"
+)
+RESULTS_PATH = os.path.join("reports", "benchmarks.json")
+
+# Tamaños por defecto y los que se agregan con --bench-large
+DEFAULT_SIZES = "10,100,1000"
+LARGE_SIZES = (10000, 100000)
+
+# sizes: filas a medir, de menor a mayor; baseline: {módulo: resultado} de la
+# línea base; save: si se reemplaza la línea base con esta ejecución; target:
+# 'app' o 'stub'; gate: si una regresión hace fallar el benchmark
+BenchConfig = namedtuple(
+    "BenchConfig",
+    ["sizes", "min_rounds", "max_time", "baseline", "baseline_path", "save",
+     "exponent_tolerance", "growth_tolerance", "seed_concurrency", "target", "gate"]
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--bench-sizes", default=DEFAULT_SIZES,
+        help=f"Cantidades de filas a medir, separadas por coma (por defecto {DEFAULT_SIZES})"
+    )
+    group.addoption(
+        "--bench-large", action="store_true", default=False,
+        help="Medir también " + " y ".join(str(n) for n in LARGE_SIZES) + " filas"
+    )
+    group.addoption(
+        "--bench-throwaway-db", action="store_true", default=False,
+        help="Confirma que la aplicación usa una base descartable y vacía: los "
+             "benchmarks siembran filas por los formularios y no las borran"
+    )
+    group.addoption(
+        "--bench-min-rounds", type=int, default=5,
+        help="Rondas mínimas medidas por tamaño"
+    )
+    group.addoption(
+        "--bench-max-time", type=float, default=2.0,
+        help="Segundos de medición por tamaño (se completan igual las rondas mínimas)"
+    )
+    group.addoption(
+        "--bench-baseline", default=None,
+        help="JSON de línea base (por defecto benchmarks/baselines/index_latency_app.json, "
+             "o index_latency_stub_selftest.json con --stub-server)"
+    )
+    group.addoption(
+        "--bench-save", action="store_true", default=False,
+        help="Guardar los resultados como nueva línea base en lugar de compararlos"
+    )
+    group.addoption(
+        "--bench-exponent-tolerance", type=float, default=DEFAULT_EXPONENT_TOLERANCE,
+        help="Aumento máximo del exponente de escalado respecto de la línea base"
+    )
+    group.addoption(
+        "--bench-growth-tolerance", type=float, default=DEFAULT_GROWTH_TOLERANCE,
+        help="Aumento relativo máximo del crecimiento por tamaño (0.5 = 50%%)"
+    )
+    group.addoption(
+        "--bench-seed-concurrency", type=int, default=20,
+        help="Envíos simultáneos al sembrar filas por los formularios"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    benchmarks = [item for item in items if item.get_closest_marker("benchmark") is not None]
+    if (benchmarks and not config.getoption("--stub-server")
+            and not config.getoption("--bench-throwaway-db")):
+        raise pytest.UsageError(
+            "Los benchmarks siembran filas en la aplicación y no las borran: levántala "
+            "con una base descartable y vacía y usa --bench-throwaway-db (ver README), "
+            "o usa --stub-server"
+        )
+    # Sembrar 100k filas por los formularios supera el timeout de la suite funcional
+    if config.pluginmanager.hasplugin("timeout"):
+        for item in items:
+            item.add_marker(pytest.mark.timeout(0))
+
+
+@pytest.fixture(scope="session")
+def bench_config(request):
+    """
+    Fixture de sesión con la configuración de los benchmarks.
+
+    Returns:
+        BenchConfig: Opciones de la línea de comandos y línea base cargada
+    """
+    config = request.config
+    sizes = {int(size) for size in config.getoption("--bench-sizes").split(",")}
+    if config.getoption("--bench-large"):
+        sizes.update(LARGE_SIZES)
+    sizes = sorted(sizes)
+    target = "stub" if config.getoption("--stub-server") else "app"
+    baseline_path = (config.getoption("--bench-baseline")
+                     or os.path.join(BASELINE_DIR, BASELINE_FILES[target]))
+    baseline = load_baseline(baseline_path)
+    # Solo se exige una línea base de la aplicación medida contra la aplicación
+    measured_on = baseline.get(META_KEY, {}).get("target", "app")
+    return BenchConfig(
+        sizes=sizes,
+        min_rounds=config.getoption("--bench-min-rounds"),
+        max_time=config.getoption("--bench-max-time"),
+        baseline=baseline,
+        baseline_path=baseline_path,
+        save=config.getoption("--bench-save"),
+        exponent_tolerance=config.getoption("--bench-exponent-tolerance"),
+        growth_tolerance=config.getoption("--bench-growth-tolerance"),
+        seed_concurrency=config.getoption("--bench-seed-concurrency"),
+        target=target,
+        gate=target == "app" and measured_on == "app",
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_results(bench_config):
+    """
+    Fixture de sesión donde cada benchmark deja su resultado. Al terminar se
+    escribe reports/benchmarks.json y, con --bench-save, la línea base.
+
+    Yields:
+        dict: {módulo: resultado de route_result}
+    """
+    results = {}
+    yield results
+    if not results:
+        return
+    save_results(RESULTS_PATH, results)
+    if bench_config.save:
+        meta = {"target": bench_config.target}
+        if bench_config.target == "stub":
+            meta["description"] = STUB_BASELINE_DESCRIPTION
+        save_results(bench_config.baseline_path,
+                     {**bench_config.baseline, **results, META_KEY: meta})
+
+
+class IndexSeeder:
+    """
+    Agrega filas sintéticas hasta alcanzar un total por módulo. Con el servidor
+    simulado se escriben directo en memoria; contra la aplicación se envían por
+    los formularios, y antes de la primera se comprueba que la tabla esté vacía
+    (los tamaños cuentan solo las filas sembradas).
+    """
+
+    def __init__(self, base_url, stub=None, concurrency=20, session=None):
+        self.base_url = base_url
+        self.stub = stub
+        self.concurrency = concurrency
+        self.session = session
+        self.counts = defaultdict(int)
+
+    def grow_to(self, module, total):
+        """
+        Siembra las filas que faltan para llegar a total.
+
+        Args:
+            module: Clave de FORMS (ej. 'clientes')
+            total: Filas que debe tener la tabla
+        """
+        start = self.counts[module]
+        if self.stub is None and module not in self.counts:
+            self._check_empty(module)
+        rows = (synthetic_row(module, index) for index in range(start, total))
+        if self.stub is not None:
+            spec = FORMS[module]
+            resource_name = spec.index_path.split("/")[1]
+            self.stub.seed(resource_name, (form_values(spec, row) for row in rows))
+            accepted = total - start
+        else:
+            accepted = asyncio.run(seed_rows(self.base_url, module, rows, self.concurrency))
+        self.counts[module] += accepted
+        if self.counts[module] < total:
+            raise RuntimeError(
+                f"Solo se aceptaron {accepted} de {total - start} filas de {module}"
+            )
+
+    def _check_empty(self, module):
+        """
+        Raises:
+            RuntimeError: Si la lista del módulo ya tiene filas (la base no es descartable)
+        """
+        page = HttpBasePage(self.session)
+        page.navigate_to(f"{self.base_url}{FORMS[module].index_path}")
+        if page.get_table_row_count():
+            raise RuntimeError(
+                f"{FORMS[module].index_path} ya tiene filas: los benchmarks necesitan "
+                "una base descartable y vacía (ver --bench-throwaway-db en el README)"
+            )
+
+
+@pytest.fixture(scope="session")
+def index_seeder(request, base_url, bench_config):
+    """
+    Fixture de sesión que siembra filas en la aplicación o el servidor simulado.
+
+    Returns:
+        IndexSeeder: Sembrador compartido por los benchmarks
+    """
+    if request.config.getoption("--stub-server"):
+        return IndexSeeder(base_url, request.getfixturevalue("stub_server"),
+                           bench_config.seed_concurrency)
+    return IndexSeeder(base_url, concurrency=bench_config.seed_concurrency,
+                       session=request.getfixturevalue("http_session"))
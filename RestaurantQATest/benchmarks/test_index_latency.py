@@ -0,0 +1,56 @@
+"""
+Benchmarks de latencia de las páginas Index según la cantidad de filas.
+OnGetAsync de Clientes, Productos y Repartidores carga la tabla completa con
+GetAllAsync() y filtra o pagina en memoria, así que la latencia crece con la
+tabla. Cada benchmark siembra filas hasta cada tamaño, mide la página y
+compara el exponente de escalado con la línea base (contra el servidor simulado
+la comparación solo se informa). Sin línea base de la aplicación el benchmark
+falla: una ejecución sin nada que comparar no debe pasar por verde.
+"""
+from urllib.parse import urljoin
+
+import pytest
+
+from utils.benchmark import measure, route_result, scaling_regressions, summarize
+from utils.load_generator import FORMS
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", ["clientes", "productos", "repartidores"])
+def test_index_latency_scaling(module, index_seeder, http_session, base_url,
+                               bench_config, bench_results):
+    """
+    Mide la página Index de un módulo con cada tamaño de tabla configurado.
+    """
+    spec = FORMS[module]
+    url = urljoin(base_url, spec.index_path)
+
+    def load_index():
+        response = http_session.get(url, timeout=60)
+        response.raise_for_status()
+
+    sizes = {}
+    for rows in bench_config.sizes:
+        index_seeder.grow_to(module, rows)
+        sizes[rows] = summarize(measure(load_index, bench_config.min_rounds, bench_config.max_time))
+        print(f"{spec.index_path} con {rows} filas: {sizes[rows]['median_ms']} ms (mediana)")
+
+    result = route_result(spec.index_path, sizes)
+    bench_results[module] = result
+
+    if bench_config.save:
+        return
+    baseline = bench_config.baseline.get(module)
+    if baseline is None:
+        message = (f"No hay línea base de {module} en {bench_config.baseline_path}; "
+                   "generarla con --bench-save")
+        if bench_config.target == "app":
+            pytest.fail(f"{message} contra la aplicación con una base descartable")
+        pytest.skip(message)
+    regressions = scaling_regressions(result, baseline, bench_config.exponent_tolerance,
+                                      bench_config.growth_tolerance)
+    if not bench_config.gate:
+        for regression in regressions:
+            print(f"Autoprueba del servidor simulado (no se exige): {regression}")
+        return
+    assert not regressions, "Regresión de escalado:\n" + "\n".join(regressions)
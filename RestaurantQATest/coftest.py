@@ -1,21 +0,0 @@
-import pytest
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-
-@pytest.fixture(scope="session")
-def driver():
-    opts = Options()
-    opts.add_argument("--headless=new")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    service = ChromeService(ChromeDriverManager().install())
-    d = webdriver.Chrome(service=service, options=opts)
-    d.implicitly_wait(5)
-    yield d
-    d.quit()
-
-@pytest.fixture
-def base_url():
-    return "http://localhost:5020"
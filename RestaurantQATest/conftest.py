@@ -2,20 +2,95 @@
 Configuración de fixtures de pytest para las pruebas de Selenium.
 Proporciona configuración compartida para todos los tests.
 """
+import functools
+import os
+
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
+from pages.cliente_page import ClientePage
+from pages.http_pages import (
+    HttpClientePage, HttpProductoPage, HttpRepartidorPage, create_session
+)
+from pages.producto_page import ProductoPage
+from pages.repartidor_page import RepartidorPage
+from utils.artifacts import capture_artifacts
+from utils.browser_context import ISOLATED, MODES, context_mode
+from utils.browser_pool import BrowserPool, pool_size_for_worker
+from utils.cdp_client import CdpBrowser, debugger_address, shared_loop
+from utils.command_metrics import record_commands
+from utils.data_loader import case_of
+from utils.driver_resolver import ENV_CHROME, resolve_driver
+from utils.flaky import retry_attempt
+from utils.network_profiles import PROFILES, network_profile, resolve_profile
+from utils.page_metrics import record_navigations
+from utils.stub_server import StubServer
+from utils.tab_pool import TabPool
+from utils.wait_policy import policy_for
 
-@pytest.fixture(scope="session")
-def driver():
+
+pytest_plugins = [
+    "utils.oracle", "utils.command_metrics", "utils.scheduler", "utils.page_metrics",
+    "utils.result_stream", "utils.artifacts", "utils.flaky", "utils.tab_pool",
+    "utils.timeouts"
+]
+
+
+def pytest_addoption(parser):
     """
-    Fixture de sesión que proporciona una instancia de WebDriver.
-    Se ejecuta una vez por sesión de pruebas y se comparte entre todos los tests.
-    
-    Yields:
+    Hook de pytest para registrar opciones de línea de comandos.
+    """
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--browser-pool-size", type=int, default=2,
+        help="Navegadores pre-calentados por worker (por defecto 2)"
+    )
+    group.addoption(
+        "--browser-max-total", type=int, default=os.cpu_count(),
+        help="Máximo de navegadores sumando todos los workers de xdist"
+    )
+    group.addoption(
+        "--browser-max-memory-mb", type=int, default=1024,
+        help="Memoria (MB) de los procesos de un Chrome (PSS en Linux) a partir de "
+             "la cual se recicla"
+    )
+    group.addoption(
+        "--browser-max-leases", type=int, default=200,
+        help="Tests ejecutados por navegador antes de reciclarlo"
+    )
+    group.addoption(
+        "--browser-context", choices=("marker",) + MODES, default="marker",
+        help="Aislamiento entre tests: 'isolated' (contexto CDP nuevo por test), "
+             "'shared' (un contexto CDP por navegador), 'reset' (limpiar cookies "
+             "y storage) o 'marker' (shared para smoke, isolated para el resto)"
+    )
+    group.addoption(
+        "--network-profile", default="full",
+        help="Perfiles de red del navegador separados por coma: "
+             f"{', '.join(PROFILES)} (ej. 'lean,slow3g'; ver utils/network_profiles.py)"
+    )
+    group.addoption(
+        "--engine", choices=("browser", "http"), default="browser",
+        help="Motor para los casos de formulario: 'browser' (Selenium) o "
+             "'http' (peticiones directas, sin navegador)"
+    )
+    group.addoption(
+        "--stub-server", action="store_true", default=False,
+        help="Ejecutar contra el servidor simulado en memoria (utils/stub_server.py) "
+             "en lugar de la aplicación en localhost:5020"
+    )
+
+
+def create_driver(resolved):
+    """
+    Crea una instancia de Chrome WebDriver configurada para las pruebas.
+
+    Args:
+        resolved: ResolvedDriver con las rutas de chromedriver y Chrome
+
+    Returns:
         WebDriver: Instancia de Chrome WebDriver configurada
     """
     opts = Options()
@@ -26,40 +101,223 @@ def driver():
     opts.add_argument("--disable-gpu")
     opts.add_argument("--window-size=1920,1080")
     
-    # Instalación automática del driver con webdriver-manager
-    service = ChromeService(ChromeDriverManager().install())
+    if resolved.chrome_path and os.environ.get(ENV_CHROME):
+        opts.binary_location = resolved.chrome_path
+    
+    # Driver local ya verificado: no se consulta la red al iniciar
+    service = ChromeService(executable_path=resolved.driver_path)
     d = webdriver.Chrome(service=service, options=opts)
-    d.implicitly_wait(5)
+    # Espera implícita del entorno (0 por defecto): las esperas las define utils/wait_policy.py
+    policy_for(d).apply()
+    return d
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """
+    Fixture de sesión que mantiene el pool de navegadores del worker actual.
+    Con pytest-xdist cada worker tiene su propio pool.
     
-    yield d
+    Yields:
+        BrowserPool: Pool con navegadores pre-calentados
+    """
+    config = request.config
+    size = pool_size_for_worker(
+        config.getoption("--browser-pool-size"),
+        config.getoption("--browser-max-total")
+    )
+    pool = BrowserPool(
+        functools.partial(create_driver, resolve_driver()),
+        size=size,
+        max_memory_mb=config.getoption("--browser-max-memory-mb"),
+        max_leases=config.getoption("--browser-max-leases")
+    )
+    pool.start()
     
-    # Cleanup: cerrar el navegador después de todas las pruebas
-    d.quit()
+    yield pool
+    
+    # Cleanup: cerrar los navegadores después de todas las pruebas
+    pool.close()
 
 
 @pytest.fixture
-def base_url():
+def driver(request, browser_pool):
     """
-    Fixture que proporciona la URL base de la aplicación.
+    Fixture que presta un navegador del pool durante un test.
+    El test corre en un contexto de navegador CDP según --browser-context y
+    sus marcadores (ver utils/browser_context.py), con el perfil de red de
+    --network-profile o del marcador network_profile. Mientras dura el test se
+    registran todos los comandos WebDriver (ver utils/command_metrics.py) y
+    las métricas de carga de cada navegación (ver utils/page_metrics.py), y se
+    guardan buffers para los artefactos de fallo (ver utils/artifacts.py).
+    Al terminar, el pool descarta el contexto o limpia cookies, storage y
+    ventanas extra, o recicla la instancia si se cayó o superó el umbral de
+    memoria.
     
+    Yields:
+        WebDriver: Instancia de Chrome WebDriver configurada
+    """
+    mode = context_mode(request.node, request.config.getoption("--browser-context"))
+    if retry_attempt(request.node):
+        mode = ISOLATED  # cada reintento empieza sin cookies ni storage del intento fallido
+    marker = request.node.get_closest_marker("network_profile")
+    profile = resolve_profile(marker.args[0] if marker is not None
+                              else request.config.getoption("--network-profile"))
+    with browser_pool.lease(mode) as d, network_profile(d, profile), \
+            record_navigations(request.config, d), capture_artifacts(request.node, d), \
+            record_commands(request.node, d):
+        yield d
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """
+    Fixture de sesión con conexiones HTTP keep-alive para el motor 'http'.
+
+    Yields:
+        requests.Session: Sesión compartida por los tests del worker
+    """
+    session = create_session()
+    yield session
+    session.close()
+
+
+def _use_browser(request):
+    """
+    Indica si el test debe usar Selenium: con --engine=browser o si el test
+    está marcado con 'browser' (comportamiento que depende de JavaScript).
+    """
+    return (request.config.getoption("--engine") == "browser"
+            or request.node.get_closest_marker("browser") is not None)
+
+
+@pytest.fixture
+def cliente_page(request, base_url):
+    """
+    Fixture que proporciona el Page Object de clientes según el motor elegido.
+
     Returns:
-        str: URL base donde corre la aplicación
+        ClientePage o HttpClientePage
     """
-    return "http://localhost:5020"
+    if _use_browser(request):
+        return ClientePage(request.getfixturevalue("driver"), base_url)
+    session = request.getfixturevalue("http_session")
+    session.cookies.clear()
+    return HttpClientePage(session, base_url)
 
 
-@pytest.fixture(autouse=True)
-def setup_teardown(driver):
+@pytest.fixture
+def producto_page(request):
     """
-    Fixture que se ejecuta antes y después de cada test.
-    Útil para limpiar el estado entre pruebas.
+    Fixture que proporciona el Page Object de productos según el motor elegido.
+
+    Returns:
+        ProductoPage o HttpProductoPage
+    """
+    if _use_browser(request):
+        return ProductoPage(request.getfixturevalue("driver"))
+    session = request.getfixturevalue("http_session")
+    session.cookies.clear()
+    return HttpProductoPage(session)
+
+
+@pytest.fixture
+def repartidor_page(request):
+    """
+    Fixture que proporciona el Page Object de repartidores según el motor elegido.
+
+    Returns:
+        RepartidorPage o HttpRepartidorPage
+    """
+    if _use_browser(request):
+        return RepartidorPage(request.getfixturevalue("driver"))
+    session = request.getfixturevalue("http_session")
+    session.cookies.clear()
+    return HttpRepartidorPage(session)
+
+
+@pytest.fixture(scope="session")
+def tab_results(request, browser_pool, base_url):
+    """
+    Fixture de sesión para los tests en pestañas (--tabs, ver utils/tab_pool.py).
+    El primer test de cada función ejecuta los casos de todos sus tests
+    seleccionados en un solo navegador; los siguientes leen su resultado. Un
+    reintento (--retries) vuelve a ejecutar solo su caso; el pool ya limpió
+    cookies y storage al devolver el navegador.
+
+    Returns:
+        Función (flow, item) -> resultado del caso del item
+    """
+    results = {}
+
+    def run(flow, cases):
+        tabs = min(request.config.getoption("--tabs"), len(cases))
+        with browser_pool.lease() as d, TabPool(d, tabs, base_url) as pool:
+            outcomes = pool.run(functools.partial(flow, base_url=base_url), cases)
+        return {case["caso"]: outcome for case, outcome in zip(cases, outcomes)}
+
+    def result_for(flow, item):
+        case = case_of(item)[1]
+        if item.originalname not in results:
+            cases = [case_of(i)[1] for i in request.session.items
+                     if getattr(i, "originalname", None) == item.originalname]
+            results[item.originalname] = run(flow, cases)
+        elif retry_attempt(item):
+            results[item.originalname].update(run(flow, [case]))
+        result = results[item.originalname][case["caso"]]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return result_for
+
+
+@pytest.fixture
+def cdp_browser(request):
+    """
+    Fixture que conecta por CDP con un navegador prestado del pool, para los
+    Page Objects asíncronos (ver pages/async_pages.py). Cada contexto que se
+    cree (map_in_contexts, new_context) se descarta al cerrar la conexión.
+    Con --engine=http el test se omite: estos Page Objects necesitan Chrome.
+
+    Yields:
+        CdpBrowser: Conexión al websocket del navegador
+    """
+    if request.config.getoption("--engine") != "browser":
+        pytest.skip("Los Page Objects asíncronos necesitan navegador (--engine=browser)")
+    loop = shared_loop()
+    with request.getfixturevalue("browser_pool").lease() as d:
+        browser = loop.run(CdpBrowser.connect(debugger_address(d)))
+        try:
+            yield browser
+        finally:
+            loop.run(browser.close())
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """
+    Fixture de sesión que levanta el servidor simulado (uno por worker de xdist).
     
-    Args:
-        driver: Instancia de WebDriver
+    Yields:
+        StubServer: Servidor escuchando en un puerto libre
     """
-    yield
-    # Limpiar cookies después de cada test
-    driver.delete_all_cookies()
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def base_url(request):
+    """
+    Fixture que proporciona la URL base de la aplicación.
+    Con --stub-server apunta al servidor simulado.
+    
+    Returns:
+        str: URL base donde corre la aplicación
+    """
+    if request.config.getoption("--stub-server"):
+        return request.getfixturevalue("stub_server").url
+    return "http://localhost:5020"
 
 
 def pytest_configure(config):
@@ -81,3 +339,25 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "regression: marca tests de regresión"
     )
+    config.addinivalue_line(
+        "markers", "browser: el test requiere navegador aunque se use --engine=http"
+    )
+    config.addinivalue_line(
+        "markers", "csv_case(archivo, caso): caso CSV que ejecuta el test (lo agrega case_params)"
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: benchmark de latencia (directorio benchmarks/)"
+    )
+    config.addinivalue_line(
+        "markers", "browser_context(modo): 'isolated', 'shared' o 'reset' para este test"
+    )
+    config.addinivalue_line(
+        "markers", "network_profile(perfiles): perfil de red del navegador para este test"
+    )
+    config.addinivalue_line(
+        "markers", "tab_pool: versión en pestañas de un test de registro (se ejecuta con --tabs)"
+    )
+    try:
+        resolve_profile(config.getoption("--network-profile"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
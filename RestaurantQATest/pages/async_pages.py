@@ -0,0 +1,546 @@
+"""
+Page Objects asíncronos sobre Chrome DevTools Protocol.
+Misma interfaz que los Page Objects de Selenium (navigate, fill_form,
+submit_form, get_validation_errors, is_*_registered) pero cada método es una
+corrutina que trabaja sobre una pestaña de utils.cdp_client. Un solo event loop
+puede así llevar muchos contextos a la vez y superponer sus esperas de red y
+de render. Reutilizan los scripts, localizadores y excepciones de Selenium de
+los Page Objects síncronos, que siguen siendo la API de los tests; SyncPage
+permite usar estos desde código síncrono.
+"""
+import asyncio
+import logging
+import time
+import uuid
+
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, TimeoutException
+)
+
+from pages.base_page import (
+    BasePage, FILL_FIELDS_SCRIPT, MARK_PAGE_SCRIPT, NAVIGATION_TIMING_SCRIPT,
+    PAGE_STATE_SCRIPT, REDIRECTED_SCRIPT, TABLE_DATA_SCRIPT, VALIDATION_SNAPSHOT_SCRIPT
+)
+from pages.cliente_page import ClientePage
+from pages.producto_page import ProductoPage
+from pages.repartidor_page import RepartidorPage
+from utils.page_metrics import navigation_listener
+from utils.timeouts import current_service
+
+
+logger = logging.getLogger(__name__)
+
+# Intervalo de polling de las esperas (igual que BasePage.wait_for_page_ready)
+POLL_INTERVAL = 0.05
+
+# Estado de un elemento: null si no existe; si no, visibilidad, si está
+# habilitado, texto, etiqueta y el centro en el viewport (tras hacer scroll)
+ELEMENT_STATE_SCRIPT = """
+var by = arguments[0], value = arguments[1], el = null;
+switch (by) {
+    case 'id': el = document.getElementById(value); break;
+    case 'name': el = document.getElementsByName(value)[0] || null; break;
+    case 'css selector': el = document.querySelector(value); break;
+    case 'link text':
+        el = Array.prototype.find.call(document.links, function (a) {
+            return (a.innerText || '').trim() === value;
+        }) || null;
+        break;
+    case 'xpath': el = document.evaluate(
+        value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        break;
+}
+if (!el) {
+    return null;
+}
+if (arguments[2]) {
+    el.scrollIntoView({block: 'center'});
+    el.focus();
+}
+var rect = el.getBoundingClientRect(), style = window.getComputedStyle(el);
+return {
+    visible: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+    enabled: !el.disabled,
+    text: (el.innerText || '').trim(),
+    tag: el.tagName.toLowerCase(),
+    x: rect.left + rect.width / 2,
+    y: rect.top + rect.height / 2
+};
+"""
+
+# Vacía un campo con el foco antes de escribir con Input.insertText
+CLEAR_FOCUSED_SCRIPT = """
+var field = document.activeElement;
+if (field && 'value' in field) {
+    field.value = '';
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+}
+"""
+
+
+class AsyncBasePage:
+    """
+    Clase base de los Page Objects asíncronos.
+    """
+
+    # Solo transforman un snapshot ya obtenido
+    _field_errors = BasePage.get_field_errors
+
+    def __init__(self, context, timeout=None):
+        """
+        Inicializa la página.
+
+        Args:
+            context: BrowsingContext de utils.cdp_client
+            timeout: Espera máxima por elemento en segundos (None usa 'element'
+                     de utils/timeouts.py)
+        """
+        self.context = context
+        # Techos del entorno (sin historial: las esperas CDP no se registran)
+        self.timeouts = dict(current_service().ceilings)
+        self.timeout = self.timeouts["element"] if timeout is None else timeout
+        self.page_ready = False
+        self.keystrokes = False
+        self.last_validation = None
+
+    async def execute_script(self, script, *args):
+        """Ejecuta un script con la convención de WebDriver en la pestaña."""
+        return await self.context.execute_script(script, *args)
+
+    async def _wait_until(self, condition, timeout, message):
+        """
+        Repite una corrutina hasta que devuelva un valor verdadero.
+        Los errores de JavaScript (documento reemplazado) se ignoran.
+
+        Raises:
+            TimeoutException: Si no se cumplió dentro de timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = await condition()
+                if value:
+                    return value
+            except JavascriptException:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def element_state(self, locator, focus=False):
+        """
+        Estado de un elemento en un solo round-trip.
+
+        Args:
+            locator: Tupla (By, valor); admite id, name, css selector, link text y xpath
+            focus: Hace scroll hasta el elemento y le da el foco
+
+        Returns:
+            dict: Ver ELEMENT_STATE_SCRIPT, o None si no existe
+        """
+        return await self.execute_script(ELEMENT_STATE_SCRIPT, *locator, focus)
+
+    async def _visible_state(self, locator, timeout, focus=False):
+        async def visible():
+            state = await self.element_state(locator, focus)
+            return state if state and state["visible"] else None
+        return await self._wait_until(visible, timeout, f"Elemento no visible: {locator}")
+
+    async def click(self, locator):
+        """
+        Hace clic con el mouse en el centro de un elemento visible y habilitado.
+
+        Args:
+            locator: Tupla (By, valor) del elemento
+        """
+        async def clickable():
+            state = await self.element_state(locator, focus=True)
+            return state if state and state["visible"] and state["enabled"] else None
+        self.page_ready = False
+        state = await self._wait_until(clickable, self.timeout, f"Elemento no clickeable: {locator}")
+        await self.context.click_at(state["x"], state["y"])
+
+    async def enter_text(self, locator, text):
+        """
+        Ingresa texto en un campo como el teclado.
+
+        Args:
+            locator: Tupla (By, valor) del campo
+            text: Texto a ingresar
+        """
+        await self._visible_state(locator, self.timeout, focus=True)
+        await self.execute_script(CLEAR_FOCUSED_SCRIPT)
+        if text:
+            await self.context.insert_text(str(text))
+
+    async def fill_fields(self, values, keystrokes=None):
+        """
+        Llena varios campos de un formulario (ver BasePage.fill_fields).
+
+        Raises:
+            NoSuchElementException: Si algún campo no existe en la página
+        """
+        if keystrokes is None:
+            keystrokes = self.keystrokes
+        entries = [
+            [by, selector, "" if value is None else str(value)]
+            for (by, selector), value in values.items()
+        ]
+        if keystrokes:
+            for entry in entries:
+                state = await self._visible_state(tuple(entry[:2]), self.timeout)
+                if state["tag"] != "select":
+                    await self.enter_text(tuple(entry[:2]), entry[2])
+                    continue
+                await self.execute_script(FILL_FIELDS_SCRIPT, [entry])
+            return
+        missing = await self.execute_script(FILL_FIELDS_SCRIPT, entries)
+        if missing:
+            raise NoSuchElementException(f"Campos no encontrados: {', '.join(missing)}")
+
+    async def get_text(self, locator):
+        """Obtiene el texto de un elemento visible."""
+        return (await self._visible_state(locator, self.timeout))["text"]
+
+    async def is_element_visible(self, locator, timeout=None):
+        """
+        Verifica si un elemento es visible dentro de timeout segundos (None usa
+        'visible'; 0 comprueba una sola vez).
+
+        Returns:
+            bool: True si el elemento es visible
+        """
+        try:
+            await self._visible_state(locator, self.timeouts["visible"] if timeout is None else timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    async def is_element_present(self, locator):
+        """Verifica si un elemento está en el DOM, sin esperar."""
+        return await self.element_state(locator) is not None
+
+    def settle_timeout(self, name):
+        """Espera para contenido del servidor (ver BasePage.settle_timeout)."""
+        return 0 if self.page_ready else self.timeouts[name]
+
+    async def get_current_url(self):
+        """Obtiene la URL actual de la pestaña."""
+        return await self.execute_script("return location.href;")
+
+    async def get_page_title(self):
+        """Obtiene el título de la página actual."""
+        return await self.execute_script("return document.title;")
+
+    async def navigate_to(self, url):
+        """
+        Navega a una URL y espera a que la página esté lista.
+
+        Args:
+            url: URL de destino
+        """
+        self.page_ready = False
+        await self.context.navigate(url)
+        await self.wait_for_page_ready()
+        await self.capture_navigation()
+
+    # ==================== DISPONIBILIDAD DE PÁGINA ====================
+
+    async def mark_page(self):
+        """Marca el documento actual (ver BasePage.mark_page)."""
+        token = uuid.uuid4().hex
+        self.page_ready = False
+        await self.execute_script(MARK_PAGE_SCRIPT, token)
+        return token
+
+    async def wait_for_page_ready(self, token=None, timeout=None):
+        """
+        Espera a que la página esté lista (ver BasePage.wait_for_page_ready).
+
+        Returns:
+            str: 'loaded' o 'validated'
+
+        Raises:
+            TimeoutException: Si la página no quedó lista dentro de timeout
+        """
+        state = await self._wait_until(
+            lambda: self.execute_script(PAGE_STATE_SCRIPT, token),
+            self.timeouts["submit" if token else "page"] if timeout is None else timeout,
+            "La página no quedó lista"
+        )
+        self.page_ready = True
+        return state
+
+    async def submit_and_wait(self, locator, timeout=None):
+        """
+        Hace clic en un botón de envío y espera el resultado del submit.
+
+        Returns:
+            str: Estado final ('loaded', 'validated') o None si se agotó el tiempo
+        """
+        token = await self.mark_page()
+        await self.click(locator)
+        try:
+            state = await self.wait_for_page_ready(token, timeout)
+        except TimeoutException:
+            logger.warning("Timeout esperando respuesta del formulario: %s",
+                           await self.get_current_url())
+            return None
+        if state == "loaded":
+            await self.capture_navigation()
+        return state
+
+    async def was_redirected(self):
+        """Verifica si el documento actual llegó por una redirección (ver BasePage.was_redirected)."""
+        try:
+            return bool(await self.execute_script(REDIRECTED_SCRIPT))
+        except JavascriptException:
+            return False
+
+    async def capture_navigation(self):
+        """
+        Entrega las métricas de carga al registro activo para esta pestaña
+        (ver utils/page_metrics.py, record_navigations acepta la pestaña).
+
+        Returns:
+            dict: Métricas de la navegación, o None si no se registraron
+        """
+        listener = navigation_listener(self.context)
+        if listener is None:
+            return None
+        try:
+            entry = await self.execute_script(NAVIGATION_TIMING_SCRIPT,
+                                              int(self.timeouts["page"] * 1000))
+        except JavascriptException:
+            return None
+        if entry:
+            listener(entry)
+        return entry
+
+    # ==================== LECTURA ====================
+
+    async def get_validation_snapshot(self):
+        """Mensajes de validación de la página (ver BasePage.get_validation_snapshot)."""
+        self.last_validation = await self.execute_script(VALIDATION_SNAPSHOT_SCRIPT)
+        return self.last_validation
+
+    async def has_validation_errors(self):
+        """Verifica si hay algún mensaje de validación."""
+        snapshot = await self.get_validation_snapshot()
+        return bool(snapshot["spans"] or snapshot["html5"])
+
+    async def get_field_errors(self, fields, snapshot=None):
+        """Mensajes de validación por campo (ver BasePage.get_field_errors)."""
+        if snapshot is None:
+            snapshot = await self.get_validation_snapshot()
+        return self._field_errors(fields, snapshot)
+
+    async def get_table_data(self, table_selector="table.table"):
+        """Contenido de una tabla y páginas de la paginación (ver BasePage.get_table_data)."""
+        return await self.execute_script(TABLE_DATA_SCRIPT, table_selector)
+
+
+class AsyncClientePage(AsyncBasePage):
+    """Versión asíncrona de ClientePage"""
+
+    VALIDATION_FIELDS = ClientePage.VALIDATION_FIELDS
+
+    def __init__(self, context, base_url):
+        """
+        Args:
+            context: BrowsingContext de utils.cdp_client
+            base_url: URL base de la aplicación
+        """
+        super().__init__(context)
+        self.base_url = base_url
+
+    async def navigate(self):
+        """Navega a la página de creación de clientes"""
+        await self.navigate_to(f"{self.base_url}/Clientes/Create")
+
+    async def navigate_to_index(self, search_term=None, page=1):
+        """Navega a la lista de clientes con búsqueda y paginación"""
+        await self.navigate_to(ClientePage.index_url(self.base_url, search_term, page))
+
+    async def fill_form(self, nombre, apellido, telefono, correo):
+        """Completa el formulario de registro de cliente"""
+        await self.fill_fields({
+            ClientePage.NOMBRE_INPUT: nombre,
+            ClientePage.APELLIDO_INPUT: apellido,
+            ClientePage.TELEFONO_INPUT: telefono,
+            ClientePage.CORREO_INPUT: correo
+        })
+
+    async def submit_form(self):
+        """Envía el formulario y espera la redirección o la validación del cliente"""
+        return await self.submit_and_wait(ClientePage.SUBMIT_BUTTON)
+
+    async def get_validation_errors(self):
+        """
+        Obtiene la lista de mensajes de error de validación
+
+        Returns:
+            list: Mensajes de los spans y, con el nombre del campo, los HTML5
+        """
+        snapshot = await self.get_validation_snapshot()
+        errors = list(snapshot["spans"].values())
+        for nombre_campo, name in self.VALIDATION_FIELDS.items():
+            if snapshot["html5"].get(name):
+                errors.append(f"{nombre_campo}: {snapshot['html5'][name]}")
+        return errors
+
+    async def is_cliente_registered(self, nombre, apellido):
+        """Verifica si el cliente aparece en la lista filtrada (ver ClientePage)"""
+        try:
+            search = ClientePage.registration_search(self.base_url, nombre, apellido)
+            while search.next_url:
+                await self.navigate_to(search.next_url)
+                data = await self.get_table_data(ClientePage.CLIENTES_TABLE[1])
+                search.read(data["rows"], data["pages"])
+            return search.found
+        except Exception as e:
+            print(f"Error al verificar registro de cliente: {str(e)}")
+            return False
+
+    async def is_on_create_page(self):
+        """Verifica si se está en la página de creación de clientes"""
+        return "Create" in await self.get_current_url() or "Crear" in await self.get_page_title()
+
+    async def is_on_index_page(self):
+        """Verifica si se está en la página de lista de clientes"""
+        return "Index" in await self.get_current_url() or "Lista" in await self.get_page_title()
+
+
+class AsyncProductoPage(AsyncBasePage):
+    """Versión asíncrona de ProductoPage"""
+
+    VALIDATION_FIELDS = ProductoPage.VALIDATION_FIELDS
+
+    async def navigate(self, base_url):
+        """Navega a la página de productos"""
+        await self.navigate_to(f"{base_url}/Productos/Index")
+
+    async def fill_form(self, nombre=None, precio=None, stock=None, descripcion=None, categoria_id=1):
+        """Rellena el formulario de producto; los campos en None quedan vacíos"""
+        await self.fill_fields({
+            ProductoPage.INPUT_NOMBRE: nombre,
+            ProductoPage.INPUT_PRECIO: precio,
+            ProductoPage.INPUT_STOCK: stock,
+            ProductoPage.INPUT_DESCRIPCION: descripcion,
+            ProductoPage.INPUT_CATEGORIA_ID: categoria_id
+        })
+
+    async def submit_form(self):
+        """Envía el formulario y espera la redirección o la validación del cliente"""
+        return await self.submit_and_wait(ProductoPage.BTN_SUBMIT)
+
+    async def get_validation_errors(self):
+        """Mensajes de validación por campo"""
+        return await self.get_field_errors(self.VALIDATION_FIELDS)
+
+    async def is_on_index_page(self):
+        """Verifica si la URL actual es la lista de productos"""
+        return ProductoPage.is_index_url(await self.get_current_url())
+
+    async def is_producto_registered(self):
+        """Mensaje de éxito visible, o el POST redirigió a la lista sin errores (ver ProductoPage)"""
+        if await self.is_element_visible(ProductoPage.ALERT_SUCCESS, timeout=self.settle_timeout("alert")):
+            return True
+        return ProductoPage.registered_after_submit(
+            await self.get_current_url(), await self.was_redirected(), await self.has_validation_errors()
+        )
+
+
+class AsyncRepartidorPage(AsyncBasePage):
+    """Versión asíncrona de RepartidorPage"""
+
+    VALIDATION_FIELDS = RepartidorPage.VALIDATION_FIELDS
+
+    async def navigate(self, base_url):
+        """Navega a la página de creación de repartidores"""
+        await self.navigate_to(f"{base_url}/Repartidores/Create")
+
+    async def fill_form(self, nombre=None, apellido=None, telefono=None, tipo=None):
+        """Rellena el formulario de repartidor; los campos en None quedan vacíos"""
+        campos = {
+            RepartidorPage.INPUT_NOMBRE: nombre,
+            RepartidorPage.INPUT_APELLIDO: apellido,
+            RepartidorPage.INPUT_TELEFONO: telefono
+        }
+        if tipo:
+            campos[RepartidorPage.SELECT_TIPO] = RepartidorPage.TIPO_MAPPING.get(tipo, tipo)
+        await self.fill_fields(campos)
+
+    async def submit_form(self):
+        """Envía el formulario y espera la redirección o la validación del cliente"""
+        return await self.submit_and_wait(RepartidorPage.BTN_SUBMIT)
+
+    async def get_validation_errors(self):
+        """Mensajes de validación por campo"""
+        return await self.get_field_errors(self.VALIDATION_FIELDS)
+
+    async def is_on_index_page(self):
+        """Verifica si la URL actual es la lista de repartidores"""
+        return RepartidorPage.is_index_url(await self.get_current_url())
+
+    async def is_repartidor_registered(self):
+        """Mensaje de éxito visible o redirección a la lista (ver RepartidorPage)"""
+        if await self.is_element_visible(RepartidorPage.ALERT_SUCCESS, timeout=self.settle_timeout("alert")):
+            return True
+        return RepartidorPage.registered_after_submit(await self.get_current_url())
+
+
+# ==================== EJECUCIÓN CONCURRENTE ====================
+
+async def map_in_contexts(browser, function, items, concurrency=10):
+    """
+    Ejecuta function(contexto, item) para cada item, cada uno en su propio
+    contexto aislado, con hasta `concurrency` pestañas a la vez.
+
+    Args:
+        browser: CdpBrowser conectado
+        function: Corrutina (BrowsingContext, item) -> resultado
+        items: Elementos a procesar (ej. casos CSV)
+        concurrency: Pestañas simultáneas
+
+    Returns:
+        list: Resultados en el orden de items; la excepción si uno falló
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item):
+        async with semaphore:
+            context = await browser.new_context()
+            try:
+                return await function(context, item)
+            finally:
+                await context.close()
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+# ==================== API SÍNCRONA ====================
+
+class SyncPage:
+    """
+    Envoltorio síncrono de un Page Object asíncrono: cada corrutina se ejecuta
+    en el EventLoopThread (utils.cdp_client) y el resto de los atributos se devuelve tal cual.
+
+    Ejemplo:
+        page = SyncPage(AsyncProductoPage(context), loop_thread)
+        page.fill_form(nombre="Pizza", precio="10")
+        page.submit_form()
+    """
+
+    def __init__(self, page, loop_thread):
+        self._page = page
+        self._loop_thread = loop_thread
+
+    def __getattr__(self, name):
+        attribute = getattr(self._page, name)
+        if not asyncio.iscoroutinefunction(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            return self._loop_thread.run(attribute(*args, **kwargs))
+        return call
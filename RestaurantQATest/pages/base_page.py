@@ -2,9 +2,241 @@
 Módulo base para todos los Page Objects.
 Contiene métodos comunes reutilizables para interactuar con elementos web.
 """
-from selenium.webdriver.support.ui import WebDriverWait
+import logging
+import uuid
+
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, JavascriptException,
+    StaleElementReferenceException, ElementNotInteractableException
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.page_metrics import navigation_listener, route_of
+from utils.wait_policy import policy_for
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== SCRIPTS DE DISPONIBILIDAD ====================
+
+# Marca el documento actual con un token y registra cómo termina el próximo submit:
+# 'blocked' si la validación del cliente lo canceló, 'sent' si el formulario se envió.
+MARK_PAGE_SCRIPT = """
+window.__qaPageToken = arguments[0];
+window.__qaSubmitState = null;
+if (!window.__qaListeners) {
+    window.__qaListeners = true;
+    document.addEventListener('submit', function (e) {
+        window.__qaSubmitState = 'pending';
+        setTimeout(function () {
+            window.__qaSubmitState = e.defaultPrevented ? 'blocked' : 'sent';
+        }, 0);
+    }, true);
+    document.addEventListener('invalid', function () {
+        window.__qaSubmitState = 'blocked';
+    }, true);
+}
+"""
+
+# Estado de la página respecto al token:
+# 'loaded'    -> documento nuevo, DOM listo y validación unobtrusive inicializada
+# 'validated' -> mismo documento, la validación del cliente bloqueó el envío
+# null        -> todavía cargando o esperando la navegación
+PAGE_STATE_SCRIPT = """
+var token = arguments[0];
+if (token && window.__qaPageToken === token) {
+    return window.__qaSubmitState === 'blocked' ? 'validated' : null;
+}
+if (document.readyState === 'loading') {
+    return null;
+}
+var $ = window.jQuery;
+if (!$ || !$.validator || !$.validator.unobtrusive) {
+    return document.readyState === 'complete' ? 'loaded' : null;
+}
+var parsed = $('form').toArray().every(function (form) {
+    return !form.querySelector('[data-val="true"]') || !!$(form).data('validator');
+});
+return parsed ? 'loaded' : null;
+"""
+
+# Indica si el documento actual llegó tras una redirección (POST-redirect-GET)
+REDIRECTED_SCRIPT = """
+var entry = performance.getEntriesByType('navigation')[0];
+return !!entry && entry.redirectCount > 0;
+"""
+
+# Recolecta en una sola llamada los mensajes de validación visibles de la página:
+# spans de jquery.validate.unobtrusive / Razor y mensajes HTML5 (validationMessage)
+VALIDATION_SNAPSHOT_SCRIPT = """
+var snapshot = {spans: {}, html5: {}};
+document.querySelectorAll('span[data-valmsg-for]').forEach(function (span) {
+    var text = (span.innerText || '').trim();
+    var visible = span.offsetParent !== null || span.getClientRects().length > 0;
+    if (text && visible) {
+        snapshot.spans[span.getAttribute('data-valmsg-for')] = text;
+    }
+});
+document.querySelectorAll('input, select, textarea').forEach(function (field) {
+    if (field.name && field.validationMessage) {
+        snapshot.html5[field.name] = field.validationMessage;
+    }
+});
+return snapshot;
+"""
+
+# Asigna valores a varios campos en una sola llamada y dispara 'input' y 'change'
+# para que jquery.validate.unobtrusive reaccione igual que con el teclado.
+# Recibe [[by, valor_localizador, texto], ...] y devuelve los localizadores no encontrados.
+FILL_FIELDS_SCRIPT = """
+function locate(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        default: return null;
+    }
+}
+var missing = [];
+arguments[0].forEach(function (entry) {
+    var field = locate(entry[0], entry[1]);
+    if (!field) {
+        missing.push(entry[0] + '=' + entry[1]);
+        return;
+    }
+    var text = entry[2];
+    if (field.tagName === 'SELECT') {
+        var option = Array.prototype.find.call(field.options, function (o) {
+            return o.value === text || o.text.trim() === text;
+        });
+        field.value = option ? option.value : '';
+    } else {
+        var proto = field.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(field, text);
+    }
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
+
+
+# ==================== SCRIPTS DE LECTURA ====================
+
+# Devuelve en una sola llamada el texto de todas las celdas de una tabla y el número
+# de páginas de la paginación Bootstrap: {rows: [[celda, ...], ...], pages: n}
+TABLE_DATA_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+var rows = [];
+if (table) {
+    table.querySelectorAll('tbody tr').forEach(function (tr) {
+        rows.push(Array.prototype.map.call(tr.cells, function (cell) {
+            return (cell.innerText || cell.textContent || '').trim();
+        }));
+    });
+}
+return {rows: rows, pages: document.querySelectorAll('ul.pagination li.page-item').length};
+"""
+
+# Navigation Timing y Resource Timing del documento actual, una sola vez por
+# documento (null si ya se leyó). La página está lista en DOMContentLoaded, antes
+# del evento load: la promesa espera en el navegador a que termine load (o a
+# arguments[0] ms) para que load y los recursos tardíos entren en la entrada, y
+# solo entonces marca el documento como leído. Tiempos en ms desde el inicio de
+# la navegación; server = espera entre el envío de la petición y el primer byte
+NAVIGATION_TIMING_SCRIPT = """
+var limit = Date.now() + arguments[0];
+return new Promise(function (resolve) {
+    (function check() {
+        var nav = performance.getEntriesByType('navigation')[0];
+        if (!nav || window.__qaTimingCaptured) {
+            resolve(null);
+            return;
+        }
+        if (nav.loadEventEnd === 0 && Date.now() < limit) {
+            setTimeout(check, 25);
+            return;
+        }
+        window.__qaTimingCaptured = true;
+        resolve({
+            url: location.href,
+            ttfb: nav.responseStart - nav.startTime,
+            server: nav.responseStart - nav.requestStart,
+            dom_content_loaded: nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null,
+            load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+            transfer_size: nav.transferSize,
+            body_size: nav.encodedBodySize,
+            server_timing: (nav.serverTiming || []).map(function (t) {
+                return {name: t.name, duration: t.duration};
+            }),
+            resources: performance.getEntriesByType('resource').map(function (r) {
+                return {name: r.name, type: r.initiatorType, duration: r.duration,
+                        transfer_size: r.transferSize, body_size: r.encodedBodySize};
+            })
+        });
+    })();
+});
+"""
+
+
+def _visible(mark):
+    """Condición de visibilidad para un localizador o un WebElement ya resuelto."""
+    if isinstance(mark, WebElement):
+        return EC.visibility_of(mark)
+    return EC.visibility_of_element_located(mark)
+
+
+class ElementCache:
+    """
+    WebElements ya resueltos del documento actual, por localizador. Evita repetir
+    findElement en interacciones de varios pasos sobre el mismo campo. Se vacía
+    al navegar o cuando una referencia resulta obsoleta o no interactuable.
+    """
+
+    def __init__(self):
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, locator, resolve, recheck=None):
+        """
+        Devuelve el elemento cacheado o lo resuelve y lo guarda.
+
+        Args:
+            locator: Tupla (By, valor)
+            resolve: Función sin argumentos que busca el elemento en la página
+            recheck: Función (elemento) -> elemento que vuelve a comprobar la
+                     condición de resolve sobre un elemento cacheado
+
+        Returns:
+            WebElement
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            self.hits += 1
+            return element if recheck is None else recheck(element)
+        self.misses += 1
+        element = self._elements[locator] = resolve()
+        return element
+
+    def clear(self):
+        """Descarta todas las referencias (el documento cambió)."""
+        if self._elements:
+            self.invalidations += 1
+        self._elements.clear()
+
+    def stats(self):
+        """
+        Returns:
+            dict: {'hits', 'misses', 'invalidations', 'size'}
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "invalidations": self.invalidations, "size": len(self._elements)}
 
 
 class BasePage:
@@ -21,11 +253,21 @@ class BasePage:
             driver: Instancia de WebDriver de Selenium
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        # Timeouts y primitivas de espera, compartidos por los Page Objects del driver
+        self.waits = policy_for(driver)
+        # True mientras el documento actual está confirmado listo (navigate_to, submit_and_wait)
+        self.page_ready = False
+        # True para llenar formularios tecla a tecla (send_keys) en lugar de por JS
+        self.keystrokes = False
+        # Último resultado de get_validation_snapshot() (lo usan los reportes)
+        self.last_validation = None
+        # Elementos ya resueltos del documento actual (aciertos/fallos en elements.stats())
+        self.elements = ElementCache()
 
     def find_element(self, locator):
         """
-        Encuentra un elemento en la página.
+        Encuentra un elemento en la página (reutiliza la referencia si ya se
+        resolvió en el documento actual).
         
         Args:
             locator: Tupla (By, valor) para localizar el elemento
@@ -33,19 +275,47 @@ class BasePage:
         Returns:
             WebElement encontrado
         """
-        return self.driver.find_element(*locator)
+        return self.elements.get(locator, lambda: self.waits.find(locator))
+
+    def _with_element(self, locator, action, ready=None):
+        """
+        Ejecuta action(elemento) con el elemento cacheado. La condición ready se
+        espera también sobre el elemento cacheado (un campo puede ocultarse o
+        deshabilitarse sin cambiar de documento). Si la referencia quedó
+        obsoleta (el documento cambió sin pasar por navigate_to) o el elemento no
+        admite la interacción, vacía la caché y lo vuelve a resolver una vez.
+        
+        Args:
+            locator: Tupla (By, valor) del elemento
+            action: Función que recibe el WebElement
+            ready: Condición esperada que acepta el localizador o el elemento
+                   (ej. EC.element_to_be_clickable); None solo lo busca
+            
+        Returns:
+            Valor devuelto por action
+        """
+        if ready is None:
+            resolve, recheck = (lambda: self.waits.find(locator)), None
+        else:
+            resolve = lambda: self.waits.until(ready(locator))
+            recheck = lambda element: self.waits.until(ready(element))
+        try:
+            return action(self.elements.get(locator, resolve, recheck))
+        except (StaleElementReferenceException, ElementNotInteractableException):
+            self.elements.clear()
+            return action(self.elements.get(locator, resolve, recheck))
 
     def find_elements(self, locator):
         """
-        Encuentra múltiples elementos en la página.
+        Encuentra múltiples elementos en la página, sin esperar.
         
         Args:
             locator: Tupla (By, valor) para localizar los elementos
             
         Returns:
-            Lista de WebElements encontrados
+            Lista de WebElements encontrados (vacía si no hay ninguno)
         """
-        return self.driver.find_elements(*locator)
+        return self.waits.find_all(locator)
 
     def click(self, locator):
         """
@@ -54,8 +324,8 @@ class BasePage:
         Args:
             locator: Tupla (By, valor) del elemento
         """
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        self.page_ready = False  # el clic puede navegar o cambiar la página
+        self._with_element(locator, lambda element: element.click(), EC.element_to_be_clickable)
 
     def enter_text(self, locator, text):
         """
@@ -65,10 +335,60 @@ class BasePage:
             locator: Tupla (By, valor) del campo
             text: Texto a ingresar
         """
-        element = self.wait.until(EC.visibility_of_element_located(locator))
-        element.clear()
-        if text:
-            element.send_keys(str(text))
+        def type_text(element):
+            element.clear()
+            if text:
+                element.send_keys(str(text))
+
+        self._with_element(locator, type_text, _visible)
+
+    def fill_fields(self, values, keystrokes=None):
+        """
+        Llena varios campos de un formulario.
+        
+        Por defecto asigna todos los valores con una sola llamada JS y dispara los
+        eventos 'input' y 'change'. Con keystrokes=True usa send_keys campo por campo,
+        para los casos que necesitan fidelidad de teclado.
+        
+        Args:
+            values: Diccionario {locator: valor}; None o "" deja el campo vacío.
+                    En un <select> el valor puede ser el value o el texto visible.
+            keystrokes: Fuerza el modo (None usa self.keystrokes)
+            
+        Raises:
+            NoSuchElementException: Si algún campo no existe en la página
+        """
+        if keystrokes is None:
+            keystrokes = self.keystrokes
+        
+        if keystrokes:
+            for locator, value in values.items():
+                self._type_field(locator, value)
+            return
+        
+        entries = [
+            [by, selector, "" if value is None else str(value)]
+            for (by, selector), value in values.items()
+        ]
+        missing = self.driver.execute_script(FILL_FIELDS_SCRIPT, entries)
+        if missing:
+            raise NoSuchElementException(f"Campos no encontrados: {', '.join(missing)}")
+
+    def _type_field(self, locator, value):
+        """Llena un campo con el teclado (o Select para listas desplegables)."""
+        def type_value(element):
+            if element.tag_name.lower() == "select":
+                select = Select(element)
+                try:
+                    select.select_by_visible_text(str(value))
+                except NoSuchElementException:
+                    select.select_by_value("" if value is None else str(value))
+            else:
+                element.clear()
+                if value:
+                    element.send_keys(str(value))
+
+        self._with_element(locator, type_value, _visible)
 
     def get_text(self, locator):
         """
@@ -80,30 +400,43 @@ class BasePage:
         Returns:
             str: Texto del elemento
         """
-        element = self.wait.until(EC.visibility_of_element_located(locator))
-        return element.text
+        return self._with_element(locator, lambda element: element.text, _visible)
+
+    def get_attribute(self, locator, name):
+        """
+        Obtiene un atributo o propiedad de un elemento (ej. 'value').
+        
+        Args:
+            locator: Tupla (By, valor) del elemento
+            name: Nombre del atributo
+            
+        Returns:
+            str: Valor del atributo, o None si no existe
+        """
+        return self._with_element(locator, lambda element: element.get_attribute(name))
 
-    def is_element_visible(self, locator, timeout=5):
+    def is_element_visible(self, locator, timeout=None):
         """
         Verifica si un elemento es visible en la página.
         
         Args:
             locator: Tupla (By, valor) del elemento
-            timeout: Tiempo máximo de espera en segundos
+            timeout: Tiempo máximo de espera en segundos (None usa el de la
+                     política, 0 comprueba una sola vez)
             
         Returns:
             bool: True si el elemento es visible, False en caso contrario
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.visibility_of_element_located(locator))
+            self.waits.until(EC.visibility_of_element_located(locator),
+                             "visible" if timeout is None else timeout, probe=True)
             return True
         except TimeoutException:
             return False
 
     def is_element_present(self, locator):
         """
-        Verifica si un elemento está presente en el DOM.
+        Verifica, sin esperar, si un elemento está presente en el DOM.
         
         Args:
             locator: Tupla (By, valor) del elemento
@@ -111,25 +444,63 @@ class BasePage:
         Returns:
             bool: True si el elemento está presente, False en caso contrario
         """
-        try:
-            self.find_element(locator)
-            return True
-        except NoSuchElementException:
-            return False
+        # Sin caché: el elemento pudo desaparecer del documento actual
+        return not self.waits.is_absent(locator)
 
-    def wait_for_element(self, locator, timeout=10):
+    def present_within(self, locator, timeout):
+        """
+        Espera a que un elemento aparezca en el DOM, como máximo timeout segundos.
+        
+        Args:
+            locator: Tupla (By, valor) del elemento
+            timeout: Segundos o tipo de espera de la política (ej. 'alert')
+            
+        Returns:
+            WebElement, o None si no apareció
+        """
+        return self.waits.present_within(locator, timeout)
+
+    def assert_absent(self, locator, message=None):
+        """
+        Verifica de inmediato que un elemento no está en el DOM.
+        
+        Args:
+            locator: Tupla (By, valor) del elemento
+            message: Mensaje del AssertionError
+            
+        Raises:
+            AssertionError: Si el elemento está presente
+        """
+        if not self.waits.is_absent(locator):
+            raise AssertionError(message or f"Elemento presente: {locator}")
+
+    def settle_timeout(self, name):
+        """
+        Espera para contenido que renderiza el servidor (alertas, tablas): 0 si
+        el documento actual ya se confirmó listo, porque lo que no está ya no va
+        a aparecer; si no, el timeout de la política.
+        
+        Args:
+            name: Tipo de espera de la política (ej. 'alert')
+            
+        Returns:
+            float: Segundos
+        """
+        return 0 if self.page_ready else self.waits.timeout(name)
+
+    def wait_for_element(self, locator, timeout=None):
         """
         Espera hasta que un elemento esté presente.
         
         Args:
             locator: Tupla (By, valor) del elemento
-            timeout: Tiempo máximo de espera en segundos
+            timeout: Tiempo máximo de espera en segundos (None usa 'element')
             
         Returns:
             WebElement cuando esté presente
         """
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        return self.waits.until(EC.presence_of_element_located(locator),
+                                "element" if timeout is None else timeout)
 
     def get_current_url(self):
         """
@@ -142,12 +513,115 @@ class BasePage:
 
     def navigate_to(self, url):
         """
-        Navega a una URL específica.
+        Navega a una URL específica y espera a que la página esté lista.
         
         Args:
             url: URL de destino
         """
+        self.elements.clear()
+        self.page_ready = False
+        self.waits.route = route_of(url)
         self.driver.get(url)
+        self.wait_for_page_ready()
+        self.capture_navigation()
+
+    # ==================== DISPONIBILIDAD DE PÁGINA ====================
+
+    def mark_page(self):
+        """
+        Marca el documento actual para detectar cuándo se reemplaza.
+        
+        Returns:
+            str: Token asignado al documento
+        """
+        token = uuid.uuid4().hex
+        self.page_ready = False
+        self.driver.execute_script(MARK_PAGE_SCRIPT, token)
+        return token
+
+    def wait_for_page_ready(self, token=None, timeout=None):
+        """
+        Espera a que la página esté lista sin pausas fijas.
+        
+        Sin token espera DOM listo y validación unobtrusive inicializada.
+        Con token espera además a que la navegación se confirme (el documento
+        marcado fue reemplazado) o a que la validación del cliente cancele el envío.
+        
+        Args:
+            token: Token devuelto por mark_page() antes de la acción
+            timeout: Tiempo máximo de espera en segundos (None usa el timeout
+                     aprendido de 'page', o de 'submit' si hay token)
+            
+        Returns:
+            str: 'loaded' si hay un documento nuevo listo, 'validated' si el envío
+                 fue bloqueado por la validación del cliente
+        """
+        state = self.waits.until(
+            lambda d: d.execute_script(PAGE_STATE_SCRIPT, token),
+            ("submit" if token else "page") if timeout is None else timeout,
+            ignored_exceptions=(JavascriptException,)
+        )
+        self.page_ready = True
+        return state
+
+    def submit_and_wait(self, locator, timeout=None):
+        """
+        Hace clic en un botón de envío y espera el resultado del submit.
+        
+        Args:
+            locator: Tupla (By, valor) del botón
+            timeout: Tiempo máximo de espera en segundos (None usa 'submit')
+            
+        Returns:
+            str: Estado final ('loaded', 'validated') o None si se agotó el tiempo
+        """
+        token = self.mark_page()
+        self.click(locator)
+        try:
+            state = self.wait_for_page_ready(token, timeout)
+        except TimeoutException:
+            logger.warning("Timeout esperando respuesta del formulario: %s", self.driver.current_url)
+            return None
+        if state == "loaded":
+            self.elements.clear()
+            self.capture_navigation()
+        return state
+
+    def was_redirected(self):
+        """
+        Verifica si el documento actual llegó por una redirección, como tras un
+        POST aceptado (RedirectToPage). Un modelo inválido devuelve Page() en la
+        misma URL, sin redirección.
+        
+        Returns:
+            bool: True si la navegación al documento actual fue redirigida
+        """
+        try:
+            return bool(self.driver.execute_script(REDIRECTED_SCRIPT))
+        except JavascriptException:
+            return False
+
+    def capture_navigation(self):
+        """
+        Entrega las métricas de carga del documento actual al registro de
+        métricas activo para este driver (ver utils/page_metrics.py), una vez
+        terminado su evento load (como mucho el techo de 'page').
+        Sin registro activo no ejecuta ningún comando.
+        
+        Returns:
+            dict: Métricas de la navegación, o None si no se registraron
+        """
+        listener = navigation_listener(self.driver)
+        if listener is None:
+            return None
+        limit_ms = int(self.waits.service.ceiling("page") * 1000)
+        try:
+            entry = self.driver.execute_script(NAVIGATION_TIMING_SCRIPT, limit_ms)
+        except (JavascriptException, TimeoutException):
+            return None
+        if entry:
+            listener(entry)
+        return entry
 
     def get_page_title(self):
         """
@@ -165,8 +639,64 @@ class BasePage:
         Args:
             locator: Tupla (By, valor) del elemento
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._with_element(locator, lambda element: self.driver.execute_script(
+            "arguments[0].scrollIntoView(true);", element))
+
+    def get_validation_snapshot(self):
+        """
+        Obtiene todos los mensajes de validación de la página en un solo round-trip.
+        
+        Returns:
+            dict: {'spans': {campo: mensaje}, 'html5': {campo: mensaje}}, donde campo
+                  es el nombre del input (ej. 'Producto.Nombre'); solo incluye
+                  mensajes no vacíos y spans visibles
+        """
+        self.last_validation = self.driver.execute_script(VALIDATION_SNAPSHOT_SCRIPT)
+        return self.last_validation
+
+    def has_validation_errors(self):
+        """
+        Verifica si hay errores de validación en el formulario.
+        
+        Returns:
+            bool: True si hay algún mensaje de validación, False en caso contrario
+        """
+        snapshot = self.get_validation_snapshot()
+        return bool(snapshot["spans"] or snapshot["html5"])
+
+    def get_field_errors(self, fields, snapshot=None):
+        """
+        Traduce un snapshot de validación a un diccionario por campo.
+        Si un campo tiene mensaje del servidor/unobtrusive y HTML5, se prioriza el primero.
+        
+        Args:
+            fields: Diccionario {clave: nombre del input} (ej. {'nombre': 'Producto.Nombre'})
+            snapshot: Snapshot previo; si es None se obtiene uno nuevo
+            
+        Returns:
+            dict: Diccionario con las claves como campos y los mensajes de error como valores
+        """
+        if snapshot is None:
+            snapshot = self.get_validation_snapshot()
+        errors = {}
+        for key, name in fields.items():
+            message = snapshot["spans"].get(name) or snapshot["html5"].get(name)
+            if message:
+                errors[key] = message
+        return errors
+
+    def get_table_data(self, table_selector="table.table"):
+        """
+        Obtiene el contenido completo de una tabla en un solo round-trip.
+        
+        Args:
+            table_selector: Selector CSS de la tabla
+            
+        Returns:
+            dict: {'rows': lista de filas (listas de textos de celda),
+                   'pages': número de páginas de la paginación, 0 si no hay}
+        """
+        return self.driver.execute_script(TABLE_DATA_SCRIPT, table_selector)
 
     def get_validation_message(self, locator):
         """
@@ -178,6 +708,9 @@ class BasePage:
         Returns:
             str: Mensaje de validación o cadena vacía
         """
+        # Un campo válido no tiene mensaje visible: no se espera a que aparezca
+        if not self.is_element_visible(locator, timeout=self.settle_timeout("visible")):
+            return ""
         try:
             return self.get_text(locator)
         except:
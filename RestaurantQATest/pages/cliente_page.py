@@ -2,12 +2,11 @@
 Page Object para el módulo de Clientes
 Maneja las interacciones con el formulario de registro de clientes
 """
+from urllib.parse import urlencode
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
-import time
 
 
 class ClientePage(BasePage):
@@ -31,6 +30,14 @@ class ClientePage(BasePage):
     TELEFONO_VALIDATION = (By.CSS_SELECTOR, "span[data-valmsg-for='Cliente.Telefono']")
     CORREO_VALIDATION = (By.CSS_SELECTOR, "span[data-valmsg-for='Cliente.Correo']")
     
+    # Campos validados: etiqueta -> nombre del input
+    VALIDATION_FIELDS = {
+        'Nombre': 'Cliente.Nombre',
+        'Apellido': 'Cliente.Apellido',
+        'Teléfono': 'Cliente.Telefono',
+        'Correo': 'Cliente.Correo'
+    }
+    
     # Tabla de clientes (lista)
     CLIENTES_TABLE = (By.CSS_SELECTOR, "table.table")
     CLIENTE_ROW = (By.CSS_SELECTOR, "table.table tbody tr")
@@ -55,14 +62,38 @@ class ClientePage(BasePage):
     def navigate(self):
         """Navega a la página de creación de clientes"""
         url = f"{self.base_url}/Clientes/Create"
-        self.driver.get(url)
-        time.sleep(0.5)  # Pequeña espera para carga de la página
+        self.navigate_to(url)
+
+    def navigate_to_index(self, search_term=None, page=1):
+        """
+        Navega a la página de lista de clientes
+        
+        Args:
+            search_term: Texto de búsqueda (parámetro searchTerm), opcional
+            page: Número de página de resultados
+        """
+        self.navigate_to(self.index_url(self.base_url, search_term, page))
 
-    def navigate_to_index(self):
-        """Navega a la página de lista de clientes"""
-        url = f"{self.base_url}/Clientes/Index"
-        self.driver.get(url)
-        time.sleep(0.5)
+    @staticmethod
+    def index_url(base_url, search_term=None, page=1):
+        """
+        Construye la URL de la lista de clientes con búsqueda y paginación
+        
+        Args:
+            base_url: URL base de la aplicación
+            search_term: Texto de búsqueda, opcional
+            page: Número de página de resultados
+            
+        Returns:
+            str: URL de /Clientes/Index con sus parámetros
+        """
+        params = {}
+        if search_term:
+            params["searchTerm"] = search_term
+        if page > 1:
+            params["page"] = page
+        query = f"?{urlencode(params)}" if params else ""
+        return f"{base_url}/Clientes/Index{query}"
 
     # ========== MÉTODOS DE INTERACCIÓN CON EL FORMULARIO ==========
 
@@ -116,15 +147,16 @@ class ClientePage(BasePage):
             telefono: Teléfono del cliente (opcional)
             correo: Correo electrónico del cliente
         """
-        self.fill_nombre(nombre)
-        self.fill_apellido(apellido)
-        self.fill_telefono(telefono)
-        self.fill_correo(correo)
+        self.fill_fields({
+            self.NOMBRE_INPUT: nombre,
+            self.APELLIDO_INPUT: apellido,
+            self.TELEFONO_INPUT: telefono,
+            self.CORREO_INPUT: correo
+        })
 
     def submit_form(self):
-        """Envía el formulario haciendo clic en el botón Guardar"""
-        self.click(self.SUBMIT_BUTTON)
-        time.sleep(1)  # Esperar a que se procese el formulario
+        """Envía el formulario y espera la redirección o la validación del cliente"""
+        return self.submit_and_wait(self.SUBMIT_BUTTON)
 
     def click_volver(self):
         """Hace clic en el botón Volver"""
@@ -132,37 +164,6 @@ class ClientePage(BasePage):
 
     # ========== MÉTODOS DE VALIDACIÓN ==========
 
-    def has_validation_errors(self):
-        """
-        Verifica si hay errores de validación en el formulario
-        
-        Returns:
-            bool: True si hay errores de validación, False en caso contrario
-        """
-        try:
-            # Buscar cualquier span con clase text-danger que tenga contenido
-            error_spans = self.driver.find_elements(By.CSS_SELECTOR, "span.text-danger")
-            
-            for span in error_spans:
-                if span.text.strip():  # Si el span tiene texto
-                    return True
-            
-            # También verificar mensajes HTML5 de validación
-            campos = [self.NOMBRE_INPUT, self.APELLIDO_INPUT, self.TELEFONO_INPUT, self.CORREO_INPUT]
-            for campo_locator in campos:
-                try:
-                    campo = self.find_element(campo_locator)
-                    validation_message = campo.get_attribute("validationMessage")
-                    if validation_message:
-                        return True
-                except:
-                    continue
-            
-            return False
-        except Exception as e:
-            print(f"Error al verificar validaciones: {str(e)}")
-            return False
-
     def get_validation_errors(self):
         """
         Obtiene la lista de mensajes de error de validación
@@ -170,31 +171,16 @@ class ClientePage(BasePage):
         Returns:
             list: Lista de mensajes de error
         """
-        errors = []
+        snapshot = self.get_validation_snapshot()
         
         # Errores de validación de spans
-        error_spans = self.driver.find_elements(By.CSS_SELECTOR, "span.text-danger")
-        for span in error_spans:
-            text = span.text.strip()
-            if text:
-                errors.append(text)
+        errors = list(snapshot["spans"].values())
         
         # Errores HTML5 de validación
-        campos = [
-            (self.NOMBRE_INPUT, "Nombre"),
-            (self.APELLIDO_INPUT, "Apellido"),
-            (self.TELEFONO_INPUT, "Teléfono"),
-            (self.CORREO_INPUT, "Correo")
-        ]
-        
-        for campo_locator, nombre_campo in campos:
-            try:
-                campo = self.find_element(campo_locator)
-                validation_message = campo.get_attribute("validationMessage")
-                if validation_message:
-                    errors.append(f"{nombre_campo}: {validation_message}")
-            except:
-                continue
+        for nombre_campo, name in self.VALIDATION_FIELDS.items():
+            validation_message = snapshot["html5"].get(name)
+            if validation_message:
+                errors.append(f"{nombre_campo}: {validation_message}")
         
         return errors
 
@@ -218,7 +204,9 @@ class ClientePage(BasePage):
 
     def is_cliente_registered(self, nombre, apellido):
         """
-        Verifica si el cliente fue registrado exitosamente
+        Verifica si el cliente fue registrado exitosamente.
+        Filtra la lista con searchTerm y lee cada página de la tabla en una sola
+        llamada, recorriendo la paginación solo si la búsqueda devuelve más de 10 filas.
         
         Args:
             nombre: Nombre del cliente a buscar
@@ -228,30 +216,53 @@ class ClientePage(BasePage):
             bool: True si el cliente está en la lista, False en caso contrario
         """
         try:
-            # Navegar a la página de índice
-            self.navigate_to_index()
-            time.sleep(1)
-            
-            # Buscar en la tabla de clientes
-            rows = self.driver.find_elements(*self.CLIENTE_ROW)
-            
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 2:
-                    row_nombre = cells[0].text.strip()
-                    row_apellido = cells[1].text.strip()
-                    
-                    # Comparación case-insensitive
-                    if (row_nombre.lower() == nombre.lower() and 
-                        row_apellido.lower() == apellido.lower()):
-                        return True
-            
-            return False
+            search = self.registration_search(self.base_url, nombre, apellido)
+            while search.next_url:
+                self.navigate_to(search.next_url)
+                data = self.get_table_data(self.CLIENTES_TABLE[1])
+                search.read(data["rows"], data["pages"])
+            return search.found
             
         except Exception as e:
             print(f"Error al verificar registro de cliente: {str(e)}")
             return False
 
+    @staticmethod
+    def registration_search(base_url, nombre, apellido):
+        """
+        Recorrido de la lista filtrada que verifica el registro de un cliente.
+        No navega: lo usan igual este Page Object, los asíncronos, los HTTP y
+        los flujos por pestaña (ver ClienteSearch).
+        
+        Args:
+            base_url: URL base de la aplicación
+            nombre: Nombre del cliente a buscar
+            apellido: Apellido del cliente a buscar
+            
+        Returns:
+            ClienteSearch: Recorrido sin iniciar
+        """
+        return ClienteSearch(base_url, nombre, apellido)
+
+    @staticmethod
+    def contains_cliente(rows, nombre, apellido):
+        """
+        Busca un cliente en las filas de la tabla (comparación case-insensitive)
+        
+        Args:
+            rows: Filas de la tabla como listas de textos [nombre, apellido, ...]
+            nombre: Nombre del cliente
+            apellido: Apellido del cliente
+            
+        Returns:
+            bool: True si alguna fila coincide
+        """
+        nombre, apellido = nombre.strip().lower(), apellido.strip().lower()
+        return any(
+            len(row) >= 2 and row[0].lower() == nombre and row[1].lower() == apellido
+            for row in rows
+        )
+
     def is_on_create_page(self):
         """
         Verifica si se está en la página de creación de clientes
@@ -283,7 +294,7 @@ class ClientePage(BasePage):
         Returns:
             bool: True si hay mensaje de éxito
         """
-        return self.is_element_visible(self.SUCCESS_MESSAGE)
+        return self.is_element_visible(self.SUCCESS_MESSAGE, timeout=self.settle_timeout("visible"))
 
     def has_error_message(self):
         """
@@ -292,19 +303,18 @@ class ClientePage(BasePage):
         Returns:
             bool: True si hay mensaje de error
         """
-        return self.is_element_visible(self.ERROR_MESSAGE)
+        return self.is_element_visible(self.ERROR_MESSAGE, timeout=self.settle_timeout("visible"))
 
     # ========== MÉTODOS AUXILIARES ==========
 
     def clear_form(self):
         """Limpia todos los campos del formulario"""
-        campos = [self.NOMBRE_INPUT, self.APELLIDO_INPUT, self.TELEFONO_INPUT, self.CORREO_INPUT]
-        for campo in campos:
-            try:
-                element = self.find_element(campo)
-                element.clear()
-            except:
-                continue
+        self.fill_fields({
+            self.NOMBRE_INPUT: "",
+            self.APELLIDO_INPUT: "",
+            self.TELEFONO_INPUT: "",
+            self.CORREO_INPUT: ""
+        })
 
     def get_form_data(self):
         """
@@ -314,10 +324,10 @@ class ClientePage(BasePage):
             dict: Diccionario con los valores de cada campo
         """
         return {
-            'nombre': self.find_element(self.NOMBRE_INPUT).get_attribute('value'),
-            'apellido': self.find_element(self.APELLIDO_INPUT).get_attribute('value'),
-            'telefono': self.find_element(self.TELEFONO_INPUT).get_attribute('value'),
-            'correo': self.find_element(self.CORREO_INPUT).get_attribute('value')
+            'nombre': self.get_attribute(self.NOMBRE_INPUT, 'value'),
+            'apellido': self.get_attribute(self.APELLIDO_INPUT, 'value'),
+            'telefono': self.get_attribute(self.TELEFONO_INPUT, 'value'),
+            'correo': self.get_attribute(self.CORREO_INPUT, 'value')
         }
 
     def is_form_empty(self):
@@ -330,16 +340,54 @@ class ClientePage(BasePage):
         data = self.get_form_data()
         return all(not value for value in data.values())
 
-    def wait_for_page_load(self, timeout=10):
+    def wait_for_page_load(self, timeout=None):
         """
         Espera a que la página esté completamente cargada
         
         Args:
-            timeout: Tiempo máximo de espera en segundos
+            timeout: Tiempo máximo de espera en segundos (None usa el de la política)
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-        except Exception as e:
+            self.wait_for_page_ready(timeout=timeout)
+        except TimeoutException as e:
             print(f"Timeout esperando carga de página: {str(e)}")
+
+
+class ClienteSearch:
+    """
+    Búsqueda de un cliente en /Clientes/Index filtrada por nombre, página por
+    página. Indica la próxima URL a abrir y recibe las filas leídas: quien la
+    usa decide cómo navegar y leer la tabla.
+    """
+
+    def __init__(self, base_url, nombre, apellido):
+        self.base_url = base_url
+        self.nombre = nombre
+        self.apellido = apellido
+        self.page = 1
+        self.pages = 1
+        self.found = False
+
+    @property
+    def next_url(self):
+        """
+        URL de la próxima página a leer.
+        
+        Returns:
+            str: URL, o None si el cliente apareció o no quedan páginas
+        """
+        if self.found or self.page > self.pages:
+            return None
+        return ClientePage.index_url(self.base_url, self.nombre, self.page)
+
+    def read(self, rows, pages):
+        """
+        Registra la página leída.
+        
+        Args:
+            rows: Filas de la tabla como listas de textos
+            pages: Cantidad de páginas de la búsqueda según la paginación
+        """
+        self.found = ClientePage.contains_cliente(rows, self.nombre, self.apellido)
+        self.pages = pages
+        self.page += 1
@@ -0,0 +1,479 @@
+"""
+Page Objects HTTP para ejecutar los casos CSV sin navegador.
+Exponen la misma interfaz que los Page Objects de Selenium (fill_form, submit_form,
+has_validation_errors, is_*_registered) pero trabajan con peticiones HTTP:
+GET de la página Razor, extracción del token antiforgery, POST del formulario
+y análisis de los mensajes de validación o de la redirección.
+"""
+from html.parser import HTMLParser
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.cliente_page import ClientePage
+from pages.producto_page import ProductoPage
+from pages.repartidor_page import RepartidorPage
+
+
+ANTIFORGERY_FIELD = "__RequestVerificationToken"
+
+# Clave del mensaje de validación que representa un envío rechazado con un
+# estado de error (la misma que usa ASP.NET para los errores del modelo completo)
+STATUS_ERROR_FIELD = ""
+
+
+def create_session(pool_size=10):
+    """
+    Crea una sesión HTTP con conexiones keep-alive reutilizables.
+
+    Args:
+        pool_size: Conexiones máximas mantenidas por host
+
+    Returns:
+        requests.Session: Sesión configurada
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def field_name(locator, parsed):
+    """
+    Traduce un locator de Selenium al nombre del campo enviado en el POST.
+
+    Args:
+        locator: Tupla (By.NAME o By.ID, valor)
+        parsed: RazorPageParser de la página con el formulario
+
+    Returns:
+        str: Nombre del campo (ej. 'Cliente.Nombre')
+    """
+    by, value = locator
+    if by == By.ID:
+        return parsed.field_ids.get(value, value.replace("_", "."))
+    return value
+
+
+class RazorPageParser(HTMLParser):
+    """
+    Extrae de una página Razor el primer formulario POST, los mensajes de validación
+    (span[data-valmsg-for]), las filas de la tabla y el número de páginas.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.form_action = None
+        self.form_fields = {}
+        self.field_ids = {}
+        self.spans = {}
+        self.rows = []
+        self.page_count = 0
+        self._form_depth = 0
+        self._form_done = False
+        self._select = None
+        self._span = None
+        self._span_depth = 0
+        self._span_text = []
+        self._in_tbody = False
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form":
+            self._start_form(attrs)
+        elif tag in ("input", "select", "textarea") and self._form_depth:
+            self._register_field(tag, attrs)
+        elif tag == "option" and self._select is not None:
+            if "selected" in attrs or self._select not in self.form_fields:
+                self.form_fields[self._select] = attrs.get("value", "")
+        elif tag == "span":
+            if self._span is not None:
+                self._span_depth += 1
+            elif "data-valmsg-for" in attrs:
+                self._span = attrs["data-valmsg-for"]
+                self._span_depth = 1
+                self._span_text = []
+        elif tag == "tbody":
+            self._in_tbody = True
+        elif tag == "tr" and self._in_tbody:
+            self._row = []
+        elif tag == "td" and self._row is not None:
+            self._cell = []
+        elif tag == "li" and "page-item" in attrs.get("class", "").split():
+            self.page_count += 1
+
+    def handle_endtag(self, tag):
+        if tag == "form" and self._form_depth:
+            self._form_depth -= 1
+            if not self._form_depth:
+                self._form_done = True
+        elif tag == "select":
+            self._select = None
+        elif tag == "span" and self._span is not None:
+            self._span_depth -= 1
+            if not self._span_depth:
+                text = " ".join("".join(self._span_text).split())
+                if text:
+                    self.spans[self._span] = text
+                self._span = None
+        elif tag == "tbody":
+            self._in_tbody = False
+        elif tag == "tr" and self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+        elif tag == "td" and self._cell is not None:
+            self._row.append(" ".join("".join(self._cell).split()))
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._span is not None:
+            self._span_text.append(data)
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _start_form(self, attrs):
+        if self._form_depth:
+            self._form_depth += 1
+        elif not self._form_done and attrs.get("method", "get").lower() == "post":
+            self._form_depth = 1
+            self.form_action = attrs.get("action")
+
+    def _register_field(self, tag, attrs):
+        name = attrs.get("name")
+        if not name:
+            return
+        if "id" in attrs:
+            self.field_ids[attrs["id"]] = name
+        if tag == "select":
+            self._select = name
+        elif attrs.get("type") not in ("submit", "button"):
+            self.form_fields[name] = attrs.get("value", "")
+
+
+class HttpBasePage:
+    """
+    Clase base de los Page Objects HTTP.
+    Mantiene la última respuesta y los valores del formulario a enviar.
+    """
+
+    # Se reutilizan tal cual: solo dependen de get_validation_snapshot()
+    has_validation_errors = BasePage.has_validation_errors
+    get_field_errors = BasePage.get_field_errors
+
+    def __init__(self, session, timeout=10):
+        """
+        Inicializa la página HTTP.
+
+        Args:
+            session: requests.Session compartida (keep-alive)
+            timeout: Tiempo máximo por petición en segundos
+        """
+        self.session = session
+        self.timeout = timeout
+        self.response = None
+        self.parsed = RazorPageParser()
+        self.form = {}
+        # Estado HTTP de error con que el servidor rechazó el último envío, o None
+        self.rejected_status = None
+        # Último resultado de get_validation_snapshot() (lo usan los reportes)
+        self.last_validation = None
+
+    def navigate_to(self, url, params=None):
+        """
+        Descarga una página y prepara su formulario.
+
+        Args:
+            url: URL de destino
+            params: Parámetros de query string (opcional)
+        """
+        self._load(self.session.get(url, params=params, timeout=self.timeout))
+
+    def fill_fields(self, values, keystrokes=None):
+        """
+        Asigna valores a los campos del formulario.
+
+        Args:
+            values: Diccionario {locator: valor} con locators By.NAME o By.ID;
+                    None deja el campo vacío
+            keystrokes: Ignorado; existe por compatibilidad con BasePage
+        """
+        for locator, value in values.items():
+            self.form[self._field_name(locator)] = "" if value is None else str(value)
+
+    def submit(self):
+        """
+        Envía el formulario POST (con el token antiforgery) siguiendo redirecciones.
+        Una respuesta 4xx/5xx es un envío rechazado, no un fallo del test: su
+        cuerpo se analiza igual y, si no trae mensajes de validación, el estado
+        queda como mensaje bajo STATUS_ERROR_FIELD.
+
+        Returns:
+            str: 'loaded' si hubo redirección, 'validated' si el servidor devolvió la página,
+                 'rejected' si respondió con un estado de error
+        """
+        url = requests.compat.urljoin(self.response.url, self.parsed.form_action or "")
+        response = self.session.post(url, data=self.form, timeout=self.timeout)
+        self._load(response, check=False)
+        if not response.ok:
+            self.rejected_status = response.status_code
+            self.parsed.spans.setdefault(
+                STATUS_ERROR_FIELD, f"HTTP {response.status_code} {response.reason}"
+            )
+            return "rejected"
+        return "loaded" if self.was_redirected() else "validated"
+
+    def was_redirected(self):
+        """
+        Verifica si el último POST terminó en una redirección (operación exitosa).
+
+        Returns:
+            bool: True si la respuesta final proviene de una redirección exitosa
+        """
+        return bool(self.response is not None and self.response.history and self.response.ok)
+
+    def get_current_url(self):
+        """
+        Obtiene la URL de la última respuesta.
+
+        Returns:
+            str: URL actual
+        """
+        return self.response.url if self.response is not None else ""
+
+    def get_validation_snapshot(self):
+        """
+        Obtiene los mensajes de validación devueltos por el servidor.
+
+        Returns:
+            dict: {'spans': {campo: mensaje}, 'html5': {}}; sin navegador no hay
+                  validación HTML5
+        """
+        self.last_validation = {"spans": dict(self.parsed.spans), "html5": {}}
+        return self.last_validation
+
+    def get_table_rows(self):
+        """
+        Obtiene las filas de la tabla de la última página.
+
+        Returns:
+            list: Lista de filas, cada una como lista de textos de celda
+        """
+        return self.parsed.rows
+
+    def get_table_row_count(self):
+        """
+        Obtiene la cantidad de filas en la tabla.
+
+        Returns:
+            int: Número de filas
+        """
+        return len(self.parsed.rows)
+
+    def _load(self, response, check=True):
+        if check:
+            response.raise_for_status()
+        self.rejected_status = None
+        self.response = response
+        self.parsed = RazorPageParser()
+        self.parsed.feed(response.text)
+        self.form = dict(self.parsed.form_fields)
+
+    def _field_name(self, locator):
+        return field_name(locator, self.parsed)
+
+
+class HttpClientePage(HttpBasePage):
+    """Versión HTTP de ClientePage"""
+
+    VALIDATION_FIELDS = ClientePage.VALIDATION_FIELDS
+
+    def __init__(self, session, base_url):
+        """
+        Inicializa el Page Object HTTP de Cliente
+
+        Args:
+            session: requests.Session compartida
+            base_url: URL base de la aplicación
+        """
+        super().__init__(session)
+        self.base_url = base_url
+
+    def navigate(self):
+        """Descarga la página de creación de clientes"""
+        self.navigate_to(f"{self.base_url}/Clientes/Create")
+
+    def navigate_to_index(self, search_term=None, page=1):
+        """
+        Descarga la página de lista de clientes
+
+        Args:
+            search_term: Texto de búsqueda (parámetro searchTerm), opcional
+            page: Número de página de resultados
+        """
+        self.navigate_to(ClientePage.index_url(self.base_url, search_term, page))
+
+    def fill_form(self, nombre, apellido, telefono, correo):
+        """
+        Completa el formulario de registro de cliente
+
+        Args:
+            nombre: Nombre del cliente
+            apellido: Apellido del cliente
+            telefono: Teléfono del cliente (opcional)
+            correo: Correo electrónico del cliente
+        """
+        self.fill_fields({
+            ClientePage.NOMBRE_INPUT: nombre,
+            ClientePage.APELLIDO_INPUT: apellido,
+            ClientePage.TELEFONO_INPUT: telefono,
+            ClientePage.CORREO_INPUT: correo
+        })
+
+    def submit_form(self):
+        """Envía el formulario de registro"""
+        return self.submit()
+
+    def get_validation_errors(self):
+        """
+        Obtiene la lista de mensajes de error de validación
+
+        Returns:
+            list: Lista de mensajes de error
+        """
+        return list(self.parsed.spans.values())
+
+    def is_cliente_registered(self, nombre, apellido):
+        """
+        Verifica si el cliente aparece en la lista de clientes
+
+        Args:
+            nombre: Nombre del cliente a buscar
+            apellido: Apellido del cliente a buscar
+
+        Returns:
+            bool: True si el cliente está en la lista, False en caso contrario
+        """
+        search = ClientePage.registration_search(self.base_url, nombre, apellido)
+        while search.next_url:
+            self.navigate_to(search.next_url)
+            search.read(self.get_table_rows(), self.parsed.page_count)
+        return search.found
+
+
+class HttpProductoPage(HttpBasePage):
+    """Versión HTTP de ProductoPage"""
+
+    VALIDATION_FIELDS = ProductoPage.VALIDATION_FIELDS
+
+    def navigate(self, base_url):
+        """
+        Descarga la página de productos.
+
+        Args:
+            base_url: URL base de la aplicación
+        """
+        self.navigate_to(f"{base_url}/Productos/Index")
+
+    def fill_form(self, nombre=None, precio=None, stock=None, descripcion=None, categoria_id=1):
+        """
+        Rellena el formulario de producto con los datos proporcionados.
+
+        Args:
+            nombre: Nombre del producto (opcional)
+            precio: Precio del producto (opcional)
+            stock: Stock del producto (opcional)
+            descripcion: Descripción del producto (opcional)
+            categoria_id: ID de la categoría (por defecto 1)
+        """
+        self.fill_fields({
+            ProductoPage.INPUT_NOMBRE: nombre,
+            ProductoPage.INPUT_PRECIO: precio,
+            ProductoPage.INPUT_STOCK: stock,
+            ProductoPage.INPUT_DESCRIPCION: descripcion,
+            ProductoPage.INPUT_CATEGORIA_ID: categoria_id
+        })
+
+    def submit_form(self):
+        """Envía el formulario de producto."""
+        return self.submit()
+
+    def get_validation_errors(self):
+        """
+        Obtiene los mensajes de error de validación devueltos por el servidor.
+
+        Returns:
+            dict: Diccionario con los campos como claves y mensajes de error como valores
+        """
+        return self.get_field_errors(self.VALIDATION_FIELDS)
+
+    def is_producto_registered(self):
+        """
+        Verifica si el producto fue registrado: el POST redirigió a la página de índice.
+
+        Returns:
+            bool: True si el producto fue registrado, False en caso contrario
+        """
+        return ProductoPage.registered_after_submit(
+            self.get_current_url(), self.was_redirected(), self.has_validation_errors()
+        )
+
+
+class HttpRepartidorPage(HttpBasePage):
+    """Versión HTTP de RepartidorPage"""
+
+    VALIDATION_FIELDS = RepartidorPage.VALIDATION_FIELDS
+
+    def navigate(self, base_url):
+        """
+        Descarga la página de creación de repartidores.
+
+        Args:
+            base_url: URL base de la aplicación
+        """
+        self.navigate_to(f"{base_url}/Repartidores/Create")
+
+    def fill_form(self, nombre=None, apellido=None, telefono=None, tipo=None):
+        """
+        Rellena el formulario de repartidor con los datos proporcionados.
+
+        Args:
+            nombre: Nombre del repartidor (opcional)
+            apellido: Apellido del repartidor (opcional)
+            telefono: Teléfono del repartidor (opcional)
+            tipo: Tipo de repartidor - Interno/Externo/Temporal (opcional)
+        """
+        campos = {
+            RepartidorPage.INPUT_NOMBRE: nombre,
+            RepartidorPage.INPUT_APELLIDO: apellido,
+            RepartidorPage.INPUT_TELEFONO: telefono
+        }
+        if tipo:
+            campos[RepartidorPage.SELECT_TIPO] = RepartidorPage.TIPO_MAPPING.get(tipo, tipo)
+        self.fill_fields(campos)
+
+    def submit_form(self):
+        """Envía el formulario de repartidor."""
+        return self.submit()
+
+    def get_validation_errors(self):
+        """
+        Obtiene los mensajes de error de validación devueltos por el servidor.
+
+        Returns:
+            dict: Diccionario con los campos como claves y mensajes de error como valores
+        """
+        return self.get_field_errors(self.VALIDATION_FIELDS)
+
+    def is_repartidor_registered(self):
+        """
+        Verifica si el repartidor fue registrado: el POST redirigió a la página de índice.
+
+        Returns:
+            bool: True si el repartidor fue registrado, False en caso contrario
+        """
+        return RepartidorPage.registered_after_submit(self.get_current_url())
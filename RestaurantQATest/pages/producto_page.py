@@ -28,6 +28,15 @@ class ProductoPage(BasePage):
     VALIDATION_DESCRIPCION = (By.CSS_SELECTOR, "span[data-valmsg-for='Producto.Descripcion']")
     VALIDATION_CATEGORIA = (By.CSS_SELECTOR, "span[data-valmsg-for='Producto.CategoriaId']")
     
+    # Campos validados: clave del reporte -> nombre del input
+    VALIDATION_FIELDS = {
+        'nombre': 'Producto.Nombre',
+        'precio': 'Producto.Precio',
+        'stock': 'Producto.Stock',
+        'descripcion': 'Producto.Descripcion',
+        'categoria': 'Producto.CategoriaId'
+    }
+    
     # Botones
     BTN_SUBMIT = (By.CSS_SELECTOR, "form button[type='submit']")
     
@@ -68,32 +77,23 @@ class ProductoPage(BasePage):
             descripcion: Descripción del producto (opcional)
             categoria_id: ID de la categoría (por defecto 1)
         """
-        # Limpiar campos primero
-        self.enter_text(self.INPUT_NOMBRE, "")
-        self.enter_text(self.INPUT_PRECIO, "")
-        self.enter_text(self.INPUT_STOCK, "")
-        self.enter_text(self.INPUT_DESCRIPCION, "")
-        
-        # Llenar con nuevos valores
-        if nombre is not None:
-            self.enter_text(self.INPUT_NOMBRE, nombre)
-        
-        if precio is not None:
-            self.enter_text(self.INPUT_PRECIO, precio)
-        
-        if stock is not None:
-            self.enter_text(self.INPUT_STOCK, stock)
-        
-        if descripcion is not None:
-            self.enter_text(self.INPUT_DESCRIPCION, descripcion)
-        
-        self.enter_text(self.INPUT_CATEGORIA_ID, categoria_id)
+        # Los campos en None quedan vacíos
+        self.fill_fields({
+            self.INPUT_NOMBRE: nombre,
+            self.INPUT_PRECIO: precio,
+            self.INPUT_STOCK: stock,
+            self.INPUT_DESCRIPCION: descripcion,
+            self.INPUT_CATEGORIA_ID: categoria_id
+        })
 
     def submit_form(self):
         """
-        Envía el formulario haciendo clic en el botón de submit.
+        Envía el formulario y espera la redirección o la validación del cliente.
+        
+        Returns:
+            str: Estado final de la página ('loaded', 'validated') o None
         """
-        self.click(self.BTN_SUBMIT)
+        return self.submit_and_wait(self.BTN_SUBMIT)
 
     def create_producto(self, nombre, precio, stock, descripcion, categoria_id=1):
         """
@@ -116,7 +116,8 @@ class ProductoPage(BasePage):
         Returns:
             bool: True si el mensaje de éxito es visible, False en caso contrario
         """
-        return self.is_element_visible(self.ALERT_SUCCESS, timeout=3)
+        # Tras submit_and_wait el documento ya está listo: si no hay alerta, no se espera
+        return self.is_element_visible(self.ALERT_SUCCESS, timeout=self.settle_timeout("alert"))
 
     def is_on_index_page(self):
         """
@@ -126,36 +127,39 @@ class ProductoPage(BasePage):
         Returns:
             bool: True si está en la página de índice, False en caso contrario
         """
-        current_url = self.get_current_url()
-        # Si la URL termina en /Productos/Index o /Productos, es la página de índice
-        return "/Productos/Index" in current_url or current_url.endswith("/Productos")
+        return self.is_index_url(self.get_current_url())
 
-    def has_validation_errors(self):
+    @staticmethod
+    def is_index_url(url):
         """
-        Verifica si hay errores de validación en el formulario.
+        Verifica si una URL es la página de índice de productos
+        (/Productos/Index o /Productos).
         
+        Args:
+            url: URL a verificar
+            
         Returns:
-            bool: True si hay errores de validación visibles, False en caso contrario
-        """
-        validation_locators = [
-            self.VALIDATION_NOMBRE,
-            self.VALIDATION_PRECIO,
-            self.VALIDATION_STOCK,
-            self.VALIDATION_DESCRIPCION,
-            self.VALIDATION_CATEGORIA
-        ]
-        
-        for locator in validation_locators:
-            if self.is_element_visible(locator, timeout=2):
-                # Verificar que el mensaje no esté vacío
-                try:
-                    message = self.get_text(locator)
-                    if message.strip():
-                        return True
-                except:
-                    continue
+            bool: True si es la página de índice
+        """
+        return "/Productos/Index" in url or url.endswith("/Productos")
+
+    @classmethod
+    def registered_after_submit(cls, url, redirected, has_errors):
+        """
+        Criterio de registro sin mensaje de éxito, separado de la lectura de la
+        página para que lo compartan los Page Objects asíncronos, HTTP y los
+        flujos por pestaña: el envío terminó en una redirección al índice y sin
+        errores de validación.
         
-        return False
+        Args:
+            url: URL después del envío
+            redirected: Si el documento llegó por una redirección
+            has_errors: Si hay errores de validación visibles
+            
+        Returns:
+            bool: True si el producto se guardó
+        """
+        return redirected and cls.is_index_url(url) and not has_errors
 
     def get_validation_errors(self):
         """
@@ -164,29 +168,18 @@ class ProductoPage(BasePage):
         Returns:
             dict: Diccionario con los campos como claves y mensajes de error como valores
         """
-        errors = {}
-        
-        validation_fields = {
-            'nombre': self.VALIDATION_NOMBRE,
-            'precio': self.VALIDATION_PRECIO,
-            'stock': self.VALIDATION_STOCK,
-            'descripcion': self.VALIDATION_DESCRIPCION,
-            'categoria': self.VALIDATION_CATEGORIA
-        }
-        
-        for field, locator in validation_fields.items():
-            message = self.get_validation_message(locator)
-            if message.strip():
-                errors[field] = message
-        
-        return errors
+        return self.get_field_errors(self.VALIDATION_FIELDS)
 
     def is_producto_registered(self):
         """
         Verifica si el producto fue registrado exitosamente.
         Se considera exitoso si:
         1. Hay un mensaje de éxito visible, O
-        2. La URL cambió a la página de índice (indicando redirección exitosa)
+        2. El POST redirigió a la página de índice sin errores de validación
+        
+        El formulario está en /Productos/Index: con el modelo inválido
+        OnPostAsync devuelve Page() en esa misma URL, así que estar en el índice
+        no basta; solo RedirectToPage() indica que se guardó.
         
         Returns:
             bool: True si el producto fue registrado, False en caso contrario
@@ -195,9 +188,10 @@ class ProductoPage(BasePage):
         if self.is_success_message_displayed():
             return True
         
-        # Si no hay mensaje, verificar si redirigió a la página de índice
-        # (esto indica que el formulario se procesó correctamente)
-        return self.is_on_index_page()
+        # Si no hay mensaje, verificar que el envío terminó en una redirección
+        return self.registered_after_submit(
+            self.get_current_url(), self.was_redirected(), self.has_validation_errors()
+        )
 
     def get_table_row_count(self):
         """
@@ -216,8 +210,10 @@ class ProductoPage(BasePage):
         """
         Limpia todos los campos del formulario.
         """
-        self.enter_text(self.INPUT_NOMBRE, "")
-        self.enter_text(self.INPUT_PRECIO, "")
-        self.enter_text(self.INPUT_STOCK, "")
-        self.enter_text(self.INPUT_DESCRIPCION, "")
-        self.enter_text(self.INPUT_CATEGORIA_ID, "")
+        self.fill_fields({
+            self.INPUT_NOMBRE: "",
+            self.INPUT_PRECIO: "",
+            self.INPUT_STOCK: "",
+            self.INPUT_DESCRIPCION: "",
+            self.INPUT_CATEGORIA_ID: ""
+        })
@@ -2,6 +2,7 @@
 Page Object Model para la página de gestión de repartidores.
 Contiene los localizadores y métodos para interactuar con el formulario de repartidores.
 """
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from pages.base_page import BasePage
@@ -27,6 +28,14 @@ class RepartidorPage(BasePage):
     VALIDATION_TELEFONO = (By.CSS_SELECTOR, "span[data-valmsg-for='Repartidor.Telefono']")
     VALIDATION_TIPO = (By.CSS_SELECTOR, "span[data-valmsg-for='Repartidor.Tipo']")
     
+    # Campos validados: clave del reporte -> nombre del input
+    VALIDATION_FIELDS = {
+        'nombre': 'Repartidor.Nombre',
+        'apellido': 'Repartidor.Apellido',
+        'telefono': 'Repartidor.Telefono',
+        'tipo': 'Repartidor.Tipo'
+    }
+    
     # Botones
     BTN_SUBMIT = (By.CSS_SELECTOR, "form button[type='submit']")
     BTN_VOLVER = (By.CSS_SELECTOR, "a.btn-secondary")
@@ -35,6 +44,17 @@ class RepartidorPage(BasePage):
     ALERT_SUCCESS = (By.CSS_SELECTOR, ".alert-success")
     ALERT_DANGER = (By.CSS_SELECTOR, ".alert-danger")
     
+    # Mapeo de tipos del CSV a valores del select
+    # Nota: Los valores pueden variar según la implementación
+    TIPO_MAPPING = {
+        'Interno': 'Bicicleta',
+        'Externo': 'Moto',
+        'Temporal': 'Auto',
+        'Bicicleta': 'Bicicleta',
+        'Moto': 'Moto',
+        'Auto': 'Auto'
+    }
+    
     # Tabla de repartidores (en Index)
     TABLE_REPARTIDORES = (By.CSS_SELECTOR, "table.table")
     TABLE_ROWS = (By.CSS_SELECTOR, "table.table tbody tr")
@@ -67,24 +87,18 @@ class RepartidorPage(BasePage):
             telefono: Teléfono del repartidor (opcional)
             tipo: Tipo de repartidor - Interno/Externo/Temporal (opcional)
         """
-        # Limpiar campos primero
-        self.enter_text(self.INPUT_NOMBRE, "")
-        self.enter_text(self.INPUT_APELLIDO, "")
-        self.enter_text(self.INPUT_TELEFONO, "")
-        
-        # Llenar con nuevos valores
-        if nombre is not None:
-            self.enter_text(self.INPUT_NOMBRE, nombre)
-        
-        if apellido is not None:
-            self.enter_text(self.INPUT_APELLIDO, apellido)
-        
-        if telefono is not None:
-            self.enter_text(self.INPUT_TELEFONO, telefono)
+        campos = {
+            self.INPUT_NOMBRE: nombre,
+            self.INPUT_APELLIDO: apellido,
+            self.INPUT_TELEFONO: telefono
+        }
         
         # Seleccionar tipo si se proporciona
-        if tipo is not None and tipo:
-            self.select_tipo(tipo)
+        if tipo:
+            campos[self.SELECT_TIPO] = self.TIPO_MAPPING.get(tipo, tipo)
+        
+        # Los campos en None quedan vacíos
+        self.fill_fields(campos)
 
     def select_tipo(self, tipo):
         """
@@ -93,42 +107,35 @@ class RepartidorPage(BasePage):
         Args:
             tipo: Tipo de repartidor (Bicicleta, Moto, Auto, Interno, Externo, Temporal)
         """
-        try:
-            select_element = self.find_element(self.SELECT_TIPO)
+        valor_select = self.TIPO_MAPPING.get(tipo, tipo)
+
+        def select_option(select_element):
             select = Select(select_element)
-            
-            # Mapear tipos del CSV a valores del select
-            # Nota: Los valores pueden variar según la implementación
-            tipo_mapping = {
-                'Interno': 'Bicicleta',
-                'Externo': 'Moto',
-                'Temporal': 'Auto',
-                'Bicicleta': 'Bicicleta',
-                'Moto': 'Moto',
-                'Auto': 'Auto'
-            }
-            
-            valor_select = tipo_mapping.get(tipo, tipo)
-            
             # Intentar seleccionar por valor visible
             try:
                 select.select_by_visible_text(valor_select)
-            except:
+            except NoSuchElementException:
                 # Si falla, intentar por valor
                 try:
                     select.select_by_value(valor_select)
-                except:
+                except NoSuchElementException:
                     # Si todo falla, usar el valor original
                     pass
+
+        try:
+            self._with_element(self.SELECT_TIPO, select_option)
         except Exception as e:
             # Si no se puede seleccionar, continuar (puede ser que no exista la opción)
             pass
 
     def submit_form(self):
         """
-        Envía el formulario haciendo clic en el botón de submit.
+        Envía el formulario y espera la redirección o la validación del cliente.
+        
+        Returns:
+            str: Estado final de la página ('loaded', 'validated') o None
         """
-        self.click(self.BTN_SUBMIT)
+        return self.submit_and_wait(self.BTN_SUBMIT)
 
     def create_repartidor(self, nombre, apellido, telefono, tipo):
         """
@@ -150,7 +157,8 @@ class RepartidorPage(BasePage):
         Returns:
             bool: True si el mensaje de éxito es visible, False en caso contrario
         """
-        return self.is_element_visible(self.ALERT_SUCCESS, timeout=3)
+        # Tras submit_and_wait el documento ya está listo: si no hay alerta, no se espera
+        return self.is_element_visible(self.ALERT_SUCCESS, timeout=self.settle_timeout("alert"))
 
     def is_on_index_page(self):
         """
@@ -160,35 +168,37 @@ class RepartidorPage(BasePage):
         Returns:
             bool: True si está en la página de índice, False en caso contrario
         """
-        current_url = self.get_current_url()
-        # Si la URL termina en /Repartidores/Index o /Repartidores, es la página de índice
-        return "/Repartidores/Index" in current_url or current_url.endswith("/Repartidores")
+        return self.is_index_url(self.get_current_url())
 
-    def has_validation_errors(self):
+    @staticmethod
+    def is_index_url(url):
         """
-        Verifica si hay errores de validación en el formulario.
+        Verifica si una URL es la página de índice de repartidores
+        (/Repartidores/Index o /Repartidores).
         
+        Args:
+            url: URL a verificar
+            
         Returns:
-            bool: True si hay errores de validación visibles, False en caso contrario
+            bool: True si es la página de índice
         """
-        validation_locators = [
-            self.VALIDATION_NOMBRE,
-            self.VALIDATION_APELLIDO,
-            self.VALIDATION_TELEFONO,
-            self.VALIDATION_TIPO
-        ]
-        
-        for locator in validation_locators:
-            if self.is_element_visible(locator, timeout=2):
-                # Verificar que el mensaje no esté vacío
-                try:
-                    message = self.get_text(locator)
-                    if message.strip():
-                        return True
-                except:
-                    continue
+        return "/Repartidores/Index" in url or url.endswith("/Repartidores")
+
+    @classmethod
+    def registered_after_submit(cls, url):
+        """
+        Criterio de registro sin mensaje de éxito, compartido con los Page
+        Objects asíncronos, HTTP y los flujos por pestaña: el formulario está en
+        /Repartidores/Create, así que terminar en el índice indica que el envío
+        se procesó y redirigió.
         
-        return False
+        Args:
+            url: URL después del envío
+            
+        Returns:
+            bool: True si el repartidor se guardó
+        """
+        return cls.is_index_url(url)
 
     def get_validation_errors(self):
         """
@@ -197,21 +207,7 @@ class RepartidorPage(BasePage):
         Returns:
             dict: Diccionario con los campos como claves y mensajes de error como valores
         """
-        errors = {}
-        
-        validation_fields = {
-            'nombre': self.VALIDATION_NOMBRE,
-            'apellido': self.VALIDATION_APELLIDO,
-            'telefono': self.VALIDATION_TELEFONO,
-            'tipo': self.VALIDATION_TIPO
-        }
-        
-        for field, locator in validation_fields.items():
-            message = self.get_validation_message(locator)
-            if message.strip():
-                errors[field] = message
-        
-        return errors
+        return self.get_field_errors(self.VALIDATION_FIELDS)
 
     def is_repartidor_registered(self):
         """
@@ -229,7 +225,7 @@ class RepartidorPage(BasePage):
         
         # Si no hay mensaje, verificar si redirigió a la página de índice
         # (esto indica que el formulario se procesó correctamente)
-        return self.is_on_index_page()
+        return self.registered_after_submit(self.get_current_url())
 
     def get_table_row_count(self):
         """
@@ -247,15 +243,11 @@ class RepartidorPage(BasePage):
     def clear_form(self):
         """
         Limpia todos los campos del formulario.
-        """
-        self.enter_text(self.INPUT_NOMBRE, "")
-        self.enter_text(self.INPUT_APELLIDO, "")
-        self.enter_text(self.INPUT_TELEFONO, "")
-        
-        # Resetear el select a la opción vacía
-        try:
-            select_element = self.find_element(self.SELECT_TIPO)
-            select = Select(select_element)
-            select.select_by_index(0)  # Seleccionar la primera opción (vacía)
-        except:
-            pass
+        El select vuelve a la opción vacía.
+        """
+        self.fill_fields({
+            self.INPUT_NOMBRE: "",
+            self.INPUT_APELLIDO: "",
+            self.INPUT_TELEFONO: "",
+            self.SELECT_TIPO: ""
+        })
@@ -0,0 +1,97 @@
+"""
+Casos CSV de registro con los Page Objects asíncronos (pages/async_pages.py).
+Todos los casos de un módulo se ejecutan a la vez en contextos aislados de un
+solo navegador (map_in_contexts) y cada resultado se compara con la predicción
+del oráculo de validación (utils/oracle.py), que es el comportamiento de la
+aplicación; las discrepancias entre el CSV y el oráculo ya las reportan las
+pruebas secuenciales. Con --engine=http se omiten.
+"""
+import pytest
+
+from pages.async_pages import (
+    AsyncClientePage, AsyncProductoPage, AsyncRepartidorPage, SyncPage, map_in_contexts
+)
+from utils.cdp_client import shared_loop
+from utils.data_loader import load_cases
+from utils.oracle import predict
+
+# Pestañas simultáneas por navegador
+CONCURRENCY = 10
+
+
+def run_cases(browser, flow, file_name):
+    """
+    Ejecuta flow(contexto, caso) para todos los casos de un CSV.
+
+    Returns:
+        list: Casos cuyo resultado no coincide con el oráculo, como texto
+    """
+    cases = load_cases(file_name)
+    results = shared_loop().run(map_in_contexts(browser, flow, cases, concurrency=CONCURRENCY))
+    mismatches = []
+    for case, result in zip(cases, results):
+        if isinstance(result, Exception):
+            mismatches.append(f"{case['caso']}: {type(result).__name__}: {result}")
+        elif result != predict(file_name, case).accepted:
+            mismatches.append(f"{case['caso']}: registrado={result}")
+    return mismatches
+
+
+# ==================== PRUEBAS ====================
+
+@pytest.mark.productos
+def test_registro_producto_async(cdp_browser, base_url):
+    """Casos de productos_tests.csv en contextos concurrentes."""
+    async def registrar(context, case):
+        page = AsyncProductoPage(context)
+        await page.navigate(base_url)
+        await page.fill_form(
+            nombre=case["nombre"] or None,
+            precio=case["precio"] or None,
+            stock=case["stock"] or None,
+            descripcion=case["descripcion"] or None,
+            categoria_id=case.get("categoria_id", 1)
+        )
+        if await page.submit_form() != "loaded":
+            return False
+        return await page.is_producto_registered()
+
+    mismatches = run_cases(cdp_browser, registrar, "productos_tests.csv")
+    assert not mismatches, f"❌ Resultados distintos del oráculo: {mismatches}"
+
+
+@pytest.mark.repartidores
+def test_registro_repartidor_async(cdp_browser, base_url):
+    """Casos de repartidores_tests.csv en contextos concurrentes."""
+    async def registrar(context, case):
+        page = AsyncRepartidorPage(context)
+        await page.navigate(base_url)
+        await page.fill_form(
+            nombre=case["nombre"] or None,
+            apellido=case["apellido"] or None,
+            telefono=case["telefono"] or None,
+            tipo=case["tipo"] or None
+        )
+        if await page.submit_form() != "loaded":
+            return False
+        return await page.is_repartidor_registered()
+
+    mismatches = run_cases(cdp_browser, registrar, "repartidores_tests.csv")
+    assert not mismatches, f"❌ Resultados distintos del oráculo: {mismatches}"
+
+
+@pytest.mark.clientes
+def test_registro_cliente_sync_page(cdp_browser, base_url):
+    """La API síncrona (SyncPage) sobre un Page Object asíncrono."""
+    loop = shared_loop()
+    context = loop.run(cdp_browser.new_context())
+    try:
+        page = SyncPage(AsyncClientePage(context, base_url), loop)
+        page.navigate()
+        page.fill_form("Lucía", "Fernández", "71234567", "lucia.fernandez@example.com")
+        assert page.submit_form() == "loaded"
+        assert not page.get_validation_errors()
+        assert page.is_cliente_registered("Lucía", "Fernández"), \
+            "❌ El cliente debería aparecer en la lista"
+    finally:
+        loop.run(context.close())
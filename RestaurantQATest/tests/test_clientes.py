@@ -4,45 +4,20 @@ Implementa pruebas basadas en particiones equivalentes
 """
 
 import pytest
-import csv
-import os
-from pages.cliente_page import ClientePage
 
+from utils.data_loader import case_params
 
-def load_test_cases():
-    """
-    Carga los casos de prueba desde el archivo CSV
-    
-    Returns:
-        list: Lista de tuplas con los datos de cada caso de prueba
-    """
-    test_cases = []
-    csv_path = os.path.join(os.path.dirname(__file__), '..', 'Data', 'clientes_tests.csv')
-    
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            test_cases.append((
-                row['caso'],
-                row['nombre'],
-                row['apellido'],
-                row['telefono'],
-                row['correo'],
-                row['esperado'],
-                row['particion'],
-                row['observaciones']
-            ))
-    
-    return test_cases
+
+CASE_FIELDS = ("caso", "nombre", "apellido", "telefono", "correo",
+               "esperado", "particion", "observaciones")
 
 
 @pytest.mark.clientes
 @pytest.mark.parametrize(
     "caso,nombre,apellido,telefono,correo,esperado,particion,observaciones",
-    load_test_cases(),
-    ids=lambda x: x if isinstance(x, str) and x.startswith('CL') else None
+    case_params("clientes_tests.csv", CASE_FIELDS)
 )
-def test_registro_cliente(driver, base_url, caso, nombre, apellido, telefono, correo, esperado, particion, observaciones):
+def test_registro_cliente(cliente_page, caso, nombre, apellido, telefono, correo, esperado, particion, observaciones):
     """
     Prueba parametrizada para el registro de clientes
     
@@ -55,8 +30,7 @@ def test_registro_cliente(driver, base_url, caso, nombre, apellido, telefono, co
     - Correo: Requerido, formato válido de email
     
     Args:
-        driver: Fixture de WebDriver
-        base_url: Fixture con URL base de la aplicación
+        cliente_page: Page Object de clientes (navegador o HTTP según --engine)
         caso: Identificador del caso de prueba (CL1, CL2, etc.)
         nombre: Nombre del cliente
         apellido: Apellido del cliente
@@ -67,7 +41,6 @@ def test_registro_cliente(driver, base_url, caso, nombre, apellido, telefono, co
         observaciones: Descripción detallada del caso
     """
     # ========== ARRANGE (Preparar) ==========
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     print(f"\n{'='*80}")
@@ -111,12 +84,11 @@ def test_registro_cliente(driver, base_url, caso, nombre, apellido, telefono, co
 
 @pytest.mark.clientes
 @pytest.mark.smoke
-def test_registro_valido_basico(driver, base_url):
+def test_registro_valido_basico(cliente_page):
     """
     Prueba de registro válido básico (CL1)
     Caso de humo para verificar funcionalidad básica
     """
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     # Datos válidos básicos
@@ -134,12 +106,11 @@ def test_registro_valido_basico(driver, base_url):
 
 @pytest.mark.clientes
 @pytest.mark.smoke
-def test_registro_valido_apellido_compuesto(driver, base_url):
+def test_registro_valido_apellido_compuesto(cliente_page):
     """
     Prueba de registro válido con apellido compuesto (CL2)
     Verifica que se acepten apellidos con espacios
     """
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     # Datos con apellido compuesto
@@ -156,9 +127,8 @@ def test_registro_valido_apellido_compuesto(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_nombre_vacio(driver, base_url):
+def test_nombre_vacio(cliente_page):
     """Prueba con nombre vacío (requerido)"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -174,9 +144,8 @@ def test_nombre_vacio(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_apellido_vacio(driver, base_url):
+def test_apellido_vacio(cliente_page):
     """Prueba con apellido vacío (requerido)"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -192,9 +161,8 @@ def test_apellido_vacio(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_correo_vacio(driver, base_url):
+def test_correo_vacio(cliente_page):
     """Prueba con correo vacío (requerido)"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -210,12 +178,11 @@ def test_correo_vacio(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_telefono_vacio_valido(driver, base_url):
+def test_telefono_vacio_valido(cliente_page):
     """
     Prueba con teléfono vacío (no requerido - debería ser válido)
     Nota: El teléfono es opcional según la entidad Cliente
     """
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -232,9 +199,8 @@ def test_telefono_vacio_valido(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_nombre_mayor_max(driver, base_url):
+def test_nombre_mayor_max(cliente_page):
     """Prueba con nombre que excede el máximo de 30 caracteres"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -250,9 +216,8 @@ def test_nombre_mayor_max(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_apellido_mayor_max(driver, base_url):
+def test_apellido_mayor_max(cliente_page):
     """Prueba con apellido que excede el máximo de 30 caracteres"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -268,9 +233,8 @@ def test_apellido_mayor_max(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_nombre_con_numeros(driver, base_url):
+def test_nombre_con_numeros(cliente_page):
     """Prueba con nombre que contiene números"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -286,9 +250,8 @@ def test_nombre_con_numeros(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_apellido_con_numeros(driver, base_url):
+def test_apellido_con_numeros(cliente_page):
     """Prueba con apellido que contiene números"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -304,9 +267,8 @@ def test_apellido_con_numeros(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_nombre_con_caracteres_especiales(driver, base_url):
+def test_nombre_con_caracteres_especiales(cliente_page):
     """Prueba con nombre que contiene caracteres especiales"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -322,9 +284,8 @@ def test_nombre_con_caracteres_especiales(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_apellido_con_caracteres_especiales(driver, base_url):
+def test_apellido_con_caracteres_especiales(cliente_page):
     """Prueba con apellido que contiene caracteres especiales"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -340,9 +301,8 @@ def test_apellido_con_caracteres_especiales(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_telefono_menor_min(driver, base_url):
+def test_telefono_menor_min(cliente_page):
     """Prueba con teléfono menor al mínimo de 7 dígitos"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -358,9 +318,8 @@ def test_telefono_menor_min(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_telefono_mayor_max(driver, base_url):
+def test_telefono_mayor_max(cliente_page):
     """Prueba con teléfono mayor al máximo de 8 dígitos"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -376,9 +335,8 @@ def test_telefono_mayor_max(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_telefono_formato_invalido(driver, base_url):
+def test_telefono_formato_invalido(cliente_page):
     """Prueba con teléfono que contiene letras"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -394,9 +352,8 @@ def test_telefono_formato_invalido(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_correo_formato_invalido_sin_arroba(driver, base_url):
+def test_correo_formato_invalido_sin_arroba(cliente_page):
     """Prueba con correo sin @"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -412,9 +369,8 @@ def test_correo_formato_invalido_sin_arroba(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_correo_formato_invalido_incompleto(driver, base_url):
+def test_correo_formato_invalido_incompleto(cliente_page):
     """Prueba con correo incompleto"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -430,9 +386,8 @@ def test_correo_formato_invalido_incompleto(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_correo_formato_invalido_multiple_arroba(driver, base_url):
+def test_correo_formato_invalido_multiple_arroba(cliente_page):
     """Prueba con correo con múltiples @"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
@@ -448,9 +403,8 @@ def test_correo_formato_invalido_multiple_arroba(driver, base_url):
 
 
 @pytest.mark.clientes
-def test_nombre_compuesto_valido(driver, base_url):
+def test_nombre_compuesto_valido(cliente_page):
     """Prueba con nombre compuesto válido"""
-    cliente_page = ClientePage(driver, base_url)
     cliente_page.navigate()
     
     cliente_page.fill_form(
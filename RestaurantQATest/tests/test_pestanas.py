@@ -0,0 +1,119 @@
+"""
+Casos CSV de registro ejecutados en varias pestañas de un mismo navegador.
+Con --tabs=N reemplazan a test_registro_producto, test_registro_repartidor y
+test_registro_cliente: el primer test de cada módulo ejecuta todos sus casos
+seleccionados en N pestañas (ver utils/tab_pool.py) y cada test verifica el
+resultado de su caso con los criterios de los Page Objects (registered_after_submit,
+registration_search), los mismos que usa la versión secuencial.
+Sin --tabs se deseleccionan.
+"""
+import pytest
+
+from pages.cliente_page import ClientePage
+from pages.producto_page import ProductoPage
+from pages.repartidor_page import RepartidorPage
+from utils.data_loader import case_params
+
+
+# ==================== FLUJOS POR PESTAÑA ====================
+
+def registrar_producto(tab, case, base_url):
+    """Abre el formulario, lo envía y devuelve el resultado observado."""
+    page = ProductoPage(tab.driver)
+    yield tab.navigate(f"{base_url}/Productos/Index")
+    page.fill_form(
+        nombre=case["nombre"] or None,
+        precio=case["precio"] or None,
+        stock=case["stock"] or None,
+        descripcion=case["descripcion"] or None,
+        categoria_id=case.get("categoria_id", 1)
+    )
+    state = yield tab.submit(ProductoPage.BTN_SUBMIT)
+    has_errors = page.has_validation_errors()
+    return {
+        "registered": state == "loaded" and ProductoPage.registered_after_submit(
+            page.get_current_url(), page.was_redirected(), has_errors),
+        "has_errors": has_errors,
+        "errors": page.get_validation_errors(),
+    }
+
+
+def registrar_repartidor(tab, case, base_url):
+    """Abre el formulario, lo envía y devuelve el resultado observado."""
+    page = RepartidorPage(tab.driver)
+    yield tab.navigate(f"{base_url}/Repartidores/Create")
+    page.fill_form(
+        nombre=case["nombre"] or None,
+        apellido=case["apellido"] or None,
+        telefono=case["telefono"] or None,
+        tipo=case["tipo"] or None
+    )
+    state = yield tab.submit(RepartidorPage.BTN_SUBMIT)
+    return {
+        "registered": state == "loaded" and RepartidorPage.registered_after_submit(page.get_current_url()),
+        "has_errors": page.has_validation_errors(),
+        "errors": page.get_validation_errors(),
+    }
+
+
+def registrar_cliente(tab, case, base_url):
+    """Envía el formulario y, si se aceptó, busca al cliente en la lista."""
+    page = ClientePage(tab.driver, base_url)
+    yield tab.navigate(f"{base_url}/Clientes/Create")
+    page.fill_form(case["nombre"], case["apellido"], case["telefono"], case["correo"])
+    state = yield tab.submit(ClientePage.SUBMIT_BUTTON)
+    result = {"registered": False, "has_errors": page.has_validation_errors(),
+              "errors": page.get_validation_errors()}
+    if state != "loaded" or result["has_errors"]:
+        return result
+    search = ClientePage.registration_search(base_url, case["nombre"], case["apellido"])
+    while search.next_url:
+        yield tab.navigate(search.next_url)
+        data = page.get_table_data(ClientePage.CLIENTES_TABLE[1])
+        search.read(data["rows"], data["pages"])
+    result["registered"] = search.found
+    return result
+
+
+# ==================== PRUEBAS ====================
+
+@pytest.mark.tab_pool
+@pytest.mark.productos
+@pytest.mark.parametrize("case", case_params("productos_tests.csv"))
+def test_producto_en_pestana(request, tab_results, case):
+    """Versión en pestañas de test_registro_producto."""
+    result = tab_results(registrar_producto, request.node)
+    if case["esperado"] == "Aceptado":
+        assert result["registered"], \
+            f"❌ Caso {case['caso']}: se esperaba ACEPTADO. Errores: {result['errors']}"
+    else:
+        assert result["has_errors"] or not result["registered"], \
+            f"❌ Caso {case['caso']}: se esperaba RECHAZADO. Observaciones: {case.get('observaciones')}"
+
+
+@pytest.mark.tab_pool
+@pytest.mark.repartidores
+@pytest.mark.parametrize("case", case_params("repartidores_tests.csv"))
+def test_repartidor_en_pestana(request, tab_results, case):
+    """Versión en pestañas de test_registro_repartidor."""
+    result = tab_results(registrar_repartidor, request.node)
+    if case["esperado"] == "Aceptado":
+        assert result["registered"], \
+            f"❌ Caso {case['caso']}: se esperaba ACEPTADO. Errores: {result['errors']}"
+    else:
+        assert result["has_errors"] or not result["registered"], \
+            f"❌ Caso {case['caso']}: se esperaba RECHAZADO. Observaciones: {case.get('observaciones')}"
+
+
+@pytest.mark.tab_pool
+@pytest.mark.clientes
+@pytest.mark.parametrize("case", case_params("clientes_tests.csv"))
+def test_cliente_en_pestana(request, tab_results, case):
+    """Versión en pestañas de test_registro_cliente."""
+    result = tab_results(registrar_cliente, request.node)
+    if case["esperado"] == "valido":
+        assert result["registered"], \
+            f"❌ Caso {case['caso']}: el cliente debería haberse registrado. Errores: {result['errors']}"
+    else:
+        assert result["has_errors"], \
+            f"❌ Caso {case['caso']}: se esperaban errores de validación"
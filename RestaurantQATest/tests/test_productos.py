@@ -11,32 +11,16 @@ Particiones de Prueba:
   * Valores numéricos fuera de rango (Precio: 0.01-1000, Stock: 0-150)
   * Caracteres especiales no permitidos en Nombre
 """
-import csv
 import pytest
-from pages.producto_page import ProductoPage
 
-
-# ==================== CARGA DE DATOS DE PRUEBA ====================
-
-DATA_FILE = "Data/productos_tests.csv"
-
-
-def load_test_cases():
-    """
-    Carga los casos de prueba desde el archivo CSV.
-    
-    Returns:
-        list: Lista de diccionarios con los datos de cada caso de prueba
-    """
-    with open(DATA_FILE, newline='', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+from utils.data_loader import case_params
 
 
 # ==================== PRUEBAS PARAMETRIZADAS ====================
 
 @pytest.mark.productos
-@pytest.mark.parametrize("case", load_test_cases())
-def test_registro_producto(driver, base_url, case):
+@pytest.mark.parametrize("case", case_params("productos_tests.csv"))
+def test_registro_producto(producto_page, base_url, case):
     """
     Prueba el registro de productos usando particiones equivalentes.
     
@@ -48,14 +32,11 @@ def test_registro_producto(driver, base_url, case):
     - PR3-PR33: Particiones inválidas (diversos tipos de errores)
     
     Args:
-        driver: WebDriver fixture de Selenium
+        producto_page: Page Object (navegador o HTTP según --engine)
         base_url: URL base de la aplicación
         case: Diccionario con los datos del caso de prueba actual
     """
     # ==================== ARRANGE ====================
-    # Inicializar el Page Object
-    producto_page = ProductoPage(driver)
-    
     # Navegar a la página de productos
     producto_page.navigate(base_url)
     
@@ -80,9 +61,6 @@ def test_registro_producto(driver, base_url, case):
     # Enviar el formulario
     producto_page.submit_form()
     
-    # Esperar un momento para que se procese el formulario
-    driver.implicitly_wait(2)
-    
     # ==================== ASSERT ====================
     # Determinar el resultado real
     if resultado_esperado == "Aceptado":
@@ -11,32 +11,16 @@ Particiones de Prueba:
   * Teléfono con formato inválido (no inicia con 6/7, contiene letras, longitud incorrecta)
   * Teléfono fuera de rango (< 7 dígitos o > 8 dígitos)
 """
-import csv
 import pytest
-from pages.repartidor_page import RepartidorPage
 
-
-# ==================== CARGA DE DATOS DE PRUEBA ====================
-
-DATA_FILE = "/home/jhonn/Documentos/Universidad/8vo_Semestre/QA/GCS-OrdersRestaurant/RestaurantQATest/Data/repartidores_tests.csv"
-
-
-def load_test_cases():
-    """
-    Carga los casos de prueba desde el archivo CSV.
-    
-    Returns:
-        list: Lista de diccionarios con los datos de cada caso de prueba
-    """
-    with open(DATA_FILE, newline='', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+from utils.data_loader import case_params
 
 
 # ==================== PRUEBAS PARAMETRIZADAS ====================
 
 @pytest.mark.repartidores
-@pytest.mark.parametrize("case", load_test_cases())
-def test_registro_repartidor(driver, base_url, case):
+@pytest.mark.parametrize("case", case_params("repartidores_tests.csv"))
+def test_registro_repartidor(repartidor_page, base_url, case):
     """
     Prueba el registro de repartidores usando particiones equivalentes.
     
@@ -48,14 +32,11 @@ def test_registro_repartidor(driver, base_url, case):
     - RP3-RP11, RP13-RP18, RP20-RP36: Particiones inválidas (diversos tipos de errores)
     
     Args:
-        driver: WebDriver fixture de Selenium
+        repartidor_page: Page Object (navegador o HTTP según --engine)
         base_url: URL base de la aplicación
         case: Diccionario con los datos del caso de prueba actual
     """
     # ==================== ARRANGE ====================
-    # Inicializar el Page Object
-    repartidor_page = RepartidorPage(driver)
-    
     # Navegar a la página de repartidores
     repartidor_page.navigate(base_url)
     
@@ -78,9 +59,6 @@ def test_registro_repartidor(driver, base_url, case):
     # Enviar el formulario
     repartidor_page.submit_form()
     
-    # Esperar un momento para que se procese el formulario
-    driver.implicitly_wait(2)
-    
     # ==================== ASSERT ====================
     # Determinar el resultado real
     if resultado_esperado == "Aceptado":
@@ -0,0 +1,3 @@
+"""
+Pruebas unitarias de las utilidades de la suite (sin navegador ni aplicación).
+"""
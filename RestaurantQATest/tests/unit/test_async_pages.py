@@ -0,0 +1,176 @@
+"""
+Pruebas unitarias de los Page Objects asíncronos (pages/async_pages.py) sobre
+una pestaña simulada: el formulario de productos en memoria, que responde a
+los mismos scripts que ejecutaría Chrome.
+"""
+import asyncio
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from pages.async_pages import ELEMENT_STATE_SCRIPT, AsyncProductoPage, SyncPage, map_in_contexts
+from pages.base_page import (
+    FILL_FIELDS_SCRIPT, MARK_PAGE_SCRIPT, PAGE_STATE_SCRIPT, REDIRECTED_SCRIPT,
+    VALIDATION_SNAPSHOT_SCRIPT
+)
+from pages.producto_page import ProductoPage
+from utils.cdp_client import shared_loop
+
+BASE_URL = "http://stub"
+FIELDS = set(ProductoPage.VALIDATION_FIELDS.values())
+
+
+# ==================== PESTAÑA SIMULADA ====================
+
+class FakeTab:
+    """
+    BrowsingContext con el formulario de productos: sin nombre el servidor
+    devuelve la misma página con el error; con nombre redirige a la lista.
+    """
+
+    def __init__(self, browser=None):
+        self.browser = browser
+        self.url = "about:blank"
+        self.values = {}
+        self.errors = {}
+        self.redirected = False
+        self.token = None
+        self.closed = False
+
+    async def execute_script(self, script, *args):
+        await asyncio.sleep(0)  # cada comando es un round-trip
+        handlers = {
+            ELEMENT_STATE_SCRIPT: self._element,
+            FILL_FIELDS_SCRIPT: self._fill,
+            MARK_PAGE_SCRIPT: self._mark,
+            PAGE_STATE_SCRIPT: self._state,
+            VALIDATION_SNAPSHOT_SCRIPT: lambda: {"spans": dict(self.errors), "html5": {}},
+            REDIRECTED_SCRIPT: lambda: self.redirected,
+            "return location.href;": lambda: self.url,
+        }
+        return handlers[script](*args)
+
+    async def navigate(self, url):
+        self.url, self.values, self.errors, self.redirected, self.token = url, {}, {}, False, None
+
+    async def click_at(self, x, y):
+        # El único elemento clickeable es el botón de envío
+        if self.values.get("Producto.Nombre"):
+            self.url, self.errors, self.redirected = f"{BASE_URL}/Productos/Index", {}, True
+        else:
+            self.errors, self.redirected = {"Producto.Nombre": "El nombre es obligatorio."}, False
+        self.token = None   # documento nuevo
+
+    async def close(self):
+        self.closed = True
+        if self.browser is not None:
+            self.browser.open -= 1
+
+    def _element(self, by, value, focus):
+        if (by, value) == ProductoPage.BTN_SUBMIT or value in FIELDS:
+            return {"visible": True, "enabled": True, "text": "", "tag": "input", "x": 1, "y": 1}
+        return None
+
+    def _fill(self, entries):
+        missing = []
+        for by, name, value in entries:
+            if name in FIELDS:
+                self.values[name] = value
+            else:
+                missing.append(name)
+        return missing
+
+    def _mark(self, token):
+        self.token = token
+
+    def _state(self, token):
+        return None if token and token == self.token else "loaded"
+
+
+class FakeBrowser:
+    """CdpBrowser que entrega FakeTab y cuenta los contextos abiertos."""
+
+    def __init__(self):
+        self.open = 0
+        self.peak = 0
+        self.tabs = []
+
+    async def new_context(self):
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        tab = FakeTab(self)
+        self.tabs.append(tab)
+        return tab
+
+
+async def registrar(tab, nombre):
+    page = AsyncProductoPage(tab)
+    await page.navigate(BASE_URL)
+    await page.fill_form(nombre=nombre, precio="10", stock="5", descripcion="Con queso")
+    if await page.submit_form() != "loaded":
+        return False
+    return await page.is_producto_registered()
+
+
+def run(coroutine):
+    return shared_loop().run(coroutine)
+
+
+# ==================== PAGE OBJECTS ====================
+
+def test_registro_aceptado():
+    assert run(registrar(FakeTab(), "Pizza")) is True
+
+
+def test_registro_rechazado_en_la_misma_url():
+    tab = FakeTab()
+    assert run(registrar(tab, None)) is False
+    assert tab.url == f"{BASE_URL}/Productos/Index"
+    errors = run(AsyncProductoPage(tab).get_validation_errors())
+    assert errors == {"nombre": "El nombre es obligatorio."}
+
+
+def test_fill_fields_informa_los_campos_que_faltan():
+    page = AsyncProductoPage(FakeTab())
+    with pytest.raises(NoSuchElementException, match="Producto.Foto"):
+        run(page.fill_fields({("name", "Producto.Foto"): "x"}))
+
+
+def test_is_element_visible_sin_elemento():
+    page = AsyncProductoPage(FakeTab())
+    assert run(page.is_element_visible(ProductoPage.ALERT_SUCCESS, timeout=0)) is False
+
+
+# ==================== EJECUCIÓN CONCURRENTE ====================
+
+def test_map_in_contexts_respeta_la_concurrencia_y_el_orden():
+    browser = FakeBrowser()
+    nombres = ["Pizza", None, "Empanada", "Tacos", None]
+    results = run(map_in_contexts(browser, registrar, nombres, concurrency=2))
+    assert results == [True, False, True, True, False]
+    assert browser.peak == 2
+    assert browser.open == 0 and all(tab.closed for tab in browser.tabs)
+
+
+def test_map_in_contexts_devuelve_la_excepcion_del_caso():
+    async def falla(tab, item):
+        if item == "roto":
+            raise ValueError(item)
+        return item
+
+    browser = FakeBrowser()
+    results = run(map_in_contexts(browser, falla, ["a", "roto"]))
+    assert results[0] == "a" and isinstance(results[1], ValueError)
+    assert browser.open == 0
+
+
+# ==================== API SÍNCRONA ====================
+
+def test_sync_page_envuelve_las_corrutinas():
+    page = SyncPage(AsyncProductoPage(FakeTab()), shared_loop())
+    page.navigate(BASE_URL)
+    page.fill_form(nombre="Pizza", precio="10", stock="5", descripcion="Con queso")
+    assert page.submit_form() == "loaded"
+    assert page.is_producto_registered() is True
+    assert page.VALIDATION_FIELDS is ProductoPage.VALIDATION_FIELDS
+    assert page.settle_timeout("alert") == 0
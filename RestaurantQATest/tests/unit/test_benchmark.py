@@ -0,0 +1,45 @@
+"""
+Pruebas unitarias de la comparación de escalado con la línea base (utils/benchmark.py).
+"""
+from utils.benchmark import route_result, scaling_exponent, scaling_regressions
+
+
+def sizes(medians):
+    return {n: {"median_ms": ms} for n, ms in medians.items()}
+
+
+# ==================== EXPONENTE ====================
+
+def test_scaling_exponent_constante_y_lineal():
+    assert scaling_exponent({10: 5.0, 100: 5.0, 1000: 5.0}) == 0
+    assert round(scaling_exponent({10: 1.0, 100: 10.0, 1000: 100.0}), 3) == 1
+
+
+def test_scaling_exponent_con_un_solo_tamano():
+    assert scaling_exponent({10: 3.0}) == 0
+
+
+# ==================== REGRESIONES ====================
+
+def test_sin_regresion_si_escala_igual():
+    baseline = route_result("/Productos/Index", sizes({10: 2.0, 100: 2.2, 1000: 2.5}))
+    result = route_result("/Productos/Index", sizes({10: 4.0, 100: 4.4, 1000: 5.0}))
+    assert scaling_regressions(result, baseline) == []
+
+
+def test_regresion_si_pasa_a_escalar_lineal():
+    baseline = route_result("/Productos/Index", sizes({10: 2.0, 100: 2.2, 1000: 2.5}))
+    result = route_result("/Productos/Index", sizes({10: 2.0, 100: 20.0, 1000: 200.0}))
+    regressions = scaling_regressions(result, baseline)
+    assert any("exponente" in message for message in regressions)
+    assert any("1000 filas" in message for message in regressions)
+
+
+def test_compara_el_exponente_en_los_tamanos_comunes():
+    # La línea base incluye 100k filas, donde la página se degrada; sin --bench-large
+    # se miden solo los tamaños chicos y se comparan con los mismos tamaños
+    baseline = route_result("/Clientes/Index",
+                            sizes({10: 2.0, 100: 2.0, 1000: 2.0, 100000: 200.0}))
+    result = route_result("/Clientes/Index", sizes({10: 2.0, 100: 2.0, 1000: 20.0}))
+    [message, *_] = scaling_regressions(result, baseline)
+    assert "línea base 0.0" in message
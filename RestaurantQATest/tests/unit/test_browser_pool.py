@@ -0,0 +1,111 @@
+"""
+Pruebas unitarias de la medición de memoria y el reciclado del pool de
+navegadores (utils/browser_pool.py), con procesos reales en lugar de Chrome.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils import browser_pool
+from utils.browser_pool import BrowserPool, driver_pid, process_tree_memory
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(browser_pool.PROC_DIR) and browser_pool.psutil is None,
+                                reason="Sin /proc ni psutil no se mide la memoria")
+
+
+@pytest.fixture
+def process_tree():
+    """Proceso hijo con un nieto, como chromedriver y Chrome."""
+    parent = subprocess.Popen([sys.executable, "-c",
+                               "import subprocess, sys, time; "
+                               "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+                               "time.sleep(60)"])
+    time.sleep(0.5)
+    yield parent
+    for pid in _descendants(parent.pid):
+        try:
+            os.kill(pid, 9)
+        except OSError:
+            pass
+    parent.kill()
+    parent.wait()
+
+
+def _descendants(pid):
+    children = browser_pool._proc_children() if os.path.isdir(browser_pool.PROC_DIR) else {}
+    found, pending = [], list(children.get(pid, ()))
+    while pending:
+        found.append(pending.pop())
+        pending.extend(children.get(found[-1], ()))
+    return found
+
+
+# ==================== MEMORIA ====================
+
+def test_process_tree_memory_suma_los_descendientes(process_tree):
+    total = process_tree_memory(process_tree.pid)
+    alone = browser_pool._proc_memory(process_tree.pid)
+    assert alone > 0
+    assert total > alone
+
+
+def test_process_tree_memory_de_un_proceso_terminado():
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    assert not process_tree_memory(finished.pid)
+
+
+# ==================== RECICLADO ====================
+
+class FakeDriver:
+    """WebDriver local mínimo: una ventana y un servicio con su proceso."""
+
+    def __init__(self, process):
+        self.service = type("Service", (), {"process": process})()
+        self.current_window_handle = "inicio"
+        self.window_handles = ["inicio"]
+        self.switch_to = self
+        self.quitted = False
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script, *args):
+        return None
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quitted = True
+
+
+def test_release_recicla_si_supera_el_umbral(process_tree):
+    created = []
+
+    def factory():
+        created.append(FakeDriver(process_tree))
+        return created[-1]
+
+    pool = BrowserPool(factory, size=1, max_memory_mb=0)
+    pool.start()
+    with pool.lease() as driver:
+        assert driver_pid(driver) == process_tree.pid
+    replacement = pool.acquire(timeout=5)
+    assert replacement is not driver and len(created) == 2
+    pool.close()
+
+
+def test_release_conserva_el_navegador_bajo_el_umbral(process_tree):
+    pool = BrowserPool(lambda: FakeDriver(process_tree), size=1, max_memory_mb=10 ** 6)
+    pool.start()
+    with pool.lease() as driver:
+        pass
+    assert pool.acquire(timeout=5) is driver
+    pool.close()
@@ -0,0 +1,239 @@
+"""
+Pruebas unitarias del cliente CDP (utils/cdp_client.py) y de los contextos de
+navegador (utils/browser_context.py) contra un endpoint de DevTools simulado.
+"""
+import json
+import socket
+
+import pytest
+from aiohttp import web
+from selenium.common.exceptions import JavascriptException
+
+from utils.browser_context import BrowserContextError, BrowserContexts, ISOLATED, RESET, SHARED
+from utils.cdp_client import CdpBrowser, CdpError, debugger_address, shared_loop
+
+
+# ==================== DEVTOOLS SIMULADO ====================
+
+class FakeDevTools:
+    """Endpoint /json/version y websocket del navegador con respuestas fijas."""
+
+    def __init__(self):
+        self.calls = []
+        self.sessions = []
+        self.targets = []
+        self._ids = 0
+        self._runner = None
+        self.address = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/json/version", self._version)
+        app.router.add_get("/devtools/browser/fake", self._websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.address = "127.0.0.1:%d" % site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    async def _version(self, request):
+        return web.json_response({"webSocketDebuggerUrl": f"ws://{request.host}/devtools/browser/fake"})
+
+    async def _websocket(self, request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        async for frame in websocket:
+            message = json.loads(frame.data)
+            self.calls.append((message["method"], message["params"]))
+            self.sessions.append(message.get("sessionId"))
+            reply = self._reply(message)
+            if reply is not None:
+                await websocket.send_str(json.dumps(dict(reply, id=message["id"])))
+        return websocket
+
+    def _reply(self, message):
+        self._ids += 1
+        method = message["method"]
+        if method == "Target.createBrowserContext":
+            return {"result": {"browserContextId": f"C{self._ids}"}}
+        if method == "Target.createTarget":
+            self.targets.append(f"T{self._ids}")
+            return {"result": {"targetId": f"T{self._ids}"}}
+        if method == "Target.attachToTarget":
+            return {"result": {"sessionId": f"S{self._ids}"}}
+        if method == "Runtime.evaluate":
+            if "throw" in message["params"]["expression"]:
+                return {"result": {"exceptionDetails": {"text": "Uncaught",
+                                                        "exception": {"description": "Error: roto"}}}}
+            return {"result": {"result": {"type": "string", "value": "listo"}}}
+        if method == "Page.navigate":
+            if "caida" in message["params"]["url"]:
+                return {"result": {"errorText": "net::ERR_CONNECTION_REFUSED"}}
+            return {"result": {"frameId": "F"}}
+        if method == "Prueba.error":
+            return {"error": {"code": -32000, "message": "Not allowed"}}
+        if method == "Prueba.silencio":
+            return None
+        return {"result": {}}
+
+
+class FakeDriver:
+    """WebDriver mínimo: handles de ventana y capabilities de Chrome."""
+
+    def __init__(self, address, devtools):
+        self.capabilities = {"goog:chromeOptions": {"debuggerAddress": address}}
+        self.current_window_handle = "inicio"
+        self.switch_to = self
+        self._devtools = devtools
+
+    @property
+    def window_handles(self):
+        return ["inicio"] + self._devtools.targets
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+
+@pytest.fixture(scope="module")
+def devtools():
+    server = FakeDevTools()
+    shared_loop().run(server.start())
+    yield server
+    shared_loop().run(server.stop())
+
+
+@pytest.fixture
+def browser(devtools):
+    devtools.calls.clear()
+    browser = shared_loop().run(CdpBrowser.connect(devtools.address))
+    yield browser
+    shared_loop().run(browser.close())
+
+
+def closed_port_address():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return "127.0.0.1:%d" % s.getsockname()[1]
+
+
+# ==================== CLIENTE CDP ====================
+
+def test_debugger_address():
+    assert debugger_address(FakeDriver("127.0.0.1:9222", FakeDevTools())) == "127.0.0.1:9222"
+    with pytest.raises(CdpError):
+        debugger_address(FakeDriver(None, FakeDevTools()))
+
+
+def test_crea_y_descarta_contextos(devtools, browser):
+    loop = shared_loop()
+    context_id = loop.run(browser.create_context(dispose_on_detach=False))
+    target_id = loop.run(browser.create_target(context_id))
+    loop.run(browser.dispose_context(context_id))
+    assert target_id in devtools.targets
+    assert devtools.calls == [
+        ("Target.createBrowserContext", {"disposeOnDetach": False}),
+        ("Target.createTarget", {"url": "about:blank", "browserContextId": context_id}),
+        ("Target.disposeBrowserContext", {"browserContextId": context_id}),
+    ]
+
+
+def test_send_convierte_el_error_del_navegador(browser):
+    with pytest.raises(CdpError, match="Not allowed"):
+        shared_loop().run(browser.connection.send("Prueba.error"))
+
+
+def test_send_sin_respuesta_agota_el_timeout(browser):
+    with pytest.raises(CdpError, match="sin respuesta"):
+        shared_loop().run(browser.connection.send("Prueba.silencio", timeout=0.1))
+
+
+def test_send_con_la_conexion_cerrada(browser):
+    loop = shared_loop()
+    loop.run(browser.connection.close())
+    with pytest.raises(CdpError):
+        loop.run(browser.connection.send("Target.getTargets", timeout=1))
+
+
+def test_connect_sin_devtools():
+    with pytest.raises(CdpError, match="No se pudo conectar con DevTools"):
+        shared_loop().run(CdpBrowser.connect(closed_port_address()))
+
+
+# ==================== PESTAÑAS ====================
+
+def test_new_context_abre_una_sesion_en_un_contexto_nuevo(devtools, browser):
+    context = shared_loop().run(browser.new_context())
+    methods = [method for method, _ in devtools.calls]
+    assert methods == ["Target.createBrowserContext", "Target.createTarget", "Target.attachToTarget"]
+    assert devtools.calls[2][1]["flatten"] is True
+    assert context.session_id.startswith("S")
+    shared_loop().run(context.close())
+    assert devtools.calls[-1] == ("Target.disposeBrowserContext",
+                                  {"browserContextId": context.context_id})
+
+
+def test_execute_script_con_la_convencion_de_webdriver(devtools, browser):
+    loop = shared_loop()
+    context = loop.run(browser.new_context())
+    assert loop.run(context.execute_script("return arguments[0];", "a", 1)) == "listo"
+    method, params = devtools.calls[-1]
+    assert method == "Runtime.evaluate" and devtools.sessions[-1] == context.session_id
+    assert params["expression"].endswith('.apply(null, ["a", 1])')
+    assert params["awaitPromise"] and params["returnByValue"]
+    with pytest.raises(JavascriptException, match="roto"):
+        loop.run(context.execute_script("throw new Error('roto');"))
+    loop.run(context.close())
+
+
+def test_navigate_informa_el_error_de_red(browser):
+    loop = shared_loop()
+    context = loop.run(browser.new_context())
+    loop.run(context.navigate("http://127.0.0.1/ok"))
+    with pytest.raises(CdpError, match="ERR_CONNECTION_REFUSED"):
+        loop.run(context.navigate("http://caida/"))
+    loop.run(context.close())
+
+
+# ==================== CONTEXTOS DE NAVEGADOR ====================
+
+def test_contexto_aislado_se_descarta_al_salir(devtools):
+    devtools.calls.clear()
+    driver = FakeDriver(devtools.address, devtools)
+    contexts = BrowserContexts(driver)
+    assert contexts.enter(ISOLATED) == ISOLATED
+    context_id, handle = contexts.current
+    assert driver.current_window_handle == handle
+    contexts.exit()
+    assert driver.current_window_handle == "inicio"
+    assert contexts.current is None
+    assert devtools.calls[-1] == ("Target.disposeBrowserContext", {"browserContextId": context_id})
+    contexts.close()
+
+
+def test_contexto_compartido_se_reutiliza(devtools):
+    contexts = BrowserContexts(FakeDriver(devtools.address, devtools))
+    contexts.enter(SHARED)
+    shared = contexts.shared
+    contexts.exit()
+    contexts.enter(SHARED)
+    assert contexts.shared == shared
+    assert contexts.keep_handles() == {"inicio", shared[1]}
+    contexts.exit()
+    contexts.close()
+    assert contexts.shared is None
+
+
+def test_reset_no_crea_contextos(devtools):
+    devtools.calls.clear()
+    contexts = BrowserContexts(FakeDriver(devtools.address, devtools))
+    assert contexts.enter(RESET) == RESET
+    assert devtools.calls == []
+
+
+def test_sin_devtools_falla_con_browser_context_error(devtools):
+    contexts = BrowserContexts(FakeDriver(closed_port_address(), devtools))
+    with pytest.raises(BrowserContextError, match="--browser-context=reset"):
+        contexts.enter(ISOLATED)
@@ -0,0 +1,59 @@
+"""
+Pruebas unitarias de los reintentos y la cuarentena (utils/flaky.py).
+"""
+from utils.flaky import FAILED, FLAKY, PASSED, flakiness, history_key, quarantined_cases
+
+
+# ==================== PUNTAJE DE INESTABILIDAD ====================
+
+def test_flakiness_estable():
+    assert flakiness([PASSED] * 5) == 0
+    assert flakiness([FAILED] * 5) == 0
+
+
+def test_flakiness_cuenta_cambios_entre_pasar_y_fallar():
+    assert flakiness([PASSED, FAILED, PASSED, FAILED]) == 3
+
+
+def test_flakiness_cuenta_los_que_pasaron_al_reintentar():
+    # FLAKY cuenta como pasada para los cambios y suma por sí mismo
+    assert flakiness([PASSED, FLAKY, PASSED]) == 1
+    assert flakiness([FAILED, FLAKY]) == 2
+
+
+def test_flakiness_sin_ejecuciones():
+    assert flakiness([]) == 0
+
+
+# ==================== CUARENTENA ====================
+
+def test_quarantined_cases_usa_el_umbral():
+    history = {
+        "test_registro_producto[PR1]": {"nodeid": "a", "runs": [PASSED, FAILED, PASSED, FAILED]},
+        "test_registro_producto[PR2]": {"nodeid": "b", "runs": [PASSED, FAILED]},
+        "test_registro_producto[PR3]": {"nodeid": "c", "runs": [FAILED] * 4},
+    }
+    quarantined = quarantined_cases(history, window=10, threshold=3)
+    assert list(quarantined) == ["test_registro_producto[PR1]"]
+    assert quarantined["test_registro_producto[PR1]"] == {"runs": 4, "passed": 2, "flaky": 0, "score": 3}
+
+
+def test_quarantined_cases_solo_mira_la_ventana():
+    runs = [PASSED, FAILED, PASSED, FAILED] + [PASSED] * 5
+    history = {"caso": {"nodeid": "a", "runs": runs}}
+    assert quarantined_cases(history, window=5, threshold=1) == {}
+    assert "caso" in quarantined_cases(history, window=9, threshold=3)
+
+
+# ==================== CLAVES ====================
+
+def test_history_key_separa_la_version_secuencial_de_la_de_pestanas():
+    secuencial = history_key("PR3", "tests/test_productos.py::test_registro_producto[PR3]")
+    pestanas = history_key("PR3", "tests/test_pestanas.py::test_producto_en_pestana[PR3]")
+    assert secuencial == "test_registro_producto[PR3]"
+    assert pestanas == "test_producto_en_pestana[PR3]"
+
+
+def test_history_key_sin_caso_usa_el_nodeid():
+    nodeid = "tests/test_clientes.py::test_nombre_vacio"
+    assert history_key(None, nodeid) == nodeid
@@ -0,0 +1,56 @@
+"""
+Pruebas unitarias de los criterios de registro que comparten los Page Objects
+síncronos, asíncronos, HTTP y los flujos por pestaña.
+"""
+from pages.cliente_page import ClientePage
+from pages.producto_page import ProductoPage
+from pages.repartidor_page import RepartidorPage
+
+BASE_URL = "http://localhost:5000"
+
+
+# ==================== PRODUCTOS Y REPARTIDORES ====================
+
+def test_producto_registrado_solo_con_redireccion_al_indice():
+    url = f"{BASE_URL}/Productos/Index"
+    assert ProductoPage.registered_after_submit(url, redirected=True, has_errors=False)
+    assert ProductoPage.registered_after_submit(f"{BASE_URL}/Productos", True, False)
+    # Modelo inválido: Page() en la misma URL, sin redirección
+    assert not ProductoPage.registered_after_submit(url, redirected=False, has_errors=False)
+    assert not ProductoPage.registered_after_submit(url, redirected=True, has_errors=True)
+    assert not ProductoPage.registered_after_submit(f"{BASE_URL}/Productos/Create", True, False)
+
+
+def test_repartidor_registrado_al_volver_al_indice():
+    assert RepartidorPage.registered_after_submit(f"{BASE_URL}/Repartidores/Index")
+    assert RepartidorPage.registered_after_submit(f"{BASE_URL}/Repartidores")
+    assert not RepartidorPage.registered_after_submit(f"{BASE_URL}/Repartidores/Create")
+
+
+# ==================== BÚSQUEDA DE CLIENTES ====================
+
+def test_busqueda_de_cliente_recorre_las_paginas():
+    search = ClientePage.registration_search(BASE_URL, "Ana", "Pérez")
+    visited = []
+    tables = [
+        ([["Ana", "Gómez"]], 3),
+        ([["ana", "PÉREZ"]], 3),
+    ]
+    while search.next_url:
+        visited.append(search.next_url)
+        search.read(*tables.pop(0))
+
+    assert search.found
+    # Se detiene al encontrarlo, sin pedir la tercera página
+    assert visited == [ClientePage.index_url(BASE_URL, "Ana", 1), ClientePage.index_url(BASE_URL, "Ana", 2)]
+
+
+def test_busqueda_de_cliente_sin_resultados():
+    search = ClientePage.registration_search(BASE_URL, "Ana", "Pérez")
+    pages = 0
+    while search.next_url:
+        pages += 1
+        search.read([], 1)
+
+    assert pages == 1
+    assert not search.found
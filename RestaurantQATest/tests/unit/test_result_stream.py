@@ -0,0 +1,70 @@
+"""
+Pruebas unitarias del destino de los resultados (utils/result_stream.py).
+"""
+import os
+
+from utils.result_stream import _details, auxiliary_only, point_latest, prune_runs, run_directory
+
+
+# ==================== RUTAS PEDIDAS ====================
+
+def test_auxiliary_only_con_tests_unitarios_y_benchmarks(tmp_path):
+    assert auxiliary_only(["tests/unit"], tmp_path, tmp_path)
+    assert auxiliary_only(["tests/unit/test_flaky.py::test_x", "benchmarks"], tmp_path, tmp_path)
+    # Invocado desde dentro de tests/
+    assert auxiliary_only(["unit"], tmp_path / "tests", tmp_path)
+
+
+def test_auxiliary_only_con_la_suite_funcional(tmp_path):
+    assert not auxiliary_only(["tests"], tmp_path, tmp_path)
+    assert not auxiliary_only(["tests/unit", "tests/test_clientes.py"], tmp_path, tmp_path)
+    assert not auxiliary_only(["tests/unitarios"], tmp_path, tmp_path)
+    assert not auxiliary_only([], tmp_path, tmp_path)
+
+
+# ==================== EJECUCIONES ====================
+
+def test_point_latest_reemplaza_el_enlace(tmp_path):
+    first = run_directory(str(tmp_path / "runs")) + "-a"
+    second = run_directory(str(tmp_path / "runs")) + "-b"
+    for directory in (first, second):
+        os.makedirs(directory)
+        open(os.path.join(directory, "report.html"), "w").close()
+    link = str(tmp_path / "latest")
+
+    point_latest(first, link)
+    point_latest(second, link)
+
+    assert os.path.realpath(link) == os.path.realpath(second)
+    assert os.path.exists(os.path.join(link, "report.html"))
+    assert sorted(os.listdir(tmp_path)) == ["latest", "runs"]
+
+
+def test_prune_runs_conserva_las_ultimas(tmp_path):
+    for name in ("20260101-000000-1", "20260102-000000-1", "20260103-000000-1"):
+        os.makedirs(tmp_path / name)
+
+    prune_runs(str(tmp_path), keep=2)
+
+    assert sorted(os.listdir(tmp_path)) == ["20260102-000000-1", "20260103-000000-1"]
+
+
+def test_prune_runs_sin_directorio(tmp_path):
+    prune_runs(str(tmp_path / "runs"), keep=2)
+
+
+# ==================== REPORTE HTML ====================
+
+def test_details_muestra_los_comandos_webdriver_como_tabla():
+    summary = {
+        "commands": 3, "ms": 12.5,
+        "by_method": {"ClientePage.fill_form": {"count": 3, "ms": 12.5}},
+        "by_command": {"findElement": {"count": 2, "ms": 8}, "sendKeysToElement": {"count": 1, "ms": 4.5}},
+    }
+    details = _details({"properties": {"webdriver_commands": summary, "element_cache": {"hits": 1}}})
+
+    assert "<td>ClientePage.fill_form</td><td>3</td><td>12.5</td>" in details
+    assert "<td>findElement</td><td>2</td><td>8</td>" in details
+    # Las demás propiedades siguen en el bloque JSON, sin los comandos
+    assert "element_cache" in details
+    assert "webdriver_commands" not in details
@@ -0,0 +1,54 @@
+"""
+Pruebas unitarias de la planificación por duración (utils/scheduler.py).
+"""
+from utils.scheduler import DEFAULT_DURATION, estimate, pack, prune_durations
+
+
+# ==================== ESTIMACIÓN ====================
+
+def test_estimate_usa_el_historial():
+    durations = {"a": 3.0, "b": 1.0}
+    assert estimate(["a", "b"], durations) == {"a": 3.0, "b": 1.0}
+
+
+def test_estimate_sin_historial_usa_la_mediana_de_los_conocidos():
+    durations = {"a": 1.0, "b": 2.0, "c": 9.0, "otro": 100.0}
+    assert estimate(["a", "b", "c", "nuevo"], durations)["nuevo"] == 2.0
+
+
+def test_estimate_sin_ningun_historial_usa_el_valor_por_defecto():
+    assert estimate(["a", "b"], {}) == {"a": DEFAULT_DURATION, "b": DEFAULT_DURATION}
+
+
+# ==================== BIN PACKING ====================
+
+def test_pack_equilibra_la_carga():
+    weights = {"a": 5, "b": 4, "c": 3, "d": 3, "e": 3}
+    groups = pack(list(weights), weights, 2)
+    loads = sorted(sum(weights[n] for n in group) for group in groups)
+    assert loads == [8, 10]
+    assert sorted(n for group in groups for n in group) == sorted(weights)
+
+
+def test_pack_ordena_cada_grupo_de_mayor_a_menor():
+    weights = {"a": 1, "b": 7, "c": 2, "d": 5}
+    for group in pack(list(weights), weights, 2):
+        assert [weights[n] for n in group] == sorted((weights[n] for n in group), reverse=True)
+
+
+def test_pack_es_determinista_con_empates():
+    weights = {n: 1.0 for n in "dcba"}
+    assert pack(list(weights), weights, 2) == [["a", "c"], ["b", "d"]]
+    assert pack(list(reversed(list(weights))), weights, 2) == [["a", "c"], ["b", "d"]]
+
+
+def test_pack_con_mas_grupos_que_elementos():
+    assert pack(["a"], {"a": 1.0}, 3) == [["a"], [], []]
+
+
+# ==================== HISTORIAL ====================
+
+def test_prune_durations_descarta_los_tests_inactivos():
+    history = {"viejo": 1.0, "reciente": 2.0, "sin_dato": 3.0}
+    last_seen = {"viejo": 1, "reciente": 40}
+    assert prune_durations(history, last_seen, run=41, max_idle=30) == {"reciente": 2.0, "sin_dato": 3.0}
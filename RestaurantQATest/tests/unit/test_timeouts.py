@@ -0,0 +1,119 @@
+"""
+Pruebas unitarias de los timeouts aprendidos (utils/timeouts.py) y de su
+registro desde las esperas (utils/wait_policy.py).
+"""
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from utils.timeouts import (
+    MARGIN_FACTOR, MARGIN_SECONDS, MIN_SAMPLES, SAMPLE_LIMIT, TimeoutService,
+    current_service, history_key, learned_timeout, use_service
+)
+from utils.wait_policy import WaitPolicy
+
+ROUTE = "/Productos/Index"
+
+
+# ==================== TIMEOUT APRENDIDO ====================
+
+def test_learned_timeout_sin_muestras_suficientes():
+    assert learned_timeout([]) is None
+    assert learned_timeout([0.1] * (MIN_SAMPLES - 1)) is None
+
+
+def test_learned_timeout_percentil_con_margen():
+    assert learned_timeout([1.0] * MIN_SAMPLES) == round(1.0 * MARGIN_FACTOR + MARGIN_SECONDS, 2)
+
+
+def test_learned_timeout_sigue_la_cola_alta():
+    fast = learned_timeout([0.2] * 100)
+    slow = learned_timeout([0.2] * 90 + [2.0] * 10)
+    assert slow > fast
+
+
+# ==================== SERVICIO ====================
+
+def test_timeout_sin_ruta_usa_el_techo():
+    service = TimeoutService(history={history_key(ROUTE, "page"): [0.1] * MIN_SAMPLES})
+    assert service.timeout("page") == service.ceiling("page")
+
+
+def test_timeout_usa_el_valor_aprendido_por_ruta():
+    service = TimeoutService(history={history_key(ROUTE, "page"): [0.1] * MIN_SAMPLES})
+    assert service.timeout("page", ROUTE) == learned_timeout([0.1] * MIN_SAMPLES)
+    assert service.timeout("page", "/Clientes/Create") == service.ceiling("page")
+
+
+def test_timeout_no_pasa_el_techo():
+    service = TimeoutService({"page": 2}, {history_key(ROUTE, "page"): [30.0] * MIN_SAMPLES})
+    assert service.timeout("page", ROUTE) == 2
+
+
+def test_timeout_no_adaptativo_ni_estatico():
+    history = {history_key(ROUTE, "page"): [0.1] * MIN_SAMPLES,
+               history_key(ROUTE, "implicit"): [0.1] * MIN_SAMPLES}
+    assert TimeoutService(history=history, adaptive=False).timeout("page", ROUTE) == 10
+    assert TimeoutService({"implicit": 3}, history).timeout("implicit", ROUTE) == 3
+
+
+def test_merged_history_agrega_y_recorta():
+    key = history_key(ROUTE, "page")
+    other = history_key(ROUTE, "alert")
+    service = TimeoutService(history={key: [1.0] * SAMPLE_LIMIT, other: [0.5]})
+    service.record("page", ROUTE, 2.0)
+    service.record("element", ROUTE, 0.3)
+    service.record("implicit", ROUTE, 9.0)
+    merged = service.merged_history()
+    assert len(merged[key]) == SAMPLE_LIMIT and merged[key][-1] == 2.0
+    assert merged[history_key(ROUTE, "element")] == [0.3]
+    assert merged[other] == [0.5]
+    assert history_key(ROUTE, "implicit") not in merged
+    assert service.history[key] == [1.0] * SAMPLE_LIMIT
+
+
+def test_merge_suma_lo_exportado_por_un_worker():
+    worker = TimeoutService()
+    worker.record("page", ROUTE, 1.0)
+    worker.fallback("page", ROUTE, 0.5)
+    service = TimeoutService()
+    service.merge(worker.export())
+    assert service.samples[history_key(ROUTE, "page")] == [1.0]
+    assert service.fallbacks[history_key(ROUTE, "page")] == 1
+
+
+# ==================== REGISTRO DESDE LAS ESPERAS ====================
+
+@pytest.fixture
+def service():
+    previous = current_service()
+    service = TimeoutService({"visible": 0.1, "element": 0.1})
+    use_service(service)
+    yield service
+    use_service(previous)
+
+
+def policy():
+    waits = WaitPolicy(driver=None)
+    waits.route = ROUTE
+    return waits
+
+
+def test_until_registra_la_espera_cumplida(service):
+    assert policy().until(lambda d: "listo", "element") == "listo"
+    assert len(service.samples[history_key(ROUTE, "element")]) == 1
+
+
+def test_until_registra_la_consulta_agotada_como_censurada(service):
+    with pytest.raises(TimeoutException):
+        policy().until(lambda d: False, "visible", probe=True)
+    [sample] = service.samples[history_key(ROUTE, "visible")]
+    assert sample >= 0.1
+
+
+def test_until_no_registra_errores_de_la_condicion(service):
+    def broken(driver):
+        raise ValueError("condición rota")
+
+    with pytest.raises(ValueError):
+        policy().until(broken, "element")
+    assert not service.samples
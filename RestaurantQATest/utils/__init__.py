@@ -0,0 +1,4 @@
+"""
+Módulo de inicialización del paquete utils.
+Contiene la infraestructura de soporte compartida por los tests.
+"""
@@ -0,0 +1,277 @@
+"""
+Artefactos de diagnóstico solo para los tests que fallan.
+Durante el test se mantienen buffers circulares baratos:
+- en el navegador, un script inyectado por CDP guarda en sessionStorage una
+  marca por cada documento cargado y formulario enviado (URL, título, acción;
+  sin serializar el DOM) y los mensajes de consola y errores de JavaScript,
+  sin comandos WebDriver;
+- en Python, CommandRecorder guarda los últimos comandos WebDriver.
+Solo si el test falla se toma una captura de pantalla y el HTML actual y se
+escribe todo en un zip comprimido. El directorio tiene un tamaño máximo: al
+superarlo se eliminan los zips más antiguos (nunca el que se acaba de escribir).
+"""
+import json
+import os
+import re
+import time
+import uuid
+import zipfile
+from contextlib import contextmanager
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils.command_metrics import RECORDER_KEY
+from utils.data_loader import case_id
+
+
+ARTIFACTS_KEY = pytest.StashKey()
+DEFAULT_DIR = os.path.join("reports", "artifacts")
+
+# Mensajes de consola que se conservan por test
+CONSOLE_LIMIT = 200
+
+# Buffers circulares en sessionStorage: se ejecuta al inicio de cada documento.
+# %(key)s, %(limit)s y %(console)s se reemplazan al inyectarlo
+BUFFER_SCRIPT = """
+(function () {
+    var navigationKey = '%(key)s.navigation', consoleKey = '%(key)s.console';
+    function push(key, item, max) {
+        try {
+            var list = JSON.parse(sessionStorage.getItem(key) || '[]');
+            list.push(item);
+            while (list.length > max) { list.shift(); }
+            sessionStorage.setItem(key, JSON.stringify(list));
+        } catch (e) {}
+    }
+    function mark(reason, detail) {
+        push(navigationKey, {time: Date.now(), url: location.href, reason: reason,
+                             detail: detail}, %(limit)s);
+    }
+    function log(level, text) {
+        push(consoleKey, {time: Date.now(), url: location.href, level: level, text: text}, %(console)s);
+    }
+    ['log', 'info', 'warn', 'error'].forEach(function (level) {
+        var original = console[level];
+        console[level] = function () {
+            log(level, Array.prototype.map.call(arguments, String).join(' '));
+            return original.apply(console, arguments);
+        };
+    });
+    window.addEventListener('error', function (e) {
+        log('uncaught', e.message + ' (' + e.filename + ':' + e.lineno + ')');
+    });
+    document.addEventListener('DOMContentLoaded', function () { mark('load', document.title); });
+    document.addEventListener('submit', function (e) {
+        var action = e.target.getAttribute('action') || location.pathname;
+        mark('submit', action);
+        // La validación del cliente cancela el envío sin cargar otro documento
+        setTimeout(function () { if (e.defaultPrevented) { mark('submit-cancelled', action); } }, 0);
+    }, true);
+})();
+"""
+
+# Lee los buffers del documento actual (null si su origen no tiene sessionStorage)
+READ_BUFFERS_SCRIPT = """
+try {
+    return {navigation: JSON.parse(sessionStorage.getItem(arguments[0] + '.navigation') || '[]'),
+            console: JSON.parse(sessionStorage.getItem(arguments[0] + '.console') || '[]')};
+} catch (e) {
+    return null;
+}
+"""
+
+
+class ArtifactBuffer:
+    """
+    Buffers de un test en un navegador: registra el script en la pestaña y,
+    si el test falla, reúne los artefactos.
+    """
+
+    def __init__(self, driver, navigations=20):
+        """
+        Args:
+            driver: WebDriver prestado al test
+            navigations: Marcas de navegación que se conservan
+        """
+        self.driver = driver
+        self.key = f"__qaArtifacts.{uuid.uuid4().hex}"
+        self.navigations = navigations
+        self.script_id = None
+
+    def start(self):
+        """Inyecta el script de los buffers en los documentos que se carguen."""
+        source = BUFFER_SCRIPT % {"key": self.key, "limit": self.navigations,
+                                  "console": CONSOLE_LIMIT}
+        try:
+            self.script_id = self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+            )["identifier"]
+        except WebDriverException:
+            self.script_id = None  # sin CDP solo habrá captura, HTML y comandos
+
+    def stop(self):
+        """Quita el script para que no siga activo si la pestaña se reutiliza."""
+        if self.script_id is None:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                        {"identifier": self.script_id})
+        except WebDriverException:
+            pass
+        self.script_id = None
+
+    def collect(self):
+        """
+        Reúne los artefactos del estado actual del navegador.
+
+        Returns:
+            dict: {nombre de archivo: contenido (bytes o str)}
+        """
+        files = {}
+        for name, read in (("screenshot.png", self.driver.get_screenshot_as_png),
+                           ("page.html", lambda: self.driver.page_source),
+                           ("url.txt", lambda: self.driver.current_url)):
+            try:
+                files[name] = read()
+            except WebDriverException as e:
+                files[f"{name}.error.txt"] = e.msg or str(e)
+        try:
+            buffers = self.driver.execute_script(READ_BUFFERS_SCRIPT, self.key)
+        except WebDriverException:
+            buffers = None
+        if buffers:
+            files["navigation.log"] = "\n".join(
+                f"{entry['time']} [{entry['reason']}] {entry['url']}: {entry['detail']}"
+                for entry in buffers["navigation"]
+            )
+            files["console.log"] = "\n".join(
+                f"{entry['time']} [{entry['level']}] {entry['url']}: {entry['text']}"
+                for entry in buffers["console"]
+            )
+        return files
+
+
+@contextmanager
+def capture_artifacts(item, driver):
+    """
+    Mantiene los buffers de artefactos del driver durante un test.
+
+    Args:
+        item: Item de pytest del test en ejecución
+        driver: WebDriver prestado al test
+    """
+    directory = item.config.getoption("--artifacts-dir")
+    if not directory:
+        yield
+        return
+    buffer = ArtifactBuffer(driver, item.config.getoption("--artifacts-navigations"))
+    buffer.start()
+    item.stash[ARTIFACTS_KEY] = buffer
+    try:
+        yield
+    finally:
+        buffer.stop()
+
+
+# ==================== ESCRITURA Y LÍMITE DE DISCO ====================
+
+def artifact_name(nodeid):
+    """Nombre de archivo seguro para un test (ej. 'test_productos.py-test_registro_producto-PR3')."""
+    name = re.sub(r"[^\w.-]+", "-", nodeid.split("/")[-1]).strip("-")
+    return f"{name[:150]}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}.zip"
+
+
+def write_zip(path, files):
+    """
+    Escribe los artefactos comprimidos de forma atómica.
+
+    Args:
+        path: Archivo zip destino
+        files: {nombre: bytes o str}
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    os.replace(tmp_path, path)
+
+
+def enforce_cap(directory, max_bytes, keep=None):
+    """
+    Elimina los zips más antiguos hasta que el directorio no supere max_bytes.
+    Tolera que otro worker de xdist borre los mismos archivos a la vez.
+
+    Args:
+        directory: Directorio de artefactos
+        max_bytes: Tamaño máximo
+        keep: Zip que nunca se elimina (el recién escrito), aunque solo él supere el límite
+
+    Returns:
+        list: Archivos eliminados
+    """
+    keep = os.path.abspath(keep) if keep else None
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".zip"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    evicted = []
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) == keep:
+            continue
+        try:
+            os.remove(path)
+            evicted.append(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+    return evicted
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--artifacts-dir", default=DEFAULT_DIR, metavar="PATH",
+        help="Directorio de los zips de diagnóstico de tests fallidos (vacío para desactivarlos)"
+    )
+    group.addoption(
+        "--artifacts-max-mb", type=float, default=200,
+        help="Tamaño máximo del directorio de artefactos; se eliminan los más antiguos"
+    )
+    group.addoption(
+        "--artifacts-navigations", type=int, default=20,
+        help="Marcas de navegación (documentos cargados y envíos) que se conservan por test"
+    )
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    # tryfirst: se ejecuta después de que otros plugins (presupuestos de
+    # comandos) marquen el test como fallido
+    outcome = yield
+    report = outcome.get_result()
+    buffer = item.stash.get(ARTIFACTS_KEY, None)
+    if buffer is None or not report.failed or report.when not in ("setup", "call"):
+        return
+
+    files = buffer.collect()
+    recorder = item.stash.get(RECORDER_KEY, None)
+    if recorder is not None:
+        files["commands.json"] = json.dumps(list(recorder.recent), indent=1, ensure_ascii=False)
+    files["failure.txt"] = f"{item.nodeid}\ncaso: {case_id(item)}\n\n{report.longreprtext}"
+
+    directory = item.config.getoption("--artifacts-dir")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, artifact_name(item.nodeid))
+    write_zip(path, files)
+    enforce_cap(directory, item.config.getoption("--artifacts-max-mb") * 1024 * 1024, keep=path)
+    report.user_properties.append(("artifacts", path))
@@ -0,0 +1,235 @@
+"""
+Utilidades de los benchmarks de latencia de las páginas Index.
+Genera filas sintéticas válidas, mide una operación varias veces (al estilo de
+pytest-benchmark: calentamiento, mínimo de rondas y tiempo máximo), resume las
+muestras y compara la forma en que crece la latencia con una línea base JSON.
+"""
+import json
+import math
+import os
+import statistics
+import string
+import time
+
+from utils.load_generator import percentile
+
+
+# Clave de una línea base con su origen: {'target': 'app'|'stub', 'description': ...}
+META_KEY = "_meta"
+
+# Pendiente máxima adicional, respecto de la línea base, del ajuste log-log
+# latencia vs. filas (0 = constante, 1 = lineal)
+DEFAULT_EXPONENT_TOLERANCE = 0.2
+
+# Aumento relativo máximo de latencia(N) / latencia(N mínimo) respecto de la línea base
+DEFAULT_GROWTH_TOLERANCE = 0.5
+
+
+# ==================== FILAS SINTÉTICAS ====================
+
+def _letters(index, width=4):
+    """Sufijo en minúsculas único para index (base 26, ancho fijo)."""
+    chars = []
+    for _ in range(width):
+        index, rest = divmod(index, 26)
+        chars.append(string.ascii_lowercase[rest])
+    return "".join(reversed(chars))
+
+
+def synthetic_row(module, index):
+    """
+    Fila válida para el formulario de un módulo, con las columnas del CSV.
+
+    Args:
+        module: Clave de FORMS del generador de carga (ej. 'clientes')
+        index: Número de fila; cada índice produce valores distintos
+
+    Returns:
+        dict: {columna: valor}
+    """
+    suffix = _letters(index)
+    telefono = f"7{index % 10 ** 7:07d}"
+    if module == "clientes":
+        return {"nombre": f"Bench{suffix}", "apellido": f"Carga{suffix}",
+                "telefono": telefono, "correo": f"bench{index}@carga.test"}
+    if module == "productos":
+        return {"nombre": f"Prod{suffix}", "precio": "10.50", "stock": "5",
+                "descripcion": "Producto de carga", "categoria_id": "1"}
+    if module == "repartidores":
+        return {"nombre": f"Bench{suffix}", "apellido": f"Carga{suffix}",
+                "telefono": telefono, "tipo": "Moto"}
+    raise ValueError(f"Módulo desconocido: {module}")
+
+
+# ==================== MEDICIÓN ====================
+
+def measure(operation, min_rounds=5, max_time=2.0, warmup=1):
+    """
+    Ejecuta una operación repetidamente y mide cada ejecución.
+    Se hacen al menos min_rounds rondas y se sigue mientras no se supere max_time.
+
+    Args:
+        operation: Función sin argumentos a medir
+        min_rounds: Rondas mínimas medidas
+        max_time: Segundos máximos de medición (salvo para cumplir min_rounds)
+        warmup: Rondas previas que no se miden
+
+    Returns:
+        list: Duraciones en segundos
+    """
+    for _ in range(warmup):
+        operation()
+    samples = []
+    deadline = time.perf_counter() + max_time
+    while len(samples) < min_rounds or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    """
+    Resume las muestras de una medición.
+
+    Returns:
+        dict: {rounds, min_ms, median_ms, p95_ms, mean_ms, stddev_ms}
+    """
+    ordered = sorted(samples)
+    return {
+        "rounds": len(ordered),
+        "min_ms": round(ordered[0] * 1000, 3),
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "stddev_ms": round(statistics.pstdev(ordered) * 1000, 3),
+    }
+
+
+def scaling_exponent(points):
+    """
+    Pendiente del ajuste por mínimos cuadrados de log(latencia) vs. log(filas).
+    Cerca de 0 la latencia no depende del tamaño de la tabla; cerca de 1 crece
+    de forma lineal.
+
+    Args:
+        points: {filas: latencia en ms}
+
+    Returns:
+        float: Exponente estimado, o 0 con menos de dos tamaños
+    """
+    pairs = [(math.log(n), math.log(ms)) for n, ms in points.items() if n > 0 and ms > 0]
+    if len(pairs) < 2:
+        return 0.0
+    mean_x = statistics.fmean(x for x, _ in pairs)
+    mean_y = statistics.fmean(y for _, y in pairs)
+    spread = sum((x - mean_x) ** 2 for x, _ in pairs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / spread
+
+
+def growth(points):
+    """
+    Latencia de cada tamaño relativa al tamaño más chico.
+
+    Args:
+        points: {filas: latencia en ms}
+
+    Returns:
+        dict: {filas: latencia(filas) / latencia(filas mínimas)}
+    """
+    smallest = points[min(points)]
+    return {n: round(ms / smallest, 3) for n, ms in sorted(points.items())}
+
+
+# ==================== LÍNEAS BASE ====================
+
+def route_result(route, sizes):
+    """
+    Arma el resultado de una ruta a partir de sus mediciones por tamaño.
+
+    Args:
+        route: Ruta medida (ej. '/Clientes/Index')
+        sizes: {filas: resumen de summarize()}
+
+    Returns:
+        dict: {route, sizes, exponent, growth}
+    """
+    medians = {n: summary["median_ms"] for n, summary in sizes.items()}
+    return {
+        "route": route,
+        "sizes": {str(n): summary for n, summary in sorted(sizes.items())},
+        "exponent": round(scaling_exponent(medians), 3),
+        "growth": {str(n): ratio for n, ratio in growth(medians).items()},
+    }
+
+
+def load_baseline(path):
+    """
+    Lee una línea base.
+
+    Returns:
+        dict: {módulo: resultado de route_result}, vacío si el archivo no existe
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(path, results):
+    """
+    Escribe los resultados como JSON de forma atómica.
+
+    Args:
+        path: Archivo destino
+        results: {módulo: resultado de route_result}
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def scaling_regressions(result, baseline, exponent_tolerance=DEFAULT_EXPONENT_TOLERANCE,
+                        growth_tolerance=DEFAULT_GROWTH_TOLERANCE):
+    """
+    Compara cómo escala la latencia con la línea base. No se comparan tiempos
+    absolutos (dependen de la máquina), solo el exponente y el crecimiento
+    relativo al tamaño más chico.
+
+    Args:
+        result: Resultado actual (route_result)
+        baseline: Resultado de la línea base para la misma ruta
+        exponent_tolerance: Aumento máximo del exponente
+        growth_tolerance: Aumento relativo máximo del crecimiento por tamaño
+
+    Returns:
+        list: Mensajes de las regresiones (vacía si escala igual o mejor)
+    """
+    regressions = []
+    reference = baseline["exponent"]
+    common = set(result["sizes"]) & set(baseline.get("sizes", {}))
+    if len(common) >= 2 and common != set(baseline["sizes"]):
+        # La línea base midió otros tamaños: el exponente solo es comparable en los comunes
+        reference = round(scaling_exponent(
+            {int(n): baseline["sizes"][n]["median_ms"] for n in common}), 3)
+    if result["exponent"] > reference + exponent_tolerance:
+        regressions.append(
+            f"{result['route']}: exponente {result['exponent']} "
+            f"(línea base {reference}, tolerancia +{exponent_tolerance})"
+        )
+    # El crecimiento es relativo al tamaño más chico: solo es comparable si coincide
+    smallest = min(result["growth"], key=int)
+    if smallest != min(baseline["growth"], key=int):
+        return regressions
+    for size, ratio in result["growth"].items():
+        expected = baseline["growth"].get(size)
+        if size != smallest and expected is not None and ratio > expected * (1 + growth_tolerance):
+            regressions.append(
+                f"{result['route']} con {size} filas: {ratio}x el tamaño mínimo "
+                f"(línea base {expected}x, tolerancia +{growth_tolerance:.0%})"
+            )
+    return regressions
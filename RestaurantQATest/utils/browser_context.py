@@ -0,0 +1,180 @@
+"""
+Contextos de navegador tipo incógnito creados por Chrome DevTools Protocol.
+Cada contexto tiene sus propias cookies, storage y caché dentro del mismo
+proceso de Chrome, así que aislar un test cuesta crear una pestaña y no
+reiniciar el navegador. chromedriver rechaza Target.createBrowserContext en la
+sesión de la página ("Not allowed"), así que los contextos se crean por el
+websocket del navegador (utils/cdp_client.py, puerto de debuggerAddress). En
+chromedriver el handle de una ventana es el targetId de CDP, por lo que la
+pestaña creada por CDP se usa con switch_to.window. Si el navegador no admite
+contextos, el test falla con BrowserContextError en lugar de perder el
+aislamiento sin avisar.
+"""
+import logging
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.cdp_client import CdpBrowser, debugger_address, shared_loop
+
+
+logger = logging.getLogger(__name__)
+
+
+# Modos de aislamiento de un test
+ISOLATED = "isolated"   # contexto nuevo, descartado al terminar el test
+SHARED = "shared"       # un contexto por navegador, compartido entre tests
+RESET = "reset"         # contexto por defecto, limpiando cookies y storage
+
+MODES = (ISOLATED, SHARED, RESET)
+
+# Prefijo de los handles en versiones antiguas de chromedriver
+LEGACY_HANDLE_PREFIX = "CDwindow-"
+
+
+class BrowserContextError(WebDriverException):
+    """No se pudo crear el contexto CDP que pidió el test."""
+
+
+def context_mode(item, default="marker"):
+    """
+    Elige el modo de aislamiento de un test. El marcador browser_context tiene
+    prioridad; con default='marker' los tests smoke comparten contexto y el
+    resto usa uno aislado.
+
+    Args:
+        item: Item de pytest
+        default: Valor de --browser-context ('marker' o uno de MODES)
+
+    Returns:
+        str: Uno de MODES
+    """
+    marker = item.get_closest_marker("browser_context")
+    if marker is not None and marker.args:
+        return marker.args[0]
+    if default != "marker":
+        return default
+    return SHARED if item.get_closest_marker("smoke") is not None else ISOLATED
+
+
+class BrowserContexts:
+    """
+    Contextos CDP de un WebDriver: el compartido (si se usó) y el del test actual.
+    """
+
+    def __init__(self, driver):
+        """
+        Inicializa los contextos del navegador.
+
+        Args:
+            driver: WebDriver recién creado; su ventana actual es la de inicio
+        """
+        self.driver = driver
+        self.home = driver.current_window_handle
+        self.shared = None
+        self.current = None
+        self._browser = None    # CdpBrowser sobre el websocket del navegador
+
+    def enter(self, mode):
+        """
+        Cambia a la pestaña del contexto pedido, creándolo si hace falta.
+
+        Args:
+            mode: Uno de MODES
+
+        Returns:
+            str: El mismo modo
+
+        Raises:
+            BrowserContextError: Si no se pudo crear el contexto o cambiar a su pestaña
+        """
+        if mode == RESET:
+            return RESET
+        try:
+            if mode == SHARED:
+                if self.shared is None or self.shared[1] not in self.driver.window_handles:
+                    self.shared = self._create()
+                handle = self.shared[1]
+            else:
+                self.current = self._create()
+                handle = self.current[1]
+            self.driver.switch_to.window(handle)
+        except WebDriverException as e:
+            raise BrowserContextError(
+                f"No se pudo crear un contexto CDP '{mode}': {e.msg}. Usa "
+                "--browser-context=reset si el navegador no admite contextos"
+            ) from e
+        return mode
+
+    def exit(self):
+        """
+        Vuelve a la pestaña de inicio y descarta el contexto aislado del test.
+        """
+        self.driver.switch_to.window(self.home)
+        if self.current is not None:
+            context_id, _ = self.current
+            self.current = None
+            self._dispose(context_id)
+
+    def keep_handles(self):
+        """
+        Ventanas que la limpieza del pool no debe cerrar.
+
+        Returns:
+            set: Handle de inicio y el de la pestaña del contexto compartido
+        """
+        handles = {self.home}
+        if self.shared is not None:
+            handles.add(self.shared[1])
+        return handles
+
+    def close(self):
+        """Descarta los contextos creados y cierra el websocket (al cerrar el navegador)."""
+        for context in (self.current, self.shared):
+            if context is not None:
+                self._dispose(context[0])
+        self.current = self.shared = None
+        if self._browser is not None:
+            browser, self._browser = self._browser, None
+            try:
+                shared_loop().run(browser.close())
+            except Exception as e:
+                logger.debug("No se pudo cerrar la conexión CDP: %s", e)
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    def _create(self):
+        """
+        Crea un contexto con una pestaña en blanco.
+
+        Returns:
+            tuple: (browserContextId, handle de la pestaña)
+        """
+        browser = self._connection()
+        loop = shared_loop()
+        # Se descartan explícitamente en exit() o close(), no al cortarse la conexión
+        context_id = loop.run(browser.create_context(dispose_on_detach=False))
+        target_id = loop.run(browser.create_target(context_id))
+        handles = self.driver.window_handles
+        handle = target_id if target_id in handles else LEGACY_HANDLE_PREFIX + target_id
+        if handle not in handles:
+            self._dispose(context_id)
+            raise WebDriverException(f"chromedriver no expone la pestaña {target_id}")
+        return context_id, handle
+
+    def _dispose(self, context_id):
+        """Cierra las pestañas del contexto y lo elimina."""
+        try:
+            shared_loop().run(self._connection().dispose_context(context_id))
+        except WebDriverException as e:
+            logger.debug("No se pudo descartar el contexto %s: %s", context_id, e.msg)
+
+    def _connection(self):
+        """
+        Conexión CDP al navegador, abierta en el primer uso.
+
+        Raises:
+            CdpError: Si chromedriver no expone debuggerAddress o no se pudo conectar
+        """
+        if self._browser is None or self._browser.connection.closed:
+            self._browser = shared_loop().run(CdpBrowser.connect(debugger_address(self.driver)))
+        return self._browser
@@ -0,0 +1,388 @@
+"""
+Pool de navegadores Chrome pre-calentados.
+Cada worker de pytest-xdist mantiene su propio pool y presta una instancia por test,
+reciclando las que fallan o superan el umbral de memoria. La memoria es la del
+árbol de procesos de chromedriver (Chrome, renderers, GPU, red): en Linux se lee
+el PSS de /proc, que reparte la memoria compartida entre procesos; en otros
+sistemas el RSS con psutil, si está instalado.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.browser_context import RESET, BrowserContexts
+
+try:
+    import psutil
+except ImportError:  # opcional: solo hace falta fuera de Linux
+    psutil = None
+
+
+logger = logging.getLogger(__name__)
+
+PROC_DIR = "/proc"
+
+# Limpia el almacenamiento del origen actual
+RESET_SCRIPT = """
+try { window.localStorage && window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage && window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Reintentos al crear un navegador y espera antes de cada uno (segundos, se duplica)
+SPAWN_ATTEMPTS = 3
+SPAWN_BACKOFF = 1.0
+
+
+class BrowserPoolError(WebDriverException):
+    """No hay navegadores disponibles (creación fallida o pool agotado)."""
+
+
+def worker_id():
+    """
+    Obtiene el identificador del worker de pytest-xdist.
+
+    Returns:
+        str: Identificador del worker (gw0, gw1, ...) o 'master' sin xdist
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def driver_pid(driver):
+    """
+    PID del proceso de chromedriver de un WebDriver local.
+
+    Returns:
+        int: PID, o None si el driver no tiene un servicio local
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return getattr(process, "pid", None)
+
+
+def process_tree_memory(pid):
+    """
+    Memoria de un proceso y todos sus descendientes.
+
+    Args:
+        pid: Proceso raíz (ej. chromedriver)
+
+    Returns:
+        int: Bytes (PSS en Linux, RSS con psutil), o None si no se puede medir
+    """
+    if os.path.isdir(PROC_DIR):
+        children = _proc_children()
+        total, pending = 0, [pid]
+        while pending:
+            current = pending.pop()
+            total += _proc_memory(current)
+            pending.extend(children.get(current, ()))
+        return total
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        return sum(p.memory_info().rss for p in [root, *root.children(recursive=True)])
+    except psutil.Error:
+        return None
+
+
+def _proc_children():
+    """{ppid: [pid, ...]} de todos los procesos visibles en /proc."""
+    children = defaultdict(list)
+    for entry in os.listdir(PROC_DIR):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(PROC_DIR, entry, "stat")) as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # El nombre del proceso va entre paréntesis y puede tener espacios
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children[ppid].append(int(entry))
+    return children
+
+
+def _proc_memory(pid):
+    """PSS de un proceso (VmRSS en kernels sin smaps_rollup), en bytes; 0 si terminó."""
+    for name, field in (("smaps_rollup", "Pss:"), ("status", "VmRSS:")):
+        try:
+            with open(os.path.join(PROC_DIR, str(pid), name)) as f:
+                for line in f:
+                    if line.startswith(field):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return 0
+
+
+def pool_size_for_worker(per_worker, max_total=None):
+    """
+    Calcula cuántos navegadores debe mantener este worker.
+    Reparte el total máximo de instancias entre todos los workers activos
+    para no saturar la máquina cuando se ejecuta con -n auto.
+
+    Args:
+        per_worker: Tamaño de pool solicitado por worker
+        max_total: Máximo de navegadores entre todos los workers (None = sin límite)
+
+    Returns:
+        int: Tamaño de pool para este worker (mínimo 1)
+    """
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if max_total:
+        per_worker = min(per_worker, max_total // workers)
+    return max(1, per_worker)
+
+
+class _SpawnError:
+    """Marca en la cola que la creación de un navegador falló."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class BrowserPool:
+    """
+    Mantiene N instancias de WebDriver listas para usar y presta una por test.
+
+    Entre préstamos se limpia el estado (cookies, storage, ventanas extra) en lugar
+    de reiniciar Chrome, o el test corre en un contexto CDP propio o compartido
+    (ver utils/browser_context.py). Una instancia se recicla si deja de responder, si la
+    memoria de sus procesos supera el umbral o si alcanzó el máximo de préstamos.
+    """
+
+    def __init__(self, factory, size=2, max_memory_mb=1024, max_leases=200):
+        """
+        Inicializa el pool.
+
+        Args:
+            factory: Callable sin argumentos que crea un WebDriver
+            size: Número de navegadores pre-calentados
+            max_memory_mb: Memoria del árbol de procesos de Chrome (MB) a partir
+                           de la cual se recicla
+            max_leases: Préstamos máximos antes de reciclar una instancia
+        """
+        self.factory = factory
+        self.size = size
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.max_leases = max_leases
+        self._idle = queue.Queue()
+        self._leases = {}
+        self._contexts = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # ==================== CICLO DE VIDA ====================
+
+    def start(self):
+        """Lanza en paralelo la creación de todas las instancias del pool."""
+        logger.info("Worker %s: iniciando pool de %d navegadores", worker_id(), self.size)
+        for _ in range(self.size):
+            self._spawn_async()
+
+    def close(self):
+        """Cierra todas las instancias del pool."""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._leases)
+            contexts = self._contexts
+            self._leases.clear()
+            self._contexts = {}
+        for driver in drivers:
+            self._quit(driver, contexts.get(driver))
+
+    # ==================== PRÉSTAMOS ====================
+
+    def acquire(self, timeout=120):
+        """
+        Toma un navegador sano del pool, esperando si todos están ocupados.
+
+        Args:
+            timeout: Tiempo máximo de espera en segundos
+
+        Returns:
+            WebDriver listo para usar
+
+        Raises:
+            BrowserPoolError: Si no se pudo crear un navegador o ninguno se
+                              liberó dentro del timeout
+        """
+        while True:
+            try:
+                item = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise BrowserPoolError(
+                    f"Worker {worker_id()}: ningún navegador disponible en {timeout} s "
+                    f"(pool de {self.size})"
+                )
+            if isinstance(item, _SpawnError):
+                # El lugar queda libre: el próximo préstamo vuelve a intentarlo
+                with self._lock:
+                    closed = self._closed
+                if not closed:
+                    self._spawn_async()
+                raise BrowserPoolError(
+                    f"Worker {worker_id()}: no se pudo iniciar Chrome tras {SPAWN_ATTEMPTS} "
+                    f"intentos: {item.error}"
+                ) from item.error
+            if self._is_alive(item):
+                return item
+            logger.warning("Worker %s: navegador caído, reciclando", worker_id())
+            self._recycle(item)
+
+    def release(self, driver, mode=RESET):
+        """
+        Devuelve un navegador al pool, limpiando su estado o reciclándolo.
+
+        Args:
+            driver: WebDriver previamente obtenido con acquire()
+            mode: Modo de contexto en que corrió el test (ver utils/browser_context.py)
+        """
+        with self._lock:
+            if self._closed or driver not in self._leases:
+                self._quit(driver)
+                return
+            self._leases[driver] += 1
+            leases = self._leases[driver]
+
+        try:
+            self._reset(driver, mode)
+        except WebDriverException as e:
+            logger.warning("Worker %s: fallo al limpiar navegador (%s), reciclando", worker_id(), e.msg)
+            self._recycle(driver)
+            return
+
+        memory = self._memory(driver)
+        if memory is not None and memory > self.max_memory_bytes:
+            logger.info("Worker %s: Chrome usa %d MB, supera el umbral, reciclando",
+                        worker_id(), memory // (1024 * 1024))
+            self._recycle(driver)
+        elif leases >= self.max_leases:
+            self._recycle(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def lease(self, mode=RESET):
+        """
+        Context manager que presta un navegador durante un bloque.
+
+        Args:
+            mode: 'isolated' (contexto CDP nuevo), 'shared' (contexto CDP del
+                  navegador compartido entre tests) o 'reset' (contexto por defecto)
+
+        Yields:
+            WebDriver del pool, con el foco en la pestaña del contexto
+        """
+        driver = self.acquire()
+        entered = RESET
+        try:
+            entered = self._contexts_for(driver).enter(mode)
+            yield driver
+        finally:
+            self.release(driver, entered)
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    def _contexts_for(self, driver):
+        """Contextos CDP de un navegador; se crean en su primer préstamo."""
+        with self._lock:
+            contexts = self._contexts.get(driver)
+        if contexts is None:
+            contexts = BrowserContexts(driver)
+            with self._lock:
+                self._contexts[driver] = contexts
+        return contexts
+
+    def _reset(self, driver, mode=RESET):
+        """
+        Deja el navegador en estado limpio para el siguiente test. Si el test
+        usó un contexto CDP solo se cierran las ventanas que abrió: el contexto
+        aislado se descarta y el compartido se conserva.
+        """
+        contexts = self._contexts_for(driver)
+        contexts.exit()
+        keep = contexts.keep_handles()
+        handles = driver.window_handles
+        for handle in handles:
+            if handle not in keep:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(contexts.home)
+        if mode != RESET:
+            return
+        driver.execute_script(RESET_SCRIPT)
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def _memory(self, driver):
+        """
+        Memoria del árbol de procesos del navegador, medida tras limpiarlo.
+
+        Returns:
+            int: Bytes, o None si no se puede medir (driver remoto, sin /proc ni psutil)
+        """
+        pid = driver_pid(driver)
+        return None if pid is None else process_tree_memory(pid)
+
+    def _is_alive(self, driver):
+        """Verifica con una llamada barata que la sesión sigue respondiendo."""
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _recycle(self, driver):
+        """Cierra una instancia en segundo plano y crea su reemplazo."""
+        with self._lock:
+            self._leases.pop(driver, None)
+            contexts = self._contexts.pop(driver, None)
+            closed = self._closed
+        threading.Thread(target=self._quit, args=(driver, contexts), daemon=True).start()
+        if not closed:
+            self._spawn_async()
+
+    def _spawn_async(self):
+        """Crea una instancia nueva en un hilo y la deja disponible en el pool."""
+        threading.Thread(target=self._spawn, daemon=True).start()
+
+    def _spawn(self):
+        for attempt in range(SPAWN_ATTEMPTS):
+            try:
+                driver = self.factory()
+                break
+            except Exception as e:
+                error = e
+                logger.warning("Worker %s: fallo al iniciar Chrome (intento %d de %d): %s",
+                               worker_id(), attempt + 1, SPAWN_ATTEMPTS, e)
+                if attempt + 1 < SPAWN_ATTEMPTS:
+                    time.sleep(SPAWN_BACKOFF * 2 ** attempt)
+        else:
+            self._idle.put(_SpawnError(error))
+            return
+        with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                self._leases[driver] = 0
+        if closed:
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+
+    @staticmethod
+    def _quit(driver, contexts=None):
+        if contexts is not None:
+            contexts.close()
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,326 @@
+"""
+Cliente asíncrono de Chrome DevTools Protocol sobre websocket (aiohttp).
+Una sola conexión al navegador multiplexa todas las pestañas con sesiones CDP
+"flatten": cada comando lleva su sessionId y las respuestas se emparejan por id,
+así un event loop espera en paralelo las cargas y round-trips de muchas
+pestañas. El navegador puede ser uno del pool de Selenium: chromedriver
+publica su puerto de depuración en la capability goog:chromeOptions. Los
+comandos de Target que chromedriver no permite en la sesión de la página
+(crear o descartar contextos) se envían por esta conexión; el código síncrono
+los ejecuta en un EventLoopThread.
+"""
+import asyncio
+import itertools
+import json
+import threading
+
+import aiohttp
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+
+class CdpError(WebDriverException):
+    """Error devuelto por un comando CDP o conexión cerrada."""
+
+
+def debugger_address(driver):
+    """
+    Dirección de depuración remota del Chrome de un WebDriver.
+
+    Args:
+        driver: WebDriver de Chrome
+
+    Returns:
+        str: 'host:puerto'
+
+    Raises:
+        CdpError: Si chromedriver no expone debuggerAddress
+    """
+    address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+    if not address:
+        raise CdpError("El navegador no expone goog:chromeOptions.debuggerAddress")
+    return address
+
+
+class CdpConnection:
+    """
+    Conexión websocket al navegador. Los comandos se envían con send() y sus
+    respuestas las entrega una tarea lectora.
+    """
+
+    def __init__(self, http, websocket):
+        self._http = http
+        self._websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self.closed = False
+        self._reader = asyncio.create_task(self._read())
+
+    @classmethod
+    async def connect(cls, address):
+        """
+        Abre la conexión con el endpoint del navegador.
+
+        Args:
+            address: 'host:puerto' de depuración o URL ws:// del navegador
+
+        Returns:
+            CdpConnection: Conexión abierta
+
+        Raises:
+            CdpError: Si el endpoint no responde o no es de DevTools
+        """
+        http = aiohttp.ClientSession()
+        try:
+            url = address
+            if not address.startswith("ws"):
+                async with http.get(f"http://{address}/json/version") as response:
+                    url = (await response.json())["webSocketDebuggerUrl"]
+            websocket = await http.ws_connect(url, max_msg_size=0)
+        except (aiohttp.ClientError, OSError, KeyError, ValueError, asyncio.TimeoutError) as e:
+            await http.close()
+            reason = str(e) or type(e).__name__
+            raise CdpError(f"No se pudo conectar con DevTools en {address}: {reason}") from e
+        except BaseException:
+            await http.close()
+            raise
+        return cls(http, websocket)
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        """
+        Ejecuta un comando CDP y espera su respuesta.
+
+        Args:
+            method: Comando (ej. 'Runtime.evaluate')
+            params: Parámetros del comando
+            session_id: Sesión de la pestaña; None para comandos del navegador
+            timeout: Segundos máximos de espera
+
+        Returns:
+            dict: Resultado del comando
+
+        Raises:
+            CdpError: Si el navegador devuelve un error, no responde a tiempo o
+                      se cerró la conexión
+        """
+        message_id = next(self._ids)
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id is not None:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._websocket.send_str(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise CdpError(f"{method}: sin respuesta en {timeout} s")
+        except ConnectionError as e:
+            raise CdpError(f"Conexión CDP cerrada: {e}") from e
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def close(self):
+        """Cierra el websocket y la sesión HTTP."""
+        self._reader.cancel()
+        await self._websocket.close()
+        await self._http.close()
+
+    async def _read(self):
+        try:
+            async for frame in self._websocket:
+                if frame.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                message = json.loads(frame.data)
+                future = self._pending.get(message.get("id"))
+                if future is None or future.done():
+                    continue  # eventos: las páginas consultan el estado por polling
+                if "error" in message:
+                    future.set_exception(CdpError(message["error"].get("message")))
+                else:
+                    future.set_result(message.get("result", {}))
+        finally:
+            self.closed = True
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CdpError("Conexión CDP cerrada"))
+
+
+class CdpBrowser:
+    """Navegador controlado por CDP; crea contextos aislados con una pestaña."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @classmethod
+    async def connect(cls, address):
+        """
+        Conecta con un navegador.
+
+        Args:
+            address: 'host:puerto' de depuración (ver debugger_address) o URL ws://
+        """
+        return cls(await CdpConnection.connect(address))
+
+    async def create_context(self, dispose_on_detach=True):
+        """
+        Crea un contexto tipo incógnito (cookies, storage y caché propios).
+
+        Args:
+            dispose_on_detach: Descartarlo si se cierra esta conexión
+
+        Returns:
+            str: browserContextId
+        """
+        return (await self.connection.send("Target.createBrowserContext", {
+            "disposeOnDetach": dispose_on_detach
+        }))["browserContextId"]
+
+    async def create_target(self, context_id, url="about:blank"):
+        """
+        Abre una pestaña en un contexto.
+
+        Returns:
+            str: targetId (en chromedriver, el handle de la ventana)
+        """
+        return (await self.connection.send("Target.createTarget", {
+            "url": url, "browserContextId": context_id
+        }))["targetId"]
+
+    async def dispose_context(self, context_id):
+        """Cierra las pestañas de un contexto y lo elimina."""
+        await self.connection.send("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+    async def new_context(self):
+        """
+        Crea un contexto tipo incógnito con una pestaña en blanco.
+
+        Returns:
+            BrowsingContext: Pestaña lista para usar
+        """
+        context_id = await self.create_context()
+        target_id = await self.create_target(context_id)
+        session_id = (await self.connection.send("Target.attachToTarget", {
+            "targetId": target_id, "flatten": True
+        }))["sessionId"]
+        return BrowsingContext(self.connection, context_id, session_id)
+
+    async def close(self):
+        """Cierra la conexión (el navegador sigue abierto)."""
+        await self.connection.close()
+
+
+class BrowsingContext:
+    """
+    Pestaña de un contexto CDP. execute_script recibe el mismo cuerpo de
+    función que WebDriver (arguments[...] y return), así los Page Objects
+    asíncronos usan los scripts de pages/base_page.py sin cambios.
+    """
+
+    def __init__(self, connection, context_id, session_id):
+        self.connection = connection
+        self.context_id = context_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None, timeout=30):
+        """Ejecuta un comando CDP en la sesión de esta pestaña."""
+        return await self.connection.send(method, params, self.session_id, timeout)
+
+    async def execute_script(self, script, *args):
+        """
+        Ejecuta un script con la convención de WebDriver.
+
+        Args:
+            script: Cuerpo de función (usa arguments y return)
+            *args: Argumentos serializables a JSON
+
+        Returns:
+            Valor devuelto por el script
+
+        Raises:
+            JavascriptException: Si el script lanzó una excepción o el documento
+                                 cambió durante la ejecución (navegación)
+        """
+        expression = f"(function () {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        try:
+            response = await self.send("Runtime.evaluate", {
+                "expression": expression, "returnByValue": True, "awaitPromise": True,
+            })
+        except CdpError as e:
+            if self.connection.closed:
+                raise
+            raise JavascriptException(e.msg) from e
+        if "exceptionDetails" in response:
+            details = response["exceptionDetails"]
+            raise JavascriptException(details.get("exception", {}).get("description")
+                                      or details.get("text"))
+        return response["result"].get("value")
+
+    async def navigate(self, url):
+        """
+        Inicia la navegación a una URL (no espera la carga).
+
+        Raises:
+            CdpError: Si la navegación falló (ej. conexión rechazada)
+        """
+        result = await self.send("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise CdpError(f"{result['errorText']}: {url}")
+
+    async def click_at(self, x, y):
+        """Hace clic con el mouse en coordenadas del viewport."""
+        await self.send("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y})
+        for event in ("mousePressed", "mouseReleased"):
+            await self.send("Input.dispatchMouseEvent", {
+                "type": event, "x": x, "y": y, "button": "left", "clickCount": 1,
+            })
+
+    async def insert_text(self, text):
+        """Escribe texto en el elemento con el foco, como el teclado."""
+        await self.send("Input.insertText", {"text": text})
+
+    async def close(self):
+        """Descarta el contexto y su pestaña."""
+        try:
+            await self.connection.send("Target.disposeBrowserContext",
+                                       {"browserContextId": self.context_id})
+        except CdpError:
+            pass  # conexión ya cerrada: el navegador descarta el contexto
+
+
+# ==================== API SÍNCRONA ====================
+
+class EventLoopThread:
+    """Event loop en un hilo propio para llamar corrutinas desde código síncrono."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def run(self, coroutine):
+        """Ejecuta una corrutina en el loop y espera su resultado."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self):
+        """Detiene el loop y el hilo."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+def shared_loop():
+    """
+    Event loop compartido por las conexiones CDP síncronas del proceso (uno
+    para todo el pool de navegadores, en lugar de un hilo por navegador).
+
+    Returns:
+        EventLoopThread
+    """
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = EventLoopThread()
+        return _shared_loop
@@ -0,0 +1,257 @@
+"""
+Instrumentación de los comandos WebDriver.
+Cuenta y mide cada comando HTTP que Selenium envía a chromedriver, agrupado por
+tipo de comando y por el método del Page Object que lo originó. Como plugin de
+pytest agrega el desglose al reporte HTML y hace fallar los tests que superan
+el presupuesto de comandos o de latencia. Los últimos comandos se conservan
+para los artefactos de los tests fallidos (utils.artifacts).
+"""
+import html
+import sys
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import pytest
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:  # pytest-html no instalado: solo se omite el desglose
+    html_extras = None
+
+
+RECORDER_KEY = pytest.StashKey()
+
+# Módulo de los Page Objects: los frames de estos módulos se atribuyen a su método
+PAGES_PACKAGE = "pages."
+
+# Comandos recientes que se conservan por test
+RECENT_COMMANDS = 50
+
+# Largo máximo de los parámetros de un comando reciente
+MAX_PARAMS = 300
+
+
+class CommandStats:
+    """Acumulado de cantidad y tiempo de un grupo de comandos."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def add(self, seconds):
+        self.count += 1
+        self.seconds += seconds
+
+
+class CommandRecorder:
+    """
+    Envuelve command_executor.execute de un WebDriver para registrar cada comando.
+    """
+
+    def __init__(self, driver):
+        """
+        Inicializa el registrador.
+
+        Args:
+            driver: WebDriver a instrumentar
+        """
+        self.driver = driver
+        self.by_command = defaultdict(CommandStats)
+        self.by_method = defaultdict(CommandStats)
+        self.total = CommandStats()
+        self.recent = deque(maxlen=RECENT_COMMANDS)
+
+    @contextmanager
+    def recording(self):
+        """
+        Context manager que instrumenta el driver durante un bloque.
+        Al salir se restaura el método original del executor.
+        """
+        executor = self.driver.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            start = time.perf_counter()
+            error = None
+            try:
+                return original(command, params)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                method = self.caller()
+                seconds = time.perf_counter() - start
+                self.record(command, method, seconds)
+                self.recent.append({"command": command, "method": method,
+                                    "ms": round(seconds * 1000, 1),
+                                    "params": repr(params)[:MAX_PARAMS], "error": error})
+
+        executor.execute = execute
+        try:
+            yield self
+        finally:
+            del executor.execute
+
+    def record(self, command, method, seconds):
+        """
+        Registra un comando ejecutado.
+
+        Args:
+            command: Nombre del comando WebDriver (ej. 'findElement')
+            method: Método del Page Object que lo originó (ej. 'ClientePage.fill_form')
+            seconds: Duración del round-trip
+        """
+        self.by_command[command].add(seconds)
+        self.by_method[method].add(seconds)
+        self.total.add(seconds)
+
+    @staticmethod
+    def caller():
+        """
+        Recorre la pila hasta el primer frame de un Page Object.
+        Se toma el más externo de la cadena para atribuir, por ejemplo,
+        los find_element internos al método público que los llamó.
+
+        Returns:
+            str: 'Clase.metodo', o 'test' si el comando no vino de un Page Object
+        """
+        frame = sys._getframe(2)
+        found = None
+        while frame is not None:
+            if frame.f_globals.get("__name__", "").startswith(PAGES_PACKAGE):
+                owner = frame.f_locals.get("self")
+                name = type(owner).__name__ if owner is not None else frame.f_globals["__name__"]
+                found = f"{name}.{frame.f_code.co_name}"
+            elif found is not None:
+                break
+            frame = frame.f_back
+        return found or "test"
+
+    def summary(self):
+        """
+        Resume lo registrado.
+
+        Returns:
+            dict: {'commands': n, 'ms': total, 'by_command': {...}, 'by_method': {...}}
+        """
+        def table(groups):
+            return {
+                name: {"count": stats.count, "ms": round(stats.seconds * 1000, 1)}
+                for name, stats in sorted(groups.items(), key=lambda kv: -kv[1].seconds)
+            }
+        return {
+            "commands": self.total.count,
+            "ms": round(self.total.seconds * 1000, 1),
+            "by_command": table(self.by_command),
+            "by_method": table(self.by_method),
+        }
+
+
+@contextmanager
+def record_commands(item, driver):
+    """
+    Instrumenta el driver durante un test y deja el registrador en el item.
+
+    Args:
+        item: Item de pytest del test en ejecución
+        driver: WebDriver prestado al test
+    """
+    recorder = CommandRecorder(driver)
+    item.stash[RECORDER_KEY] = recorder
+    with recorder.recording():
+        yield recorder
+
+
+# ==================== PRESUPUESTOS ====================
+
+def budget_for(item):
+    """
+    Obtiene el presupuesto de un test: el marcador command_budget tiene
+    prioridad sobre las opciones --max-commands y --max-command-ms.
+
+    Returns:
+        tuple: (máximo de comandos, máximo de milisegundos); 0 = sin límite
+    """
+    commands = item.config.getoption("--max-commands")
+    ms = item.config.getoption("--max-command-ms")
+    marker = item.get_closest_marker("command_budget")
+    if marker is not None:
+        commands = marker.kwargs.get("commands", commands)
+        ms = marker.kwargs.get("ms", ms)
+    return commands, ms
+
+
+def budget_violations(summary, commands, ms):
+    """
+    Compara un resumen con su presupuesto.
+
+    Returns:
+        list: Mensajes de los límites superados (vacía si se cumple)
+    """
+    violations = []
+    if commands and summary["commands"] > commands:
+        violations.append(f"{summary['commands']} comandos WebDriver (máximo {commands})")
+    if ms and summary["ms"] > ms:
+        violations.append(f"{summary['ms']} ms en comandos WebDriver (máximo {ms} ms)")
+    return violations
+
+
+def html_breakdown(summary):
+    """
+    Tablas HTML con el desglose por método y por comando. Las usan el extra de
+    pytest-html y el reporte de utils/result_stream.py.
+    """
+    parts = [f"<p><b>Comandos WebDriver:</b> {summary['commands']} "
+             f"({summary['ms']} ms)</p>"]
+    for title, key in (("Método del Page Object", "by_method"), ("Comando", "by_command")):
+        rows = "".join(
+            f"<tr><td>{html.escape(name)}</td><td>{stats['count']}</td><td>{stats['ms']}</td></tr>"
+            for name, stats in summary[key].items()
+        )
+        parts.append(
+            f"<table><tr><th>{title}</th><th>Cantidad</th><th>ms</th></tr>{rows}</table>"
+        )
+    return "".join(parts)
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--max-commands", type=int, default=0,
+        help="Máximo de comandos WebDriver por test (0 = sin límite)"
+    )
+    group.addoption(
+        "--max-command-ms", type=float, default=0,
+        help="Máximo de milisegundos en comandos WebDriver por test (0 = sin límite)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "command_budget(commands=0, ms=0): presupuesto de comandos WebDriver del test"
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    recorder = item.stash.get(RECORDER_KEY, None)
+    if report.when != "call" or recorder is None:
+        return
+
+    summary = recorder.summary()
+    report.user_properties.append(("webdriver_commands", summary))
+    if html_extras is not None:
+        report.extras = getattr(report, "extras", []) + [html_extras.html(html_breakdown(summary))]
+
+    violations = budget_violations(summary, *budget_for(item))
+    if violations and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "Presupuesto de WebDriver superado: " + "; ".join(violations)
@@ -0,0 +1,246 @@
+"""
+Carga compartida de los casos de prueba en CSV.
+Resuelve las rutas respecto al proyecto, valida cada archivo contra su esquema
+y guarda los casos ya procesados en una caché binaria (pickle) indexada por la
+fecha de modificación y el tamaño del CSV y por el esquema con que se validaron. La caché vive en disco, por lo que
+todos los workers de pytest-xdist la comparten en lugar de volver a parsear.
+"""
+import csv
+import hashlib
+import os
+import pickle
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
+
+# ==================== CONFIGURACIÓN ====================
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_DIR / "Data"
+CACHE_DIR = PROJECT_DIR / ".cache" / "test_data"
+
+# Se incrementa cuando cambia el formato de los objetos guardados en caché
+CACHE_VERSION = 1
+
+
+# ==================== ESQUEMAS ====================
+
+# columns: columnas esperadas, en orden; required: columnas que no pueden estar
+# vacías; choices: {columna: valores permitidos}
+Schema = namedtuple("Schema", ["columns", "required", "choices"])
+
+SCHEMAS = {
+    "clientes_tests.csv": Schema(
+        columns=("caso", "nombre", "apellido", "telefono", "correo",
+                 "esperado", "particion", "observaciones"),
+        required=("caso", "esperado"),
+        choices={"esperado": ("valido", "invalido")},
+    ),
+    "productos_tests.csv": Schema(
+        columns=("caso", "nombre", "precio", "stock", "descripcion",
+                 "categoria_id", "esperado", "particion", "observaciones"),
+        required=("caso", "esperado"),
+        choices={"esperado": ("Aceptado", "Rechazado")},
+    ),
+    "repartidores_tests.csv": Schema(
+        columns=("caso", "nombre", "apellido", "telefono", "tipo",
+                 "esperado", "particion", "observaciones"),
+        required=("caso", "esperado"),
+        choices={"esperado": ("Aceptado", "Rechazado"),
+                 "tipo": ("", "Interno", "Externo", "Temporal")},
+    ),
+}
+
+
+class DataSchemaError(ValueError):
+    """El archivo de casos no cumple con su esquema."""
+
+
+def schema_hash(schema):
+    """Huella del esquema: si cambia, los casos en caché se vuelven a validar."""
+    return hashlib.sha1(repr(schema).encode("utf-8")).hexdigest()[:12]
+
+
+# ==================== CARGA ====================
+
+# Archivo -> (clave, casos, {código: caso})
+_memory_cache = {}
+
+
+def load_cases(file_name):
+    """
+    Carga los casos de un archivo CSV de Data/.
+
+    Args:
+        file_name: Nombre del archivo (ej. 'productos_tests.csv')
+
+    Returns:
+        list: Lista de diccionarios {columna: valor}, uno por caso
+
+    Raises:
+        DataSchemaError: Si el archivo no cumple con su esquema
+    """
+    return _load(file_name)[1]
+
+
+def case_index(file_name):
+    """
+    Casos de un archivo indexados por su código.
+
+    Args:
+        file_name: Nombre del archivo en Data/
+
+    Returns:
+        dict: {código del caso: diccionario del caso}
+    """
+    return _load(file_name)[2]
+
+
+def _load(file_name):
+    path = DATA_DIR / file_name
+    stat = path.stat()
+    schema = SCHEMAS[file_name]
+    key = (stat.st_mtime_ns, stat.st_size, CACHE_VERSION, schema_hash(schema))
+
+    cached = _memory_cache.get(file_name)
+    if cached and cached[0] == key:
+        return cached
+
+    cases = _read_cache(file_name, key)
+    if cases is None:
+        cases = parse_file(path, schema)
+        _write_cache(file_name, key, cases)
+    _memory_cache[file_name] = (key, cases, {case["caso"]: case for case in cases})
+    return _memory_cache[file_name]
+
+
+def parse_file(path, schema):
+    """
+    Lee y valida un CSV de casos.
+
+    Args:
+        path: Ruta al archivo
+        schema: Schema con columnas, obligatorios y valores permitidos
+
+    Returns:
+        list: Lista de diccionarios {columna: valor}
+
+    Raises:
+        DataSchemaError: Si el encabezado, una fila o un valor no es válido
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = tuple(next(reader, ()))
+        if header != schema.columns:
+            raise DataSchemaError(
+                f"{path.name}: encabezado {list(header)}, se esperaba {list(schema.columns)}"
+            )
+
+        cases, seen = [], set()
+        for line, row in enumerate(reader, start=2):
+            if not any(row):
+                continue
+            if len(row) != len(schema.columns):
+                raise DataSchemaError(
+                    f"{path.name}:{line}: {len(row)} columnas, se esperaban {len(schema.columns)}"
+                )
+            case = dict(zip(schema.columns, row))
+            for column in schema.required:
+                if not case[column]:
+                    raise DataSchemaError(f"{path.name}:{line}: '{column}' es obligatorio")
+            for column, allowed in schema.choices.items():
+                if case[column] not in allowed:
+                    raise DataSchemaError(
+                        f"{path.name}:{line}: valor '{case[column]}' no permitido en '{column}'"
+                    )
+            if case["caso"] in seen:
+                raise DataSchemaError(f"{path.name}:{line}: caso duplicado '{case['caso']}'")
+            seen.add(case["caso"])
+            cases.append(case)
+    return cases
+
+
+# ==================== CACHÉ EN DISCO ====================
+
+def _cache_path(file_name):
+    return CACHE_DIR / f"{file_name}.pickle"
+
+
+def _read_cache(file_name, key):
+    try:
+        with open(_cache_path(file_name), "rb") as f:
+            cached_key, cases = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+        return None
+    return cases if cached_key == key else None
+
+
+def _write_cache(file_name, key, cases):
+    """Escribe la caché de forma atómica (seguro con varios workers de xdist)."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_DIR / f"{file_name}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((key, cases), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _cache_path(file_name))
+    except OSError:
+        pass
+
+
+# ==================== PARAMETRIZACIÓN ====================
+
+def case_params(file_name, fields=None):
+    """
+    Construye los parámetros de pytest para un archivo de casos, con el código
+    del caso (CL1, PR3, ...) como id del test.
+
+    Args:
+        file_name: Nombre del archivo en Data/
+        fields: Columnas a pasar como argumentos separados; si es None se pasa
+                el diccionario completo del caso como único argumento
+
+    Returns:
+        list: Lista de pytest.param
+    """
+    params = []
+    for case in load_cases(file_name):
+        values = [case[field] for field in fields] if fields else [case]
+        params.append(pytest.param(
+            *values, id=case["caso"], marks=pytest.mark.csv_case(file_name, case["caso"])
+        ))
+    return params
+
+
+def case_of(item):
+    """
+    Obtiene el caso CSV ejecutado por un test parametrizado con case_params().
+
+    Args:
+        item: Item de pytest
+
+    Returns:
+        tuple: (nombre del archivo, diccionario del caso), o None si el test no
+               usa casos CSV
+    """
+    marker = item.get_closest_marker("csv_case")
+    if marker is None:
+        return None
+    file_name, caso = marker.args
+    case = case_index(file_name).get(caso)
+    return (file_name, case) if case is not None else None
+
+
+def case_id(item):
+    """
+    Obtiene el código del caso CSV ejecutado por un test parametrizado.
+
+    Args:
+        item: Item de pytest
+
+    Returns:
+        str: Código del caso (ej. 'PR3'), o None si el test no usa casos CSV
+    """
+    marker = item.get_closest_marker("csv_case")
+    return marker.args[1] if marker else None
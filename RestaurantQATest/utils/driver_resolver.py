@@ -0,0 +1,266 @@
+"""
+Resolución local del ejecutable de chromedriver sin acceso a la red.
+Busca el driver en una variable de entorno, en la caché en disco o en el PATH,
+prueba los candidatos en ese orden y se queda con el primero compatible con el
+Chrome instalado, guardando el resultado en un archivo de bloqueo.
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== CONFIGURACIÓN ====================
+
+ENV_DRIVER = "CHROMEDRIVER_PATH"
+ENV_CHROME = "CHROME_BINARY"
+ENV_CACHE = "RESTAURANTQA_DRIVER_CACHE"
+ENV_ALLOW_DOWNLOAD = "RESTAURANTQA_ALLOW_DRIVER_DOWNLOAD"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "restaurantqa" / "drivers"
+WDM_CACHE_DIR = Path.home() / ".wdm" / "drivers" / "chromedriver"
+LOCK_FILE = Path(__file__).resolve().parent.parent / ".driver.lock"
+
+DRIVER_NAMES = ("chromedriver.exe",) if sys.platform == "win32" else ("chromedriver",)
+CHROME_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+CHROME_PATHS = (
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+)
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+ResolvedDriver = namedtuple(
+    "ResolvedDriver", ["driver_path", "driver_version", "chrome_path", "chrome_version"]
+)
+
+
+class DriverResolutionError(RuntimeError):
+    """No se encontró un chromedriver local compatible con el Chrome instalado."""
+
+
+# ==================== BÚSQUEDA ====================
+
+def find_drivers():
+    """
+    Candidatos a chromedriver en orden de preferencia: variable de entorno,
+    caché en disco (el más reciente primero), PATH. Con la variable de entorno
+    definida es el único candidato.
+
+    Returns:
+        list: Rutas a los ejecutables (vacía si no se encontró ninguno)
+    """
+    env_path = os.environ.get(ENV_DRIVER)
+    if env_path:
+        if not os.path.isfile(env_path):
+            raise DriverResolutionError(f"{ENV_DRIVER} apunta a un archivo inexistente: {env_path}")
+        return [env_path]
+
+    candidates = []
+    cache_dir = Path(os.environ.get(ENV_CACHE, DEFAULT_CACHE_DIR))
+    for root in (cache_dir, WDM_CACHE_DIR):
+        candidates.extend(_executables(root))
+    for name in DRIVER_NAMES:
+        found = shutil.which(name)
+        if found:
+            candidates.append(found)
+    # Sin duplicados (la caché puede estar en el PATH)
+    return list(dict.fromkeys(os.path.realpath(path) for path in candidates))
+
+
+def find_chrome():
+    """
+    Busca el binario de Chrome instalado.
+
+    Returns:
+        str: Ruta al binario, o None si no se encontró
+    """
+    env_path = os.environ.get(ENV_CHROME)
+    if env_path:
+        return env_path
+    for name in CHROME_NAMES:
+        found = shutil.which(name)
+        if found:
+            return found
+    for path in CHROME_PATHS:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _executables(root):
+    """Devuelve los chromedriver de un directorio de caché, el más reciente primero."""
+    if not root.is_dir():
+        return []
+    candidates = [
+        path for name in DRIVER_NAMES for path in root.rglob(name)
+        if path.is_file() and os.access(path, os.X_OK)
+    ]
+    return [str(path) for path in sorted(candidates, key=lambda p: p.stat().st_mtime, reverse=True)]
+
+
+# ==================== VERIFICACIÓN DE VERSIONES ====================
+
+def probe_version(executable):
+    """
+    Ejecuta '<binario> --version' y extrae el número de versión.
+
+    Args:
+        executable: Ruta al binario de Chrome o chromedriver
+
+    Returns:
+        str: Versión completa (ej. '120.0.6099.109'), o None si no se pudo leer
+    """
+    try:
+        output = subprocess.run(
+            [executable, "--version"], capture_output=True, text=True, timeout=15
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def _major(version):
+    return version.split(".")[0] if version else None
+
+
+def _fingerprint(path):
+    """Identifica un binario por ruta, tamaño y fecha de modificación."""
+    if not path:
+        return None
+    stat = os.stat(path)
+    return {"path": path, "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+# ==================== ARCHIVO DE BLOQUEO ====================
+
+def _read_lock():
+    try:
+        with open(LOCK_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_lock(data):
+    """Escribe el bloqueo de forma atómica (seguro con varios workers de xdist)."""
+    tmp = LOCK_FILE.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, LOCK_FILE)
+
+
+# ==================== RESOLUCIÓN ====================
+
+def _download_driver():
+    """Descarga el driver con webdriver-manager (solo si se habilitó explícitamente)."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def _locked(lock, candidates, chrome_fp):
+    """
+    Candidato elegido en una resolución anterior, si sigue siendo el primero
+    compatible: los que lo preceden son los mismos que se descartaron entonces
+    y Chrome no cambió.
+
+    Returns:
+        str: Ruta del driver, o None si hay que volver a verificar
+    """
+    if not lock or lock.get("chrome") != chrome_fp:
+        return None
+    rejected = lock.get("rejected", [])
+    for path in candidates:
+        fingerprint = _fingerprint(path)
+        if fingerprint == lock.get("driver"):
+            return path
+        if fingerprint not in rejected:
+            return None
+    return None
+
+
+def _incompatibility(driver_version, chrome_version):
+    """Motivo por el que un driver no sirve para el Chrome instalado, o None."""
+    if driver_version is None:
+        return "versión desconocida (no respondió a --version)"
+    if chrome_version is not None and _major(driver_version) != _major(chrome_version):
+        return f"versión {driver_version}, se requiere la {_major(chrome_version)}"
+    return None
+
+
+def resolve_driver():
+    """
+    Resuelve el chromedriver a usar en la sesión.
+
+    Si el archivo de bloqueo coincide con los binarios actuales se devuelve sin
+    ejecutar ningún proceso; en caso contrario se prueban los candidatos en
+    orden (ver find_drivers) y se usa el primero cuya versión mayor coincide con
+    la de Chrome, registrando en el bloqueo el elegido y los descartados.
+
+    Returns:
+        ResolvedDriver: Rutas y versiones verificadas
+
+    Raises:
+        DriverResolutionError: Si no hay driver local o ninguno es compatible
+    """
+    candidates = find_drivers()
+    chrome_path = find_chrome()
+    chrome_fp = _fingerprint(chrome_path) if chrome_path and os.path.isfile(chrome_path) else None
+
+    lock = _read_lock()
+    locked = _locked(lock, candidates, chrome_fp)
+    if locked is not None:
+        return ResolvedDriver(locked, lock["driver_version"], chrome_path, lock["chrome_version"])
+
+    chrome_version = probe_version(chrome_path) if chrome_path else None
+    if chrome_version is None:
+        logger.warning("No se pudo determinar la versión de Chrome; se omite la verificación")
+
+    rejected, reasons = [], []
+    for path in candidates:
+        driver_version = probe_version(path)
+        reason = _incompatibility(driver_version, chrome_version)
+        if reason is None:
+            break
+        logger.warning("chromedriver descartado (%s): %s", path, reason)
+        rejected.append(_fingerprint(path))
+        reasons.append(f"  {path}: {reason}")
+    else:
+        if os.environ.get(ENV_ALLOW_DOWNLOAD) != "1":
+            found = ("Candidatos descartados:\n" + "\n".join(reasons) + "\n") if reasons \
+                else "No se encontró chromedriver. "
+            raise DriverResolutionError(
+                f"{found}Chrome instalado: {chrome_version or 'versión desconocida'} "
+                f"({chrome_path}). Define la variable {ENV_DRIVER}, copia un driver "
+                f"compatible en {os.environ.get(ENV_CACHE, DEFAULT_CACHE_DIR)} o agrégalo al PATH "
+                f"(o usa {ENV_ALLOW_DOWNLOAD}=1 para descargarlo)."
+            )
+        path = _download_driver()
+        driver_version = probe_version(path)
+
+    _write_lock({
+        "driver": _fingerprint(path),
+        "driver_version": driver_version,
+        "rejected": rejected,
+        "chrome": chrome_fp,
+        "chrome_version": chrome_version,
+    })
+    logger.info("chromedriver %s (%s) verificado contra Chrome %s", driver_version, path, chrome_version)
+    return ResolvedDriver(path, driver_version, chrome_path, chrome_version)
+
+
+if __name__ == "__main__":
+    resolved = resolve_driver()
+    for field, value in resolved._asdict().items():
+        print(f"{field}: {value}")
@@ -0,0 +1,391 @@
+"""
+Generador de carga: reproduce los casos CSV de Data/ como tráfico concurrente.
+Cada usuario virtual es un cliente HTTP asíncrono (aiohttp) con sus propias
+cookies que, en bucle, abre el formulario, lo envía con un caso del CSV y
+consulta la lista a la que redirige el envío (la página que llama a
+GetAllAsync). Al final se reporta throughput, latencias p50/p95/p99 y tasa de
+error por operación, nombrada por módulo y paso ('productos form',
+'productos submit', 'productos list') porque la URL no alcanza: en productos el
+formulario y la lista son la misma página.
+
+Uso:
+    python -m utils.load_generator --base-url http://localhost:5020 \\
+        --users 10,50,100 --duration 30 --modules clientes,productos
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import time
+from collections import defaultdict, namedtuple
+from urllib.parse import urljoin
+
+import aiohttp
+
+from pages.cliente_page import ClientePage
+from pages.http_pages import ANTIFORGERY_FIELD, RazorPageParser, field_name
+from pages.producto_page import ProductoPage
+from pages.repartidor_page import RepartidorPage
+from utils.data_loader import load_cases
+
+
+# ==================== FORMULARIOS ====================
+
+# name: módulo (prefijo de las operaciones); data_file: CSV con los casos;
+# create_path: página del formulario; index_path: lista consultada después del
+# envío si la respuesta no indica otra; fields: {columna: locator} tomado de los
+# Page Objects; transforms: {columna: función} para adaptar valores
+FormSpec = namedtuple(
+    "FormSpec", ["name", "data_file", "create_path", "index_path", "fields", "transforms"]
+)
+
+# Pasos de un envío: abrir el formulario, enviarlo, abrir la lista tras la redirección
+STEP_FORM = "form"
+STEP_SUBMIT = "submit"
+STEP_LIST = "list"
+
+FORMS = {
+    "clientes": FormSpec(
+        name="clientes",
+        data_file="clientes_tests.csv",
+        create_path="/Clientes/Create",
+        index_path="/Clientes/Index",
+        fields={
+            "nombre": ClientePage.NOMBRE_INPUT,
+            "apellido": ClientePage.APELLIDO_INPUT,
+            "telefono": ClientePage.TELEFONO_INPUT,
+            "correo": ClientePage.CORREO_INPUT,
+        },
+        transforms={},
+    ),
+    "productos": FormSpec(
+        name="productos",
+        data_file="productos_tests.csv",
+        create_path="/Productos/Index",
+        index_path="/Productos/Index",
+        fields={
+            "nombre": ProductoPage.INPUT_NOMBRE,
+            "precio": ProductoPage.INPUT_PRECIO,
+            "stock": ProductoPage.INPUT_STOCK,
+            "descripcion": ProductoPage.INPUT_DESCRIPCION,
+            "categoria_id": ProductoPage.INPUT_CATEGORIA_ID,
+        },
+        transforms={},
+    ),
+    "repartidores": FormSpec(
+        name="repartidores",
+        data_file="repartidores_tests.csv",
+        create_path="/Repartidores/Create",
+        index_path="/Repartidores/Index",
+        fields={
+            "nombre": RepartidorPage.INPUT_NOMBRE,
+            "apellido": RepartidorPage.INPUT_APELLIDO,
+            "telefono": RepartidorPage.INPUT_TELEFONO,
+            "tipo": RepartidorPage.SELECT_TIPO,
+        },
+        transforms={"tipo": lambda tipo: RepartidorPage.TIPO_MAPPING.get(tipo, tipo)},
+    ),
+}
+
+
+def operation_name(spec, step):
+    """Nombre de una operación en las métricas (ej. 'productos submit')."""
+    return f"{spec.name} {step}"
+
+
+def form_values(spec, case, parsed=None):
+    """
+    Convierte un caso CSV en los campos del formulario.
+
+    Args:
+        spec: FormSpec del módulo
+        case: Diccionario con las columnas del caso
+        parsed: RazorPageParser de la página; sin él los ids se traducen por convención
+
+    Returns:
+        dict: {nombre del input: valor}
+    """
+    parsed = parsed or RazorPageParser()
+    values = {}
+    for column, locator in spec.fields.items():
+        value = case.get(column) or ""
+        transform = spec.transforms.get(column)
+        values[field_name(locator, parsed)] = transform(value) if transform and value else value
+    return values
+
+
+# ==================== MÉTRICAS ====================
+
+def percentile(samples, fraction):
+    """
+    Percentil por rango más cercano.
+
+    Args:
+        samples: Lista de valores ordenada de menor a mayor
+        fraction: Percentil entre 0 y 1 (ej. 0.95)
+
+    Returns:
+        float: Valor del percentil, o 0 si no hay muestras
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(samples)))
+    return samples[rank - 1]
+
+
+class LoadStats:
+    """Latencias y errores por operación (ej. 'clientes submit')."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, operation, seconds, error=False):
+        self.latencies[operation].append(seconds)
+        if error:
+            self.errors[operation] += 1
+
+    def summary(self):
+        """
+        Resume la ejecución.
+
+        Returns:
+            dict: {operación: {requests, rps, error_rate, p50_ms, p95_ms, p99_ms}},
+                  con la clave 'TOTAL' para el agregado
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        groups = dict(self.latencies)
+        groups["TOTAL"] = [s for values in self.latencies.values() for s in values]
+        errors = dict(self.errors)
+        errors["TOTAL"] = sum(self.errors.values())
+        result = {}
+        for operation, values in groups.items():
+            ordered = sorted(values)
+            result[operation] = {
+                "requests": len(ordered),
+                "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+                "error_rate": round(errors.get(operation, 0) / len(ordered), 4) if ordered else 0.0,
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 1),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 1),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 1),
+            }
+        return result
+
+
+# ==================== USUARIOS VIRTUALES ====================
+
+async def _timed(stats, session, method, url, operation, **kwargs):
+    """
+    Ejecuta una petición y registra su latencia.
+
+    Returns:
+        tuple: (status, texto, Location) o (None, None, None) si hubo error de conexión
+    """
+    start = time.perf_counter()
+    try:
+        async with session.request(method, url, allow_redirects=False, **kwargs) as response:
+            text = await response.text()
+            status = response.status
+            location = response.headers.get("Location")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        stats.record(operation, time.perf_counter() - start, error=True)
+        return None, None, None
+    # 2xx y 3xx son respuestas esperadas; 400 indica token antiforgery inválido
+    stats.record(operation, time.perf_counter() - start, error=status >= 400)
+    return status, text, location
+
+
+async def submit_case(stats, session, base_url, spec, case, follow=True):
+    """
+    Abre el formulario, lo envía con un caso CSV y, si se aceptó, abre la página
+    a la que redirigió el envío.
+
+    Args:
+        follow: Si es False no se abre la lista después de un envío aceptado
+
+    Returns:
+        bool: True si el servidor aceptó el envío (redirección a la lista)
+    """
+    create_url = urljoin(base_url, spec.create_path)
+    status, text, _ = await _timed(stats, session, "GET", create_url, operation_name(spec, STEP_FORM))
+    if status != 200:
+        return False
+    parsed = RazorPageParser()
+    parsed.feed(text)
+    form = dict(parsed.form_fields)
+    form.update(form_values(spec, case, parsed))
+    if ANTIFORGERY_FIELD not in form:
+        stats.record(operation_name(spec, STEP_SUBMIT), 0.0, error=True)
+        return False
+
+    post_url = urljoin(create_url, parsed.form_action or "")
+    status, _, location = await _timed(stats, session, "POST", post_url,
+                                       operation_name(spec, STEP_SUBMIT), data=form)
+    if status is None or not 300 <= status < 400:
+        return False
+    if follow:
+        list_url = urljoin(post_url, location or spec.index_path)
+        await _timed(stats, session, "GET", list_url, operation_name(spec, STEP_LIST))
+    return True
+
+
+async def virtual_user(stats, connector, base_url, workload, deadline, think_time, timeout):
+    """
+    Bucle de un usuario virtual hasta el instante límite.
+
+    Args:
+        connector: TCPConnector compartido por todos los usuarios
+        workload: Iterador infinito de (FormSpec, caso)
+        deadline: time.perf_counter() en el que el usuario se detiene
+        think_time: Pausa entre envíos en segundos
+        timeout: aiohttp.ClientTimeout por petición
+    """
+    jar = aiohttp.CookieJar(unsafe=True)
+    async with aiohttp.ClientSession(connector=connector, connector_owner=False,
+                                     cookie_jar=jar, timeout=timeout) as session:
+        while time.perf_counter() < deadline:
+            spec, case = next(workload)
+            await submit_case(stats, session, base_url, spec, case)
+            if think_time:
+                await asyncio.sleep(think_time)
+
+
+def build_workload(modules):
+    """
+    Intercala los casos de los módulos elegidos en un ciclo infinito.
+
+    Returns:
+        iterator: (FormSpec, caso) sin fin
+    """
+    per_module = [[(FORMS[m], case) for case in load_cases(FORMS[m].data_file)] for m in modules]
+    mixed = [pair for group in itertools.zip_longest(*per_module) for pair in group if pair]
+    return itertools.cycle(mixed)
+
+
+async def run_stage(base_url, users, duration, modules, ramp_up=0.0, think_time=0.0, timeout=30):
+    """
+    Ejecuta una etapa de carga con N usuarios concurrentes.
+
+    Args:
+        base_url: URL base de la aplicación
+        users: Usuarios virtuales concurrentes
+        duration: Duración de la etapa en segundos
+        modules: Módulos a ejercitar (claves de FORMS)
+        ramp_up: Segundos en los que se van sumando los usuarios
+        think_time: Pausa de cada usuario entre envíos
+        timeout: Tiempo máximo por petición
+
+    Returns:
+        LoadStats: Métricas de la etapa
+    """
+    stats = LoadStats()
+    workload = build_workload(modules)
+    deadline = time.perf_counter() + duration
+    connector = aiohttp.TCPConnector(limit=users)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def delayed(index):
+        if ramp_up:
+            await asyncio.sleep(ramp_up * index / users)
+        await virtual_user(stats, connector, base_url, workload, deadline, think_time,
+                           client_timeout)
+
+    try:
+        await asyncio.gather(*(delayed(i) for i in range(users)))
+    finally:
+        await connector.close()
+    stats.finished = time.perf_counter()
+    return stats
+
+
+async def seed_rows(base_url, module, rows, concurrency=10, timeout=30):
+    """
+    Registra filas a través del formulario de un módulo, con N envíos a la vez.
+
+    Args:
+        base_url: URL base de la aplicación
+        module: Clave de FORMS (ej. 'clientes')
+        rows: Iterable de diccionarios con las columnas del CSV
+        concurrency: Envíos simultáneos
+        timeout: Tiempo máximo por petición
+
+    Returns:
+        int: Filas aceptadas por el servidor
+    """
+    spec = FORMS[module]
+    pending = iter(rows)
+    stats = LoadStats()
+    accepted = 0
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def worker():
+        nonlocal accepted
+        jar = aiohttp.CookieJar(unsafe=True)
+        async with aiohttp.ClientSession(connector=connector, connector_owner=False,
+                                         cookie_jar=jar, timeout=client_timeout) as session:
+            for row in pending:
+                if await submit_case(stats, session, base_url, spec, row, follow=False):
+                    accepted += 1
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await connector.close()
+    return accepted
+
+
+# ==================== REPORTE ====================
+
+def format_summary(users, summary):
+    """
+    Formatea el resumen de una etapa como tabla de texto.
+    """
+    lines = [f"\n=== {users} usuarios concurrentes ===",
+             f"{'Operación':<28}{'Peticiones':>11}{'RPS':>9}{'Error %':>9}"
+             f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for operation, row in summary.items():
+        lines.append(
+            f"{operation:<28}{row['requests']:>11}{row['rps']:>9}{row['error_rate'] * 100:>9.2f}"
+            f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de carga con los casos CSV")
+    parser.add_argument("--base-url", default="http://localhost:5020")
+    parser.add_argument("--users", default="10",
+                        help="Usuarios concurrentes; varias etapas separadas por coma (ej. 10,50,100)")
+    parser.add_argument("--duration", type=float, default=30, help="Segundos por etapa")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Segundos para sumar los usuarios")
+    parser.add_argument("--think-time", type=float, default=0, help="Pausa entre envíos")
+    parser.add_argument("--timeout", type=float, default=30, help="Tiempo máximo por petición")
+    parser.add_argument("--modules", default=",".join(FORMS),
+                        help=f"Módulos separados por coma ({', '.join(FORMS)})")
+    parser.add_argument("--json", dest="json_path", help="Guardar el resumen en un archivo JSON")
+    args = parser.parse_args(argv)
+
+    modules = [m.strip() for m in args.modules.split(",") if m.strip()]
+    unknown = set(modules) - set(FORMS)
+    if unknown:
+        parser.error(f"Módulos desconocidos: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for users in (int(u) for u in args.users.split(",")):
+        stats = asyncio.run(run_stage(args.base_url, users, args.duration, modules,
+                                      args.ramp_up, args.think_time, args.timeout))
+        summary = stats.summary()
+        results[users] = summary
+        print(format_summary(users, summary))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
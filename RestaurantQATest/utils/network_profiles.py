@@ -0,0 +1,109 @@
+"""
+Perfiles de red del navegador aplicados por Chrome DevTools Protocol.
+Un perfil puede bloquear recursos que los tests no necesitan (imágenes,
+fuentes, source maps, el JS de Bootstrap y el CSS propio del sitio) y emular
+una conexión lenta. Los perfiles se combinan: 'lean,slow3g' bloquea los
+recursos y además limita la red.
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+
+# blocked_urls: patrones de Network.setBlockedURLs ('*' como comodín);
+# conditions: parámetros de Network.emulateNetworkConditions (None = red real)
+NetworkProfile = namedtuple("NetworkProfile", ["name", "blocked_urls", "conditions"])
+
+# Recursos sin efecto en los formularios: jQuery, jquery-validation y el CSS de
+# Bootstrap se conservan porque la validación y la visibilidad dependen de ellos
+NON_ESSENTIAL_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.map",
+    "*/lib/bootstrap/dist/js/*",
+    "*/js/site.js*",
+    "*/css/site.css*",
+    "*.styles.css*",
+)
+
+
+def _conditions(latency_ms, download_kbps, upload_kbps):
+    """Parámetros de emulación en el formato de CDP (bytes por segundo)."""
+    return {
+        "offline": False,
+        "latency": latency_ms,
+        "downloadThroughput": download_kbps * 1000 / 8,
+        "uploadThroughput": upload_kbps * 1000 / 8,
+    }
+
+
+# Valores de los presets "Slow 3G" y "Fast 3G" de Chrome DevTools
+PROFILES = {
+    "full": NetworkProfile("full", (), None),
+    "lean": NetworkProfile("lean", NON_ESSENTIAL_URLS, None),
+    "slow3g": NetworkProfile("slow3g", (), _conditions(2000, 400, 400)),
+    "fast3g": NetworkProfile("fast3g", (), _conditions(563, 1440, 675)),
+}
+
+# Deshace la emulación de red
+NO_THROTTLING = {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}
+
+
+def resolve_profile(spec):
+    """
+    Combina perfiles separados por coma en uno solo.
+
+    Args:
+        spec: Nombres de PROFILES (ej. 'lean,slow3g')
+
+    Returns:
+        NetworkProfile: Perfil con las URLs bloqueadas de todos y la
+                        emulación del último que define una
+
+    Raises:
+        ValueError: Si algún nombre no existe en PROFILES
+    """
+    names = [name.strip() for name in (spec or "full").split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(f"Perfiles de red desconocidos: {', '.join(unknown)} "
+                         f"(disponibles: {', '.join(PROFILES)})")
+    blocked, conditions = [], None
+    for name in names:
+        profile = PROFILES[name]
+        blocked.extend(url for url in profile.blocked_urls if url not in blocked)
+        conditions = profile.conditions or conditions
+    return NetworkProfile(",".join(names), tuple(blocked), conditions)
+
+
+def is_active(profile):
+    """Indica si el perfil cambia algo respecto de la red real."""
+    return bool(profile.blocked_urls) or profile.conditions is not None
+
+
+@contextmanager
+def network_profile(driver, profile):
+    """
+    Aplica un perfil a la pestaña actual durante un bloque y lo deshace al
+    salir, para que no afecte al siguiente test si la pestaña se reutiliza.
+
+    Args:
+        driver: WebDriver de Chrome con el foco en la pestaña del test
+        profile: NetworkProfile a aplicar
+    """
+    if not is_active(profile):
+        yield driver
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+    if profile.conditions is not None:
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", profile.conditions)
+    try:
+        yield driver
+    finally:
+        try:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            driver.execute_cdp_cmd("Network.emulateNetworkConditions", NO_THROTTLING)
+        except WebDriverException:
+            pass  # pestaña ya cerrada o sesión caída: el pool la descarta
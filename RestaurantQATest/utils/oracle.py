@@ -0,0 +1,322 @@
+"""
+Oráculo de validación: reproduce en Python las reglas de las entidades de la
+aplicación (DataAnnotations de Cliente, Producto y Repartidore) para predecir,
+sin navegador, si un caso CSV será aceptado y qué campos fallarán.
+
+También funciona como plugin de pytest: agrupa los casos en particiones de
+equivalencia según la predicción y, con el motor de navegador, ejecuta un solo
+representante por partición (salvo con --full-coverage).
+"""
+import re
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from utils.data_loader import case_of, load_cases
+
+
+# ==================== REGLAS ====================
+
+# name: nombre del input en el formulario; column: columna del CSV;
+# kind: 'text', 'decimal' o 'int'; nullable: si el valor vacío es aceptable
+# antes de aplicar las reglas; checks: reglas en el orden declarado en C#
+Field = namedtuple("Field", ["name", "column", "kind", "nullable", "checks"])
+
+# code: identificador de la regla; message: ErrorMessage de la aplicación;
+# test: función (valor) -> bool que indica si el valor es válido;
+# params: parámetros de la regla (patrón, mínimo, máximo) para generar los
+# atributos data-val-* de la validación del cliente
+Check = namedtuple("Check", ["code", "message", "test", "params"])
+
+# accepted: True si el servidor aceptaría el formulario;
+# errors: {nombre del input: [(código, mensaje), ...]}
+Prediction = namedtuple("Prediction", ["accepted", "errors"])
+
+NAME_PATTERN = r"^[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?: [A-ZÁÉÍÓÚÑ][a-záéíóúñ]+)*$"
+PHONE_PATTERN = r"^[67][0-9]{5,7}$"
+
+
+def required(message):
+    """[Required]: falla con null, vacío o solo espacios."""
+    return Check("required", message,
+                 lambda value: value is not None and bool(value.strip()), {})
+
+
+def regex(pattern, message):
+    """[RegularExpression]: el valor completo debe coincidir con el patrón."""
+    compiled = re.compile(pattern)
+    return Check("regex", message, lambda value: compiled.fullmatch(value) is not None,
+                 {"pattern": pattern})
+
+
+def length(minimum, maximum, message):
+    """[StringLength(max, MinimumLength = min)]"""
+    return Check("length", message, lambda value: minimum <= len(value) <= maximum,
+                 {"min": minimum, "max": maximum})
+
+
+def value_range(minimum, maximum, message):
+    """[Range(min, max)] sobre un valor numérico ya convertido."""
+    return Check("range", message,
+                 lambda value: Decimal(str(minimum)) <= value <= Decimal(str(maximum)),
+                 {"min": minimum, "max": maximum})
+
+
+def phone(message):
+    """[Phone]: solo dígitos y separadores telefónicos, con al menos un dígito."""
+    compiled = re.compile(r"\+?[\d\s().-]*\d[\d\s().-]*")
+    return Check("phone", message, lambda value: compiled.fullmatch(value) is not None, {})
+
+
+def email(message):
+    """[EmailAddress]: exactamente una '@', que no esté al inicio ni al final."""
+    def test(value):
+        at = value.find("@")
+        return (at > 0 and at != len(value) - 1 and value.find("@", at + 1) == -1
+                and "\r" not in value and "\n" not in value)
+    return Check("email", message, test, {})
+
+
+def _person_fields(prefix):
+    """Campos comunes de Cliente y Repartidore."""
+    return (
+        Field(f"{prefix}.Nombre", "nombre", "text", False, (
+            required("El nombre es obligatorio."),
+            regex(NAME_PATTERN, "El nombre solo puede contener letras y debe iniciar con mayúscula."),
+            length(3, 30, "El nombre no puede exceder 10 caracteres."),
+        )),
+        Field(f"{prefix}.Apellido", "apellido", "text", False, (
+            required("El apellido es obligatorio."),
+            regex(NAME_PATTERN, "El apellido solo puede contener letras y debe iniciar con mayúscula."),
+            length(3, 30, "El apellido no puede exceder 10 caracteres."),
+        )),
+        Field(f"{prefix}.Telefono", "telefono", "text", True, (
+            phone("El número de teléfono no es válido."),
+            regex(PHONE_PATTERN, "El número de teléfono debe comenzar con 6 o 7 y tener "
+                                 "un total de 7 a 8 dígitos."),
+            length(7, 8, "El número de teléfono debe tener entre 7 y 8 dígitos."),
+        )),
+    )
+
+
+CLIENTE_FIELDS = _person_fields("Cliente") + (
+    Field("Cliente.Correo", "correo", "text", False, (
+        required("El correo es obligatorio."),
+        email("El formato del correo no es válido."),
+    )),
+)
+
+PRODUCTO_FIELDS = (
+    Field("Producto.Nombre", "nombre", "text", False, (
+        required("El nombre del producto es obligatorio."),
+        length(4, 20, "El nombre del producto no puede pasar de los 20 caracteres "
+                      "y no ser menos a 4."),
+    )),
+    Field("Producto.Precio", "precio", "decimal", False, (
+        value_range(0.01, 1000, "El precio debe ser mayor a 0 y menor a 1000."),
+    )),
+    Field("Producto.Stock", "stock", "int", True, (
+        value_range(0, 150, "El stock no puede ser negativo y no mayor a 200."),
+    )),
+    Field("Producto.Descripcion", "descripcion", "text", False, (
+        required("La descripcion del producto es obligatoria."),
+        length(5, 100, "La descripcion del producto no puede pasar de los 20 caracteres "
+                       "y no ser menos a 4."),
+    )),
+    Field("Producto.CategoriaId", "categoria_id", "int", False, (
+        value_range(1, 32767, "La Categoría debe ser un número positivo mayor a cero."),
+    )),
+)
+
+REPARTIDOR_FIELDS = _person_fields("Repartidor")
+
+# Reglas que aplican a cada archivo de casos
+RULES = {
+    "clientes_tests.csv": CLIENTE_FIELDS,
+    "productos_tests.csv": PRODUCTO_FIELDS,
+    "repartidores_tests.csv": REPARTIDOR_FIELDS,
+}
+
+# Valores de la columna 'esperado' que significan aceptado
+ACCEPTED_VALUES = ("valido", "Aceptado")
+
+
+# ==================== PREDICCIÓN ====================
+
+def _convert(field, raw):
+    """
+    Simula el model binding: vacío -> null, números con formato invariante.
+
+    Returns:
+        tuple: (valor convertido, error) donde error es (código, mensaje) o None
+    """
+    value = raw if raw else None
+    prop = field.name.split(".")[-1]
+    if field.kind == "text":
+        return value, None
+    if value is None:
+        if field.nullable:
+            return None, None
+        return None, ("required", f"The {prop} field is required.")
+    try:
+        number = Decimal(value.strip())
+    except InvalidOperation:
+        return None, ("format", f"The value '{raw}' is not valid for {prop}.")
+    if not number.is_finite() or (field.kind == "int" and number != number.to_integral_value()):
+        return None, ("format", f"The value '{raw}' is not valid for {prop}.")
+    return number, None
+
+
+def predict_values(fields, values):
+    """
+    Aplica las reglas de una entidad a los valores de un formulario.
+
+    Args:
+        fields: Tupla de Field (ver RULES)
+        values: Diccionario {columna: valor en texto}
+
+    Returns:
+        Prediction: Resultado esperado y errores por campo
+    """
+    errors = {}
+    for field in fields:
+        value, error = _convert(field, values.get(field.column) or "")
+        failures = [error] if error else []
+        for check in field.checks:
+            # Como en DataAnnotations, solo [Required] se evalúa sobre null
+            if value is None and check.code != "required":
+                continue
+            if not check.test(value):
+                failures.append((check.code, check.message))
+        if failures:
+            errors[field.name] = failures
+    return Prediction(not errors, errors)
+
+
+def predict(file_name, case):
+    """
+    Predice el resultado de un caso CSV.
+
+    Args:
+        file_name: Archivo de Data/ al que pertenece el caso
+        case: Diccionario con las columnas del caso
+
+    Returns:
+        Prediction: Resultado esperado y errores por campo
+    """
+    return predict_values(RULES[file_name], case)
+
+
+def expected_accepted(case):
+    """
+    Indica si la columna 'esperado' del CSV marca el caso como aceptado.
+    """
+    return case["esperado"] in ACCEPTED_VALUES
+
+
+def partition_key(prediction):
+    """
+    Clave de la partición de equivalencia de una predicción: resultado y
+    reglas que fallan en cada campo. Dos casos con la misma clave ejercitan
+    exactamente las mismas validaciones.
+    """
+    return (prediction.accepted, tuple(sorted(
+        (name, tuple(code for code, _ in failures))
+        for name, failures in prediction.errors.items()
+    )))
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+# Marca de la sesión: se colectó o ejecutó al menos un caso CSV
+CSV_CASES_KEY = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--full-coverage", action="store_true", default=False,
+        help="Ejecutar en el navegador todos los casos CSV, no solo un "
+             "representante por partición de equivalencia"
+    )
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Anota cada caso CSV con la predicción del oráculo y, con el motor de
+    navegador, deja un único representante por partición. Los casos en los que
+    el oráculo contradice al CSV se ejecutan siempre.
+    """
+    selected, deselected, seen = [], [], set()
+    dedupe = (config.getoption("--engine") == "browser"
+              and not config.getoption("--full-coverage"))
+
+    for item in items:
+        found = case_of(item)
+        if found is None:
+            selected.append(item)
+            continue
+        file_name, case = found
+        config.stash[CSV_CASES_KEY] = True
+        prediction = predict(file_name, case)
+        item.user_properties.append(("oracle_accepted", prediction.accepted))
+        item.user_properties.append(("oracle_errors", sorted(prediction.errors)))
+
+        if prediction.accepted != expected_accepted(case):
+            selected.append(item)
+            continue
+
+        key = (item.originalname, file_name, partition_key(prediction))
+        if dedupe and key in seen:
+            deselected.append(item)
+        else:
+            seen.add(key)
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def find_mismatches():
+    """
+    Compara la predicción del oráculo con la columna 'esperado' de todos los CSV.
+
+    Returns:
+        list: Lista de tuplas (caso, esperado, Prediction) que no coinciden
+    """
+    mismatches = []
+    for file_name in RULES:
+        for case in load_cases(file_name):
+            prediction = predict(file_name, case)
+            if prediction.accepted != expected_accepted(case):
+                mismatches.append((case["caso"], case["esperado"], prediction))
+    return mismatches
+
+
+def _ran_csv_cases(terminalreporter):
+    """Indica si algún reporte de la sesión trae la predicción del oráculo."""
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if any(name == "oracle_accepted" for name, _ in getattr(report, "user_properties", ())):
+                return True
+    return False
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    # Solo si la sesión incluyó casos CSV: un `pytest tests/unit` no lo muestra.
+    # Con xdist el controlador no colecciona, pero los reportes de los workers
+    # traen la predicción que su colección agregó
+    if not (config.stash.get(CSV_CASES_KEY, False) or _ran_csv_cases(terminalreporter)):
+        return
+    mismatches = find_mismatches()
+    if not mismatches:
+        return
+    terminalreporter.section("Oráculo de validación: casos que contradicen al CSV")
+    for caso, esperado, prediction in mismatches:
+        predicted = "aceptado" if prediction.accepted else "rechazado"
+        fields = ", ".join(sorted(prediction.errors)) or "-"
+        terminalreporter.write_line(
+            f"{caso}: CSV='{esperado}', oráculo={predicted} (campos con error: {fields})"
+        )
@@ -0,0 +1,211 @@
+"""
+Métricas de carga de página por navegación.
+Cada vez que un Page Object navega o envía un formulario que carga un documento
+nuevo, BasePage.capture_navigation lee Navigation Timing y Resource Timing
+(TTFB, espera del servidor, DOMContentLoaded, load y bytes transferidos) y los
+entrega a este módulo. Como plugin de pytest los agrupa por ruta
+('/Clientes/Create', '/Productos/Index', ...) y escribe un JSON junto al
+reporte HTML; con pytest-xdist cada worker envía sus muestras al controlador.
+"""
+import json
+import os
+import statistics
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import pytest
+
+
+COLLECTOR_KEY = pytest.StashKey()
+WORKER_OUTPUT_KEY = "page_metrics"
+DEFAULT_PATH = os.path.join("reports", "page_metrics.json")
+
+# Métricas por navegación: nombre en el JSON -> función (entrada) -> valor o None
+METRICS = {
+    "ttfb_ms": lambda e: e.get("ttfb"),
+    "server_ms": lambda e: e.get("server"),
+    "dom_content_loaded_ms": lambda e: e.get("dom_content_loaded"),
+    "load_ms": lambda e: e.get("load"),
+    "document_bytes": lambda e: e.get("transfer_size"),
+    "resource_count": lambda e: len(e.get("resources") or []),
+    "resource_bytes": lambda e: sum(r.get("transfer_size") or 0 for r in e.get("resources") or []),
+}
+
+# Driver -> función que recibe cada entrada de Navigation Timing
+_listeners = weakref.WeakKeyDictionary()
+
+
+def navigation_listener(driver):
+    """
+    Obtiene la función que registra las navegaciones de un driver.
+
+    Returns:
+        callable: Función (entrada) o None si no se están registrando métricas
+    """
+    return _listeners.get(driver)
+
+
+@contextmanager
+def record_navigations(config, driver):
+    """
+    Registra en el colector de la sesión las navegaciones del driver durante un bloque.
+
+    Args:
+        config: Config de pytest (el colector vive en su stash)
+        driver: WebDriver prestado al test
+    """
+    collector = config.stash.get(COLLECTOR_KEY, None)
+    if collector is None:
+        yield
+        return
+    _listeners[driver] = collector.add
+    try:
+        yield
+    finally:
+        _listeners.pop(driver, None)
+
+
+def route_of(url):
+    """
+    Ruta de una URL para agrupar: sin query string y con '/Index' explícito.
+
+    Args:
+        url: URL de la página (ej. 'http://localhost:5020/Clientes?page=2')
+
+    Returns:
+        str: Ruta normalizada (ej. '/Clientes/Index')
+    """
+    parts = [part for part in urlsplit(url).path.split("/") if part]
+    if len(parts) < 2:
+        parts.append("Index")
+    return "/" + "/".join(parts)
+
+
+def _describe(values):
+    """Resumen de una métrica: cantidad, media, p50, p95 y máximo."""
+    ordered = sorted(values)
+    p95 = statistics.quantiles(ordered, n=20)[18] if len(ordered) > 1 else ordered[0]
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.fmean(ordered), 1),
+        "p50": round(statistics.median(ordered), 1),
+        "p95": round(p95, 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+class PageMetricsCollector:
+    """Acumula las muestras de cada métrica por ruta."""
+
+    def __init__(self):
+        self.samples = defaultdict(lambda: defaultdict(list))
+        self.resources = defaultdict(lambda: defaultdict(list))
+
+    def add(self, entry):
+        """
+        Registra una navegación.
+
+        Args:
+            entry: Diccionario devuelto por NAVIGATION_TIMING_SCRIPT
+        """
+        route = route_of(entry["url"])
+        for name, extract in METRICS.items():
+            value = extract(entry)
+            if value is not None:
+                self.samples[route][name].append(value)
+        for timing in entry.get("server_timing") or []:
+            self.samples[route][f"server_timing.{timing['name']}_ms"].append(timing["duration"])
+        for resource in entry.get("resources") or []:
+            metrics = self.resources[urlsplit(resource["name"]).path]
+            metrics["duration_ms"].append(resource["duration"])
+            metrics["bytes"].append(resource.get("transfer_size") or 0)
+
+    def export(self):
+        """
+        Muestras en formato serializable (para enviarlas desde un worker).
+
+        Returns:
+            dict: {'routes': {...}, 'resources': {...}}
+        """
+        def plain(groups):
+            return {key: {name: list(values) for name, values in metrics.items()}
+                    for key, metrics in groups.items()}
+        return {"routes": plain(self.samples), "resources": plain(self.resources)}
+
+    def merge(self, exported):
+        """
+        Incorpora las muestras exportadas por otro colector.
+
+        Args:
+            exported: Resultado de export()
+        """
+        for target, groups in ((self.samples, exported["routes"]),
+                               (self.resources, exported["resources"])):
+            for key, metrics in groups.items():
+                for name, values in metrics.items():
+                    target[key][name].extend(values)
+
+    def summary(self):
+        """
+        Resumen por ruta de página y por recurso estático.
+
+        Returns:
+            dict: {'routes': {ruta: {'navigations': n, métrica: resumen}},
+                   'resources': {ruta del recurso: {métrica: resumen}}}
+        """
+        routes = {}
+        for route, metrics in sorted(self.samples.items()):
+            routes[route] = {"navigations": len(metrics.get("ttfb_ms", []))}
+            routes[route].update({name: _describe(values)
+                                  for name, values in sorted(metrics.items()) if values})
+        resources = {path: {name: _describe(values) for name, values in metrics.items() if values}
+                     for path, metrics in sorted(self.resources.items())}
+        return {"routes": routes, "resources": resources}
+
+
+def write_summary(path, summary):
+    """Escribe el resumen como JSON de forma atómica."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--page-metrics", default=DEFAULT_PATH, metavar="PATH",
+        help="JSON con las métricas de carga por ruta (vacío para no registrarlas)"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--page-metrics"):
+        config.stash[COLLECTOR_KEY] = PageMetricsCollector()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Controlador de xdist: incorpora las muestras de un worker que terminó."""
+    collector = node.config.stash.get(COLLECTOR_KEY, None)
+    exported = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if collector is not None and exported:
+        collector.merge(exported)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    collector = config.stash.get(COLLECTOR_KEY, None)
+    if collector is None:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = collector.export()
+    elif collector.samples:
+        write_summary(config.getoption("--page-metrics"), collector.summary())
@@ -0,0 +1,389 @@
+"""
+Resultados de la suite como flujo JSONL.
+Cada test se escribe en una línea apenas termina su teardown (resultado,
+duración de cada fase, error y mensajes de validación de la página), así la
+memoria no crece con la cantidad de tests y una ejecución abortada conserva lo
+ya ejecutado. Con pytest-xdist solo el controlador escribe: recibe los reportes
+de todos los workers. El reporte HTML se genera al final leyendo el archivo
+línea por línea, o después a mano:
+
+    python -m utils.result_stream reports/latest/results.jsonl -o reports/latest/report.html
+
+Sin rutas explícitas cada ejecución escribe en su propio directorio
+reports/runs/<fecha>/ y reports/latest apunta a la última, así una corrida de
+los tests unitarios, de los benchmarks o un `-k` no pisan el reporte de la
+suite funcional. Si solo se piden tests/unit o benchmarks no se escribe nada.
+"""
+import argparse
+import html
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from utils.command_metrics import html_breakdown
+from utils.data_loader import case_id
+
+
+REPORTS_DIR = "reports"
+RUNS_DIR = os.path.join(REPORTS_DIR, "runs")
+LATEST_LINK = os.path.join(REPORTS_DIR, "latest")
+JSONL_NAME = "results.jsonl"
+HTML_NAME = "report.html"
+
+# Ejecuciones que se conservan en RUNS_DIR; las más viejas se borran
+RUNS_KEPT = 20
+
+# Tests que no son de la suite funcional: si solo se piden estos, sin rutas
+# explícitas no se escribe el flujo
+AUXILIARY_DIRS = (os.path.join("tests", "unit"), "benchmarks")
+
+# Fixtures de Page Objects de las que se toman los mensajes de validación
+PAGE_FIXTURES = ("cliente_page", "producto_page", "repartidor_page")
+
+# Largo máximo del texto de un error guardado en el flujo
+MAX_LONGREPR = 20000
+
+
+# ==================== REGISTRO ====================
+
+def final_outcome(phases):
+    """
+    Resultado de un test a partir de sus fases.
+
+    Args:
+        phases: {'setup'|'call'|'teardown': {'outcome': ..., 'duration': ...}}
+
+    Returns:
+        str: 'passed', 'failed', 'error' (falló setup o teardown), 'skipped'
+             o 'rerun' (intento fallido que se reintentó, ver utils/flaky.py)
+    """
+    outcomes = {when: phase["outcome"] for when, phase in phases.items()}
+    if "rerun" in outcomes.values():
+        return "rerun"
+    if outcomes.get("call") == "failed":
+        return "failed"
+    if "failed" in outcomes.values():
+        return "error"
+    if "skipped" in outcomes.values():
+        return "skipped"
+    return "passed"
+
+
+class ResultStream:
+    """
+    Escribe un registro JSONL por test en el controlador de la sesión.
+    """
+
+    def __init__(self, path, html_path=None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.html_path = html_path
+        # Con buffering=1 cada línea llega al sistema operativo al escribirse
+        self.file = open(path, "w", encoding="utf-8", buffering=1)
+        self.pending = {}
+        self.started = time.time()
+        self._write({"type": "session_start", "time": self.started})
+
+    def _write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def pytest_runtest_logreport(self, report):
+        record = self.pending.setdefault(report.nodeid, {
+            "type": "test", "nodeid": report.nodeid, "phases": {}, "properties": {},
+        })
+        record["phases"][report.when] = {
+            "outcome": report.outcome, "duration": round(report.duration, 4),
+        }
+        record["properties"].update(dict(report.user_properties))
+        if report.failed and report.longrepr is not None:
+            record.setdefault("errors", {})[report.when] = str(report.longrepr)[:MAX_LONGREPR]
+        if report.when == "teardown":
+            del self.pending[report.nodeid]
+            self._finish(record, final_outcome(record["phases"]))
+
+    def _finish(self, record, outcome):
+        record["outcome"] = outcome
+        record["duration"] = round(sum(p["duration"] for p in record["phases"].values()), 4)
+        record["case"] = record["properties"].pop("case", None)
+        record["validation"] = record["properties"].pop("validation_errors", None)
+        self._write(record)
+
+    def close(self, exitstatus):
+        """
+        Cierra el flujo con el registro de fin de sesión. Los tests que no
+        llegaron al teardown (ejecución interrumpida) se escriben como 'interrupted'.
+        """
+        for record in self.pending.values():
+            self._finish(record, "interrupted")
+        self.pending.clear()
+        self._write({"type": "session_finish", "time": time.time(),
+                     "duration": round(time.time() - self.started, 2),
+                     "exitstatus": int(exitstatus)})
+        self.file.close()
+
+
+# ==================== REPORTE HTML ====================
+
+def iter_records(path):
+    """
+    Lee los registros del flujo uno a uno. Una última línea incompleta
+    (ejecución abortada) se ignora.
+
+    Yields:
+        dict: Registro JSONL
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="es"><head><meta charset="utf-8"><title>RestaurantQA - Resultados</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td, th {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; vertical-align: top; }}
+.passed {{ background: #e6f4ea; }} .failed, .error {{ background: #fce8e6; }}
+.skipped, .interrupted, .rerun {{ background: #fef7e0; }}
+pre {{ white-space: pre-wrap; margin: 0; font-size: 12px; }}
+</style></head><body>
+<h1>RestaurantQA - Resultados</h1>
+<p>{summary}</p>
+<table><tr><th>Test</th><th>Caso</th><th>Resultado</th><th>Duración (s)</th><th>Detalle</th></tr>
+"""
+
+# Casos en cuarentena (utils/flaky.py): su resultado no afecta a la suite
+HTML_QUARANTINE = """</table>
+<h2>Cuarentena</h2>
+<table><tr><th>Test</th><th>Caso</th><th>Resultado</th><th>Duración (s)</th><th>Detalle</th></tr>
+"""
+
+HTML_TAIL = "</table></body></html>\n"
+
+
+def _details(record):
+    parts = []
+    for when, text in (record.get("errors") or {}).items():
+        parts.append(f"<details open><summary>Error en {when}</summary>"
+                     f"<pre>{html.escape(text)}</pre></details>")
+    if record.get("validation"):
+        parts.append("<details><summary>Mensajes de validación</summary><pre>"
+                     f"{html.escape(json.dumps(record['validation'], ensure_ascii=False, indent=1))}"
+                     "</pre></details>")
+    properties = dict(record.get("properties") or {})
+    commands = properties.pop("webdriver_commands", None)
+    if commands:
+        parts.append(f"<details><summary>Comandos WebDriver ({commands['commands']})</summary>"
+                     f"{html_breakdown(commands)}</details>")
+    if properties:
+        parts.append("<details><summary>Propiedades</summary><pre>"
+                     f"{html.escape(json.dumps(properties, ensure_ascii=False, indent=1))}"
+                     "</pre></details>")
+    return "".join(parts)
+
+
+def _row(record):
+    return (
+        f'<tr class="{record["outcome"]}"><td>{html.escape(record["nodeid"])}</td>'
+        f'<td>{html.escape(record.get("case") or "")}</td><td>{record["outcome"]}</td>'
+        f'<td>{record["duration"]}</td><td>{_details(record)}</td></tr>\n'
+    )
+
+
+def render_html(jsonl_path, html_path):
+    """
+    Genera el reporte HTML desde el flujo JSONL sin cargarlo entero en memoria:
+    una pasada cuenta los resultados, otra escribe las filas y, si hay casos en
+    cuarentena, una tercera los escribe en su propia sección.
+
+    Args:
+        jsonl_path: Archivo de resultados
+        html_path: Archivo HTML a escribir
+    """
+    counts, finished, quarantined = {}, None, 0
+    for record in iter_records(jsonl_path):
+        if record["type"] == "test" and "quarantine" in record["properties"]:
+            quarantined += 1
+        elif record["type"] == "test":
+            counts[record["outcome"]] = counts.get(record["outcome"], 0) + 1
+        elif record["type"] == "session_finish":
+            finished = record
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(counts.items())) or "Sin tests"
+    if quarantined:
+        summary += f", {quarantined} en cuarentena"
+    summary += (f" en {finished['duration']} s" if finished
+                else " (ejecución incompleta)")
+
+    tmp_path = f"{html_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        out.write(HTML_HEAD.format(summary=html.escape(summary)))
+        for record in iter_records(jsonl_path):
+            if record["type"] == "test" and "quarantine" not in record["properties"]:
+                out.write(_row(record))
+        if quarantined:
+            out.write(HTML_QUARANTINE)
+            for record in iter_records(jsonl_path):
+                if record["type"] == "test" and "quarantine" in record["properties"]:
+                    out.write(_row(record))
+        out.write(HTML_TAIL)
+    os.replace(tmp_path, html_path)
+
+
+# ==================== EJECUCIONES ====================
+
+def auxiliary_only(args, invocation_dir, rootdir):
+    """
+    Indica si todas las rutas pedidas son tests unitarios o benchmarks.
+
+    Args:
+        args: Argumentos posicionales de pytest (rutas, con o sin '::test')
+        invocation_dir: Directorio desde el que se invocó pytest
+        rootdir: Raíz del proyecto
+
+    Returns:
+        bool: False si no hay rutas o alguna sale de AUXILIARY_DIRS
+    """
+    if not args:
+        return False
+    for arg in args:
+        path = os.path.abspath(os.path.join(str(invocation_dir), arg.split("::")[0]))
+        relative = os.path.relpath(path, str(rootdir))
+        if not any(relative == d or relative.startswith(d + os.sep) for d in AUXILIARY_DIRS):
+            return False
+    return True
+
+
+def run_directory(runs_dir=RUNS_DIR):
+    """
+    Directorio propio de una ejecución: fecha, hora y PID para que dos
+    ejecuciones en el mismo segundo no compartan archivos.
+    """
+    name = time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+    return os.path.join(runs_dir, name)
+
+
+def point_latest(directory, link=LATEST_LINK):
+    """
+    Hace que `link` apunte al directorio de la ejecución. El symlink se
+    reemplaza de forma atómica; donde no se pueden crear symlinks se escribe la
+    ruta en `link`.txt.
+    """
+    tmp_link = f"{link}.{os.getpid()}.tmp"
+    target = os.path.relpath(directory, os.path.dirname(link) or ".")
+    try:
+        os.symlink(target, tmp_link, target_is_directory=True)
+        os.replace(tmp_link, link)
+    except OSError:
+        if os.path.lexists(tmp_link):
+            os.remove(tmp_link)
+        with open(f"{link}.txt", "w", encoding="utf-8") as file:
+            file.write(directory + "\n")
+
+
+def prune_runs(runs_dir=RUNS_DIR, keep=RUNS_KEPT):
+    """Borra las ejecuciones más viejas y conserva las últimas `keep`."""
+    if not os.path.isdir(runs_dir):
+        return
+    runs = sorted(name for name in os.listdir(runs_dir)
+                  if os.path.isdir(os.path.join(runs_dir, name)))
+    for name in runs[:-keep] if keep else runs:
+        shutil.rmtree(os.path.join(runs_dir, name), ignore_errors=True)
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+STREAM_KEY = pytest.StashKey()
+RUN_DIR_KEY = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--results-jsonl", default=None, metavar="PATH",
+        help="Flujo JSONL con un registro por test (por defecto "
+             "reports/runs/<fecha>/results.jsonl; vacío para desactivarlo)"
+    )
+    group.addoption(
+        "--results-html", default=None, metavar="PATH",
+        help="Reporte HTML generado desde el flujo al terminar (por defecto junto "
+             "al JSONL, con extensión .html; vacío para omitirlo)"
+    )
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        return
+    path = config.getoption("--results-jsonl")
+    html_path = config.getoption("--results-html")
+    if path is None:
+        if auxiliary_only(config.args, config.invocation_params.dir, config.rootpath):
+            return
+        directory = run_directory()
+        config.stash[RUN_DIR_KEY] = directory
+        path = os.path.join(directory, JSONL_NAME)
+        if html_path is None:
+            html_path = os.path.join(directory, HTML_NAME)
+    if not path:
+        return
+    if html_path is None:
+        html_path = os.path.splitext(path)[0] + ".html"
+    stream = ResultStream(path, html_path)
+    config.stash[STREAM_KEY] = stream
+    config.pluginmanager.register(stream, "restaurantqa-result-stream")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Agrega al reporte el caso CSV, los mensajes de validación de la página y
+    los aciertos de su caché de elementos.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "setup":
+        report.user_properties.append(("case", case_id(item)))
+    if report.when != "call":
+        return
+    funcargs = getattr(item, "funcargs", {})
+    for name in PAGE_FIXTURES:
+        snapshot = getattr(funcargs.get(name), "last_validation", None)
+        if snapshot:
+            report.user_properties.append(("validation_errors", snapshot))
+            break
+    for name in PAGE_FIXTURES:
+        elements = getattr(funcargs.get(name), "elements", None)
+        if elements is not None:
+            report.user_properties.append(("element_cache", elements.stats()))
+            break
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    stream = config.stash.get(STREAM_KEY, None)
+    if stream is None:
+        return
+    stream.close(exitstatus)
+    if stream.html_path:
+        render_html(stream.path, stream.html_path)
+    directory = config.stash.get(RUN_DIR_KEY, None)
+    if directory is not None:
+        point_latest(directory)
+        prune_runs()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera el reporte HTML desde el flujo JSONL")
+    parser.add_argument("jsonl", nargs="?", default=os.path.join(LATEST_LINK, JSONL_NAME))
+    parser.add_argument("-o", "--output", default=os.path.join(LATEST_LINK, HTML_NAME))
+    args = parser.parse_args()
+    render_html(args.jsonl, args.output)
+    print(f"Reporte generado: {args.output}")
@@ -0,0 +1,308 @@
+"""
+Planificación de tests según su duración histórica.
+Guarda la duración de cada test en la caché de pytest y la usa para:
+- ordenar los tests de mayor a menor duración,
+- repartirlos entre los workers de pytest-xdist (bin packing "longest first"
+  como reparto inicial y robo de trabajo para la cola final, con un scheduler
+  propio que reemplaza a --dist load),
+- dividir la suite en shards deterministas para varias máquinas.
+Los tests que no se ejecutan en MAX_IDLE_RUNS sesiones salen del historial.
+"""
+import json
+import os
+import re
+import statistics
+from collections import defaultdict
+
+import pytest
+
+try:
+    from xdist.scheduler import WorkStealingScheduling
+except ImportError:  # sin pytest-xdist (o anterior a 3.2) solo se ordena y se divide en shards
+    WorkStealingScheduling = None
+
+
+CACHE_KEY = "restaurantqa/durations"
+# {'run': número de sesión, 'tests': {nodeid: última sesión en que se ejecutó}}
+LAST_SEEN_KEY = "restaurantqa/durations_last_seen"
+
+# Sesiones sin ejecutarse tras las que un test sale del historial
+MAX_IDLE_RUNS = 30
+
+# Peso del último valor en la media móvil de duraciones
+SMOOTHING = 0.5
+
+# Duración asumida para tests sin historial, si tampoco hay mediana
+DEFAULT_DURATION = 1.0
+
+SHARD_PATTERN = re.compile(r"^(\d+)/(\d+)$")
+
+
+# ==================== HISTORIAL ====================
+
+def load_durations(config):
+    """
+    Lee el historial de duraciones.
+
+    Returns:
+        dict: {nodeid: segundos}
+    """
+    if getattr(config, "cache", None) is None:
+        return {}
+    return config.cache.get(CACHE_KEY, {})
+
+
+def merge_durations(history, measured):
+    """
+    Combina el historial con las duraciones medidas en esta ejecución.
+
+    Args:
+        history: {nodeid: segundos} previo
+        measured: {nodeid: segundos} de esta ejecución
+
+    Returns:
+        dict: Historial actualizado (media móvil exponencial)
+    """
+    merged = dict(history)
+    for nodeid, seconds in measured.items():
+        previous = merged.get(nodeid)
+        merged[nodeid] = round(
+            seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous, 4
+        )
+    return merged
+
+
+def prune_durations(history, last_seen, run, max_idle=MAX_IDLE_RUNS):
+    """
+    Descarta del historial los tests que no se ejecutan hace más de max_idle
+    sesiones (renombrados, borrados o fuera de la selección habitual).
+
+    Args:
+        history: {nodeid: segundos}
+        last_seen: {nodeid: última sesión en que se ejecutó}; sin dato cuenta como run
+        run: Número de la sesión actual
+
+    Returns:
+        dict: Historial sin los tests inactivos
+    """
+    return {n: s for n, s in history.items() if run - last_seen.get(n, run) <= max_idle}
+
+
+# ==================== BIN PACKING ====================
+
+def estimate(nodeids, durations):
+    """
+    Estima la duración de cada test; los que no tienen historial reciben la
+    mediana de los conocidos.
+
+    Args:
+        nodeids: Identificadores de los tests
+        durations: Historial {nodeid: segundos}
+
+    Returns:
+        dict: {nodeid: segundos}
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {n: durations.get(n, fallback) for n in nodeids}
+
+
+def pack(nodeids, weights, bins):
+    """
+    Reparte elementos en N grupos de peso similar (LPT: el más largo primero
+    al grupo con menos carga). Determinista: los empates se resuelven por nodeid
+    y por índice de grupo.
+
+    Args:
+        nodeids: Identificadores a repartir
+        weights: {nodeid: peso}
+        bins: Cantidad de grupos
+
+    Returns:
+        list: Lista de N listas de nodeids, cada una ordenada de mayor a menor peso
+    """
+    groups = [[] for _ in range(bins)]
+    loads = [0.0] * bins
+    for nodeid in sorted(nodeids, key=lambda n: (-weights[n], n)):
+        target = min(range(bins), key=lambda i: (loads[i], i))
+        groups[target].append(nodeid)
+        loads[target] += weights[nodeid]
+    return groups
+
+
+def parse_shard(value):
+    """
+    Convierte 'K/N' en (K, N) con 1 <= K <= N.
+    """
+    match = SHARD_PATTERN.match(value or "")
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise pytest.UsageError(f"--shard debe tener la forma K/N con 1 <= K <= N: {value!r}")
+    return int(match.group(1)), int(match.group(2))
+
+
+def _read_shard_file(path, index, total):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if len(data["shards"]) != total:
+        raise pytest.UsageError(
+            f"{path} tiene {len(data['shards'])} shards, se pidió el {index}/{total}"
+        )
+    return data["shards"][index - 1]
+
+
+def _write_shard_file(path, groups, weights):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        "shards": groups,
+        "estimated_seconds": [round(sum(weights[n] for n in group), 2) for group in groups],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--schedule", choices=("duration", "file"), default=None,
+        help="Orden de ejecución: 'duration' (más largos primero, repartidos entre "
+             "workers según el historial) o 'file' (orden de los archivos). Por "
+             "defecto 'duration' con -n y 'file' sin xdist"
+    )
+    group.addoption(
+        "--shard", default=None, metavar="K/N",
+        help="Ejecutar solo el shard K de N (balanceado por duración)"
+    )
+    group.addoption(
+        "--shard-file", default=None,
+        help="JSON con las listas de shards: con --shard se lee, con --export-shards se escribe"
+    )
+    group.addoption(
+        "--export-shards", type=int, default=0, metavar="N",
+        help="Escribir en --shard-file (por defecto reports/shards.json) la división "
+             "en N shards; usar junto con --collect-only"
+    )
+
+
+def schedule_mode(config):
+    """
+    Orden de ejecución efectivo: el de --schedule o, si no se indicó,
+    'duration' al repartir entre workers de xdist y 'file' en una ejecución serie.
+    """
+    mode = config.getoption("--schedule")
+    if mode is not None:
+        return mode
+    distributed = hasattr(config, "workerinput") or config.getoption("dist", "no") != "no"
+    return "duration" if distributed else "file"
+
+
+def pytest_configure(config):
+    if config.getoption("--shard"):
+        parse_shard(config.getoption("--shard"))
+    distributed = config.getoption("numprocesses", None) or config.getoption("dist", "no") != "no"
+    if config.getoption("--export-shards") and distributed:
+        raise pytest.UsageError("--export-shards no funciona con -n: el controlador de xdist "
+                                "no colecciona y no escribiría los shards")
+    # Con xdist el controlador recibe los reportes de todos los workers y es
+    # el único que guarda el historial
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config), "restaurantqa-durations")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Aplica shards y orden por duración. Se ejecuta al final para trabajar sobre
+    la selección ya filtrada (p. ej. por el oráculo). Con xdist todos los
+    workers obtienen el mismo orden porque leen el mismo historial.
+    """
+    if not items:
+        return
+    nodeids = [i.nodeid for i in items]
+    weights = estimate(nodeids, load_durations(config))
+
+    export = config.getoption("--export-shards")
+    if export and not hasattr(config, "workerinput"):
+        path = config.getoption("--shard-file") or os.path.join("reports", "shards.json")
+        _write_shard_file(path, pack(nodeids, weights, export), weights)
+
+    shard = config.getoption("--shard")
+    if shard:
+        index, total = parse_shard(shard)
+        if config.getoption("--shard-file"):
+            selected = set(_read_shard_file(config.getoption("--shard-file"), index, total))
+        else:
+            selected = set(pack(nodeids, weights, total)[index - 1])
+        config.hook.pytest_deselected(items=[i for i in items if i.nodeid not in selected])
+        items[:] = [i for i in items if i.nodeid in selected]
+
+    if schedule_mode(config) == "duration":
+        items.sort(key=lambda i: (-weights[i.nodeid], i.nodeid))
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Reemplaza el reparto de --dist load/worksteal por el bin packing por duración."""
+    if (WorkStealingScheduling is None or schedule_mode(config) != "duration"
+            or config.getvalue("dist") not in ("load", "worksteal")):
+        return None
+    return DurationScheduling(config, log)
+
+
+if WorkStealingScheduling is not None:
+
+    class DurationScheduling(WorkStealingScheduling):
+        """
+        Scheduler de xdist que asigna a cada worker un grupo de tests de
+        duración total similar, ordenado de mayor a menor. Si la estimación
+        falla (tests sin historial, un servidor lento), el worker que se queda
+        sin trabajo roba los últimos tests pendientes del que tiene más cola,
+        como en --dist worksteal.
+        """
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self.durations = load_durations(config)
+
+        def schedule(self):
+            if self.collection is None:
+                if not self._check_nodes_have_same_collection():
+                    self.log("**Different tests collected, aborting run**")
+                    return
+                self.collection = list(self.node2collection.values())[0]
+                index = {nodeid: i for i, nodeid in enumerate(self.collection)}
+                weights = estimate(self.collection, self.durations)
+                for node, group in zip(self.nodes, pack(self.collection, weights, len(self.nodes))):
+                    indices = [index[nodeid] for nodeid in group]
+                    if indices:
+                        self.node2pending[node].extend(indices)
+                        node.send_runtest_some(indices)
+            self.check_schedule()
+
+
+class DurationRecorder:
+    """Acumula la duración de cada test y la guarda al terminar la sesión."""
+
+    def __init__(self, config):
+        self.config = config
+        self.measured = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        if not report.skipped:
+            self.measured[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        cache = getattr(self.config, "cache", None)
+        if not self.measured or cache is None:
+            return
+        seen = cache.get(LAST_SEEN_KEY, {"run": 0, "tests": {}})
+        run = seen["run"] + 1
+        history = load_durations(self.config)
+        last_seen = {n: seen["tests"].get(n, run) for n in history}
+        last_seen.update((n, run) for n in self.measured)
+        durations = prune_durations(merge_durations(history, self.measured), last_seen, run)
+        cache.set(CACHE_KEY, durations)
+        cache.set(LAST_SEEN_KEY, {"run": run, "tests": {n: last_seen[n] for n in durations}})
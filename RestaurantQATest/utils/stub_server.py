@@ -0,0 +1,481 @@
+"""
+Servidor local que imita las páginas Razor de Clientes, Productos y Repartidores.
+Sirve los mismos formularios (nombres de campos, ids, spans data-valmsg-for,
+atributos data-val-* y token antiforgery), valida con las reglas del oráculo y
+guarda los registros en memoria. Permite ejecutar la suite sin ASP.NET ni MySQL.
+
+Uso independiente:
+    python -m utils.stub_server --port 5020
+"""
+import argparse
+import html
+import math
+import os
+import secrets
+import threading
+from collections import namedtuple
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from utils.oracle import CLIENTE_FIELDS, PRODUCTO_FIELDS, REPARTIDOR_FIELDS, predict_values
+
+
+# ==================== CONFIGURACIÓN ====================
+
+ENV_WWWROOT = "RESTAURANTQA_WWWROOT"
+DEFAULT_WWWROOT = Path(__file__).resolve().parent.parent.parent / "RestaurantQA" / "wwwroot"
+
+ANTIFORGERY_COOKIE = ".AspNetCore.Antiforgery.stub"
+ANTIFORGERY_FIELD = "__RequestVerificationToken"
+PAGE_SIZE = 10
+
+CONTENT_TYPES = {
+    ".js": "application/javascript", ".css": "text/css", ".map": "application/json",
+    ".ico": "image/x-icon", ".png": "image/png", ".svg": "image/svg+xml",
+}
+
+# name: nombre del input; label: etiqueta visible; options: opciones de un
+# select (None = input de texto)
+FormField = namedtuple("FormField", ["name", "label", "options"])
+
+# create_path: página del formulario; index_path: lista; fields: FormField del
+# formulario; columns: inputs mostrados en la tabla, en orden; rules: Field del
+# oráculo; search: campos donde busca searchTerm; paged: si la lista se pagina
+# de a PAGE_SIZE
+Resource = namedtuple(
+    "Resource",
+    ["title", "create_path", "index_path", "fields", "columns", "rules", "search", "paged"]
+)
+
+RESOURCES = {
+    "Clientes": Resource(
+        title="Clientes",
+        create_path="/Clientes/Create",
+        index_path="/Clientes/Index",
+        fields=(
+            FormField("Cliente.Nombre", "Nombre", None),
+            FormField("Cliente.Apellido", "Apellido", None),
+            FormField("Cliente.Telefono", "Teléfono", None),
+            FormField("Cliente.Correo", "Correo", None),
+        ),
+        columns=("Cliente.Nombre", "Cliente.Apellido", "Cliente.Telefono", "Cliente.Correo"),
+        rules=CLIENTE_FIELDS,
+        search=("Cliente.Nombre", "Cliente.Apellido", "Cliente.Correo"),
+        paged=True,
+    ),
+    "Productos": Resource(
+        title="Productos",
+        create_path="/Productos/Index",
+        index_path="/Productos/Index",
+        fields=(
+            FormField("Producto.Nombre", "Nombre", None),
+            FormField("Producto.Precio", "Precio", None),
+            FormField("Producto.Stock", "Stock", None),
+            FormField("Producto.Descripcion", "Descripcion", None),
+            FormField("Producto.CategoriaId", "Categoría ID", None),
+        ),
+        columns=("Producto.Nombre", "Producto.Precio", "Producto.Stock",
+                 "Producto.CategoriaId", "Producto.Descripcion"),
+        rules=PRODUCTO_FIELDS,
+        search=("Producto.Nombre", "Producto.CategoriaId"),
+        paged=False,
+    ),
+    "Repartidores": Resource(
+        title="Repartidores",
+        create_path="/Repartidores/Create",
+        index_path="/Repartidores/Index",
+        fields=(
+            FormField("Repartidor.Nombre", "Nombre", None),
+            FormField("Repartidor.Apellido", "Apellido", None),
+            FormField("Repartidor.Telefono", "Teléfono", None),
+            FormField("Repartidor.Tipo", "Tipo de Repartidor", ("", "Bicicleta", "Moto", "Auto")),
+        ),
+        columns=("Repartidor.Nombre", "Repartidor.Apellido", "Repartidor.Telefono",
+                 "Repartidor.Tipo"),
+        rules=REPARTIDOR_FIELDS,
+        search=("Repartidor.Nombre", "Repartidor.Apellido", "Repartidor.Telefono"),
+        paged=True,
+    ),
+}
+
+
+# ==================== RENDERIZADO ====================
+
+def _field_id(name):
+    return name.replace(".", "_")
+
+
+def _data_val_attributes(rule):
+    """
+    Genera los atributos data-val-* que emitirían los tag helpers de ASP.NET.
+
+    Args:
+        rule: Field del oráculo, o None si el campo no tiene reglas
+
+    Returns:
+        dict: {atributo: valor}
+    """
+    if rule is None:
+        return {}
+    prop = rule.name.split(".")[-1]
+    attrs = {}
+    if rule.kind != "text":
+        attrs["data-val-number"] = f"The field {prop} must be a number."
+        if not rule.nullable:
+            attrs["data-val-required"] = f"The {prop} field is required."
+    for check in rule.checks:
+        if check.code in ("required", "email", "phone"):
+            attrs[f"data-val-{check.code}"] = check.message
+        elif check.code == "regex":
+            attrs["data-val-regex"] = check.message
+            attrs["data-val-regex-pattern"] = check.params["pattern"]
+        elif check.code in ("length", "range"):
+            attrs[f"data-val-{check.code}"] = check.message
+            attrs[f"data-val-{check.code}-min"] = check.params["min"]
+            attrs[f"data-val-{check.code}-max"] = check.params["max"]
+    if attrs:
+        attrs["data-val"] = "true"
+    return attrs
+
+
+def _attributes(attrs):
+    return "".join(f' {key}="{html.escape(str(value))}"' for key, value in attrs.items())
+
+
+def _layout(title, body, scripts=""):
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="utf-8" />
+    <title>{html.escape(title)} - Restaurant</title>
+    <link rel="stylesheet" href="/lib/bootstrap/dist/css/bootstrap.min.css" />
+</head>
+<body>
+<div class="container"><main role="main" class="pb-3">
+{body}
+</main></div>
+<script src="/lib/jquery/dist/jquery.min.js"></script>
+{scripts}
+</body>
+</html>"""
+
+
+VALIDATION_SCRIPTS = """<script src="/lib/jquery-validation/dist/jquery.validate.min.js"></script>
+<script src="/lib/jquery-validation-unobtrusive/dist/jquery.validate.unobtrusive.min.js"></script>"""
+
+
+def render_form(resource, token, values=None, errors=None):
+    """
+    Renderiza el formulario de creación de un recurso.
+
+    Args:
+        resource: Resource a renderizar
+        token: Token antiforgery a incluir
+        values: Valores enviados (para volver a mostrarlos tras un error)
+        errors: {nombre del input: mensaje} devueltos por la validación
+
+    Returns:
+        str: HTML del formulario
+    """
+    values = values or {}
+    errors = errors or {}
+    rules = {rule.name: rule for rule in resource.rules}
+    prefix = resource.fields[0].name.split(".")[0]
+    parts = [
+        '<form method="post">',
+        f'<input type="hidden" data-val="true" data-val-required="The Id field is required." '
+        f'id="{prefix}_Id" name="{prefix}.Id" value="0" />',
+    ]
+    for field in resource.fields:
+        value = values.get(field.name, "")
+        error = errors.get(field.name)
+        attrs = {"id": _field_id(field.name), "name": field.name}
+        attrs.update(_data_val_attributes(rules.get(field.name)))
+        css = "input-validation-error " if error else ""
+        if field.options is None:
+            control = (f'<input class="{css}form-control" type="text"{_attributes(attrs)} '
+                       f'value="{html.escape(value)}" />')
+        else:
+            options = "".join(
+                f'<option value="{html.escape(option)}"'
+                f'{" selected" if option == value else ""}>'
+                f'{html.escape(option or "Seleccione un estado")}</option>'
+                for option in field.options
+            )
+            control = f'<select class="{css}form-select"{_attributes(attrs)}>{options}</select>'
+        span_css = "field-validation-error" if error else "field-validation-valid"
+        parts.append(
+            f'<div class="mb-2"><label>{html.escape(field.label)}</label>{control}'
+            f'<span class="text-danger {span_css}" data-valmsg-for="{field.name}" '
+            f'data-valmsg-replace="true">{html.escape(error or "")}</span></div>'
+        )
+    parts.append('<button type="submit" class="btn btn-primary mt-2">Guardar</button>')
+    if resource.create_path != resource.index_path:
+        parts.append(f'<a href="{resource.index_path}" class="btn btn-secondary mt-2">Volver</a>')
+    parts.append(f'<input name="{ANTIFORGERY_FIELD}" type="hidden" value="{token}" /></form>')
+    return "".join(parts)
+
+
+def render_table(resource, rows, search_term, page, total_pages):
+    """
+    Renderiza el buscador, la tabla y la paginación de la lista de un recurso.
+
+    Returns:
+        str: HTML de la lista
+    """
+    labels = {field.name: field.label for field in resource.fields}
+    headers = [labels[name] for name in resource.columns] + ["Acciones"]
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(row.get(name) or '')}</td>" for name in resource.columns)
+        + '<td><button type="submit" class="btn btn-danger btn-sm">Eliminar</button></td></tr>'
+        for row in rows
+    )
+    parts = [
+        '<form method="get" class="mb-3"><div class="input-group">'
+        f'<input type="text" name="searchTerm" value="{html.escape(search_term)}" class="form-control" />'
+        '<button type="submit" class="btn btn-outline-primary">Buscar</button></div></form>',
+        '<table class="table table-striped"><thead><tr>'
+        + "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+        + f"</tr></thead><tbody>{body}</tbody></table>",
+    ]
+    if total_pages > 1:
+        items = "".join(
+            f'<li class="page-item {"active" if i == page else ""}">'
+            f'<a class="page-link" href="{resource.index_path}?page={i}'
+            f'&amp;searchTerm={html.escape(search_term)}">{i}</a></li>'
+            for i in range(1, total_pages + 1)
+        )
+        parts.append(f'<nav aria-label="Paginación"><ul class="pagination">{items}</ul></nav>')
+    return "".join(parts)
+
+
+# ==================== SERVIDOR ====================
+
+class StubState:
+    """Registros en memoria de cada recurso."""
+
+    def __init__(self):
+        self.records = {name: [] for name in RESOURCES}
+        self.lock = threading.Lock()
+
+    def add(self, resource_name, values):
+        with self.lock:
+            self.records[resource_name].append(values)
+
+    def query(self, resource, resource_name, search_term, page):
+        """
+        Filtra y pagina los registros como OnGetAsync de la aplicación.
+
+        Returns:
+            tuple: (filas de la página, número de páginas)
+        """
+        with self.lock:
+            rows = list(self.records[resource_name])
+        if search_term:
+            term = search_term.lower()
+            rows = [row for row in rows
+                    if any(term in (row.get(name) or "").lower() for name in resource.search)]
+        if not resource.paged:
+            return rows, 0
+        total_pages = math.ceil(len(rows) / PAGE_SIZE)
+        start = (page - 1) * PAGE_SIZE
+        return rows[start:start + PAGE_SIZE], total_pages
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Atiende las páginas Razor simuladas y los archivos estáticos de wwwroot."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "RestaurantQAStub/1.0"
+    # Encabezados y cuerpo van en escrituras separadas: sin esto, con keep-alive,
+    # Nagle y el ACK retrasado agregan ~40 ms por respuesta
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    # ---------- Rutas ----------
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        route = self._route(url.path)
+        if route is None:
+            self._static(url.path)
+            return
+        resource_name, resource, is_index = route
+        token = self._token()
+        body = ""
+        if not is_index or resource.create_path == resource.index_path:
+            body += render_form(resource, token)
+        if is_index:
+            search_term = query.get("searchTerm", [""])[0]
+            page = _to_int(query.get("page", ["1"])[0])
+            rows, total_pages = self.server.state.query(resource, resource_name, search_term, page)
+            body += render_table(resource, rows, search_term, page, total_pages)
+        self._send_page(resource.title, body, token)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        route = self._route(url.path)
+        if route is None:
+            self._send(404, b"Not Found", "text/plain")
+            return
+        resource_name, resource, _ = route
+        length = int(self.headers.get("Content-Length") or 0)
+        form = {key: values[0] for key, values in
+                parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True).items()}
+
+        token = self._token()
+        if form.get(ANTIFORGERY_FIELD) != token:
+            self._send(400, b"Bad Request: antiforgery token", "text/plain")
+            return
+
+        columns = {rule.column: form.get(rule.name, "") for rule in resource.rules}
+        prediction = predict_values(resource.rules, columns)
+        values = {field.name: form.get(field.name, "") for field in resource.fields}
+        if prediction.accepted:
+            self.server.state.add(resource_name, values)
+            self._redirect(resource.index_path)
+            return
+        errors = {name: failures[0][1] for name, failures in prediction.errors.items()}
+        self._send_page(resource.title, render_form(resource, token, values, errors), token)
+
+    # ---------- Auxiliares ----------
+
+    def _route(self, path):
+        """
+        Resuelve la ruta a (nombre del recurso, Resource, es_lista).
+        """
+        parts = [part for part in path.split("/") if part]
+        if not parts or parts[0] not in RESOURCES or len(parts) > 2:
+            return None
+        resource = RESOURCES[parts[0]]
+        page = parts[1] if len(parts) == 2 else "Index"
+        if page == "Index":
+            return parts[0], resource, True
+        if f"/{parts[0]}/{page}" == resource.create_path:
+            return parts[0], resource, False
+        return None
+
+    def _token(self):
+        """Token antiforgery de la cookie del cliente, o uno nuevo."""
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        if ANTIFORGERY_COOKIE in cookie:
+            return cookie[ANTIFORGERY_COOKIE].value
+        return secrets.token_urlsafe(24)
+
+    def _send_page(self, title, body, token):
+        scripts = VALIDATION_SCRIPTS if "<form method=\"post\"" in body else ""
+        content = _layout(title, body, scripts).encode("utf-8")
+        headers = {"Set-Cookie": f"{ANTIFORGERY_COOKIE}={token}; Path=/; HttpOnly; SameSite=Strict"}
+        self._send(200, content, "text/html; charset=utf-8", headers)
+
+    def _redirect(self, location):
+        self._send(302, b"", "text/plain", {"Location": location})
+
+    def _static(self, path):
+        root = self.server.wwwroot
+        target = (root / path.lstrip("/")).resolve() if root else None
+        if target is None or root not in target.parents or not target.is_file():
+            self._send(404, b"Not Found", "text/plain")
+            return
+        self._send(200, target.read_bytes(),
+                   CONTENT_TYPES.get(target.suffix, "application/octet-stream"),
+                   {"Cache-Control": "max-age=3600"})
+
+    def _send(self, status, content, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+
+def _to_int(value, default=1):
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return default
+
+
+class StubServer:
+    """
+    Servidor de páginas simuladas ejecutándose en un hilo.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, wwwroot=None):
+        """
+        Inicializa el servidor (no empieza a escuchar hasta start()).
+
+        Args:
+            host: Interfaz donde escuchar
+            port: Puerto; 0 elige uno libre
+            wwwroot: Carpeta de archivos estáticos (jQuery y validación);
+                     por defecto la wwwroot de la aplicación
+        """
+        self.host = host
+        self.port = port
+        wwwroot = Path(wwwroot or os.environ.get(ENV_WWWROOT, DEFAULT_WWWROOT))
+        self.wwwroot = wwwroot.resolve() if wwwroot.is_dir() else None
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def url(self):
+        """URL base del servidor, equivalente a base_url."""
+        return f"http://{self.host}:{self.httpd.server_address[1]}"
+
+    def start(self):
+        """Empieza a atender peticiones en un hilo en segundo plano."""
+        self.httpd = ThreadingHTTPServer((self.host, self.port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = StubState()
+        self.httpd.wwwroot = self.wwwroot
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Detiene el servidor y libera el puerto."""
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def seed(self, resource_name, records):
+        """
+        Agrega registros directamente al almacenamiento, sin pasar por el
+        formulario (para sembrar miles de filas en benchmarks).
+
+        Args:
+            resource_name: Clave de RESOURCES (ej. 'Clientes')
+            records: Iterable de diccionarios {nombre del input: valor}
+        """
+        state = self.httpd.state
+        with state.lock:
+            state.records[resource_name].extend(records)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor simulado de RestaurantQA")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    args = parser.parse_args()
+    server = StubServer(args.host, args.port).start()
+    print(f"Servidor simulado en {server.url} (Ctrl+C para detener)")
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,330 @@
+"""
+Ejecución de casos en varias pestañas de un mismo navegador.
+Cada caso es un generador que usa los Page Objects sobre la pestaña que le
+tocó y, al iniciar una operación lenta (navegar o enviar un formulario), cede
+el control con `yield tab.navigate(url)` o `yield tab.submit(locator)`. Mientras
+esa pestaña carga, el executor sigue con las demás. Cada pestaña publica en
+localStorage cuándo su documento está listo (mismo criterio que
+PAGE_STATE_SCRIPT). Una pestaña de control en el mismo origen lee todas las
+publicaciones en un solo comando, así el handle solo se cambia cuando la
+operación de una pestaña terminó. Así se consigue concurrencia entre casos sin
+abrir otro proceso de Chrome por worker.
+
+Ejemplo de caso:
+
+    def registrar(tab, case):
+        page = ProductoPage(tab.driver)
+        yield tab.navigate(f"{base_url}/Productos/Index")
+        page.fill_form(nombre=case["nombre"], ...)
+        state = yield tab.submit(ProductoPage.BTN_SUBMIT)
+        return state == "loaded" and page.was_redirected()
+"""
+import inspect
+import time
+import uuid
+from collections import deque, namedtuple
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.base_page import BasePage
+from utils.wait_policy import policy_for
+
+
+# Intervalo de lectura de las publicaciones de las pestañas
+POLL_INTERVAL = 0.05
+
+# Script de cada pestaña, inyectado al inicio de cada documento. Publica en
+# localStorage[%(key)s] {state, doc, n}: 'loaded' una vez por documento cuando
+# está listo y 'validated' cuando la validación del cliente cancela un envío
+TAB_STATE_SCRIPT = """
+(function () {
+    var key = '%(key)s', doc = Math.random().toString(36).slice(2), count = 0, loaded = false;
+    function publish(state) {
+        try {
+            localStorage.setItem(key, JSON.stringify({state: state, doc: doc, n: ++count}));
+        } catch (e) {}
+    }
+    function ready() {
+        var $ = window.jQuery;
+        if (!$ || !$.validator || !$.validator.unobtrusive) {
+            return document.readyState === 'complete';
+        }
+        return $('form').toArray().every(function (form) {
+            return !form.querySelector('[data-val="true"]') || !!$(form).data('validator');
+        });
+    }
+    function poll() {
+        if (loaded) { return; }
+        if (ready()) { loaded = true; publish('loaded'); } else { setTimeout(poll, 50); }
+    }
+    document.addEventListener('DOMContentLoaded', poll);
+    document.addEventListener('submit', function (e) {
+        setTimeout(function () { if (e.defaultPrevented) { publish('validated'); } }, 0);
+    }, true);
+    document.addEventListener('invalid', function () { publish('validated'); }, true);
+})();
+"""
+
+# Devuelve la última publicación de la pestaña y programa la acción para
+# después de que el comando termine (así chromedriver no espera la navegación)
+TAB_ACTION_SCRIPT = """
+var key = arguments[0], action = arguments[1], by = arguments[2], value = arguments[3];
+var previous = null;
+try { previous = JSON.parse(localStorage.getItem(key)); } catch (e) {}
+if (action === 'navigate') {
+    setTimeout(function () { location.href = value; }, 0);
+    return previous;
+}
+var el = null;
+switch (by) {
+    case 'id': el = document.getElementById(value); break;
+    case 'name': el = document.getElementsByName(value)[0] || null; break;
+    case 'css selector': el = document.querySelector(value); break;
+    case 'xpath': el = document.evaluate(
+        value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        break;
+}
+if (!el) {
+    throw new Error('Elemento no encontrado: ' + by + '=' + value);
+}
+setTimeout(function () { el.click(); }, 0);
+return previous;
+"""
+
+# Publicaciones de todas las pestañas de un pool: {nombre: {state, doc, n}}
+READ_BOARD_SCRIPT = """
+var prefix = arguments[0], board = {};
+for (var i = 0; i < localStorage.length; i++) {
+    var key = localStorage.key(i);
+    if (key.indexOf(prefix) === 0) {
+        try { board[key.slice(prefix.length)] = JSON.parse(localStorage.getItem(key)); } catch (e) {}
+    }
+}
+return board;
+"""
+
+# Borra las publicaciones del pool al cerrarlo
+CLEAR_BOARD_SCRIPT = """
+var prefix = arguments[0];
+Object.keys(localStorage).forEach(function (key) {
+    if (key.indexOf(prefix) === 0) { localStorage.removeItem(key); }
+});
+"""
+
+# Operación iniciada por una pestaña: termina cuando su publicación cambia
+TabWait = namedtuple("TabWait", ["tab", "previous", "deadline", "description"])
+
+
+class Tab:
+    """Pestaña del pool; sus métodos inician operaciones sin esperarlas."""
+
+    def __init__(self, pool, name, handle):
+        self.pool = pool
+        self.driver = pool.driver
+        self.name = name
+        self.handle = handle
+        self.key = pool.prefix + name
+
+    def navigate(self, url, timeout=None):
+        """
+        Inicia la navegación a una URL.
+
+        Returns:
+            TabWait: Para ceder con yield; se reanuda con 'loaded'
+        """
+        return self._start("navigate", None, url, timeout)
+
+    def submit(self, locator, timeout=None):
+        """
+        Hace clic (por JS) en un botón de envío.
+
+        Args:
+            locator: Tupla (By, valor) del botón (id, name, css selector o xpath)
+
+        Returns:
+            TabWait: Para ceder con yield; se reanuda con 'loaded' o 'validated'
+        """
+        return self._start("submit", *locator, timeout)
+
+    def _start(self, action, by, value, timeout):
+        previous = self.driver.execute_script(TAB_ACTION_SCRIPT, self.key, action, by, value)
+        deadline = time.monotonic() + (timeout or self.pool.timeout)
+        return TabWait(self, previous, deadline, f"{action} {value}")
+
+
+class TabPool:
+    """
+    K pestañas en el navegador de un WebDriver y el executor que reparte casos
+    entre ellas.
+    """
+
+    def __init__(self, driver, size, origin_url, timeout=None):
+        """
+        Args:
+            driver: WebDriver (por ejemplo, prestado por BrowserPool)
+            size: Pestañas simultáneas
+            origin_url: URL de la aplicación para la pestaña de control; debe
+                        tener el mismo origen que las páginas de los casos
+            timeout: Espera máxima por defecto de cada operación en segundos
+                     (None usa 'page' de utils/wait_policy.py)
+        """
+        self.driver = driver
+        self.size = size
+        self.origin_url = origin_url
+        self.timeout = policy_for(driver).timeout("page") if timeout is None else timeout
+        self.prefix = f"__qaTab.{uuid.uuid4().hex[:8]}."
+        self.tabs = []
+        self.home = None
+        self.control = None
+        self.current = None
+        self.switches = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self):
+        """Abre la pestaña de control y las K pestañas de trabajo."""
+        self.home = self.driver.current_window_handle
+        self.driver.switch_to.new_window("tab")
+        self.control = self.current = self.driver.current_window_handle
+        self.driver.get(self.origin_url)
+        for index in range(self.size):
+            self.driver.switch_to.new_window("tab")
+            tab = Tab(self, f"tab{index}", self.driver.current_window_handle)
+            self.current = tab.handle
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                        {"source": TAB_STATE_SCRIPT % {"key": tab.key}})
+            self.tabs.append(tab)
+
+    def close(self):
+        """Cierra las pestañas del pool y vuelve a la ventana original."""
+        for handle in [tab.handle for tab in self.tabs] + [self.control]:
+            if handle is None:
+                continue
+            try:
+                self.driver.switch_to.window(handle)
+                if handle == self.control:
+                    self.driver.execute_script(CLEAR_BOARD_SCRIPT, self.prefix)
+                self.driver.close()
+            except WebDriverException:
+                pass
+        self.tabs, self.control = [], None
+        if self.home is not None:
+            self.driver.switch_to.window(self.home)
+            self.current = self.home
+
+    def run(self, flow, items):
+        """
+        Ejecuta flow(tab, item) para cada item con hasta K pestañas a la vez.
+
+        Args:
+            flow: Función generadora (ver ejemplo del módulo)
+            items: Casos a ejecutar
+
+        Returns:
+            list: Resultado de cada caso en el orden de items (el valor de
+                  return del generador, o la excepción si falló)
+        """
+        results = [None] * len(items)
+        pending = deque(enumerate(items))
+        free = list(reversed(self.tabs))
+        waiting = {}
+
+        def step(tab, generator, index, value=None, error=None):
+            try:
+                wait = generator.throw(error) if error else generator.send(value)
+            except StopIteration as stop:
+                results[index] = stop.value
+            except Exception as e:
+                results[index] = e
+            else:
+                if isinstance(wait, TabWait) and wait.tab is tab:
+                    waiting[tab] = (generator, index, wait)
+                    return
+                generator.close()
+                results[index] = TypeError(f"El caso debe ceder un TabWait de su pestaña: {wait!r}")
+            free.append(tab)
+
+        while pending or waiting:
+            while free and pending:
+                tab = free.pop()
+                index, item = pending.popleft()
+                self._switch(tab.handle)
+                generator = flow(tab, item)
+                if not inspect.isgenerator(generator):
+                    results[index] = generator  # caso sin operaciones lentas
+                    free.append(tab)
+                    continue
+                step(tab, generator, index)
+            if not waiting:
+                continue
+
+            self._switch(self.control)
+            board = self.driver.execute_script(READ_BOARD_SCRIPT, self.prefix)
+            now = time.monotonic()
+            progressed = False
+            for tab, (generator, index, wait) in list(waiting.items()):
+                entry = board.get(tab.name)
+                if entry is not None and entry != wait.previous:
+                    del waiting[tab]
+                    self._switch(tab.handle)
+                    if entry["state"] == "loaded":
+                        BasePage(self.driver).capture_navigation()
+                    step(tab, generator, index, value=entry["state"])
+                    progressed = True
+                elif now >= wait.deadline:
+                    del waiting[tab]
+                    self._switch(tab.handle)
+                    step(tab, generator, index,
+                         error=TimeoutException(f"Timeout en la pestaña {tab.name}: {wait.description}"))
+                    progressed = True
+            if not progressed:
+                time.sleep(POLL_INTERVAL)
+        return results
+
+    def _switch(self, handle):
+        if handle != self.current:
+            self.driver.switch_to.window(handle)
+            self.current = handle
+            self.switches += 1
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+# Tests parametrizados con casos CSV que --tabs reemplaza por su versión en pestañas
+POOLED_TESTS = {
+    "test_registro_producto": "test_producto_en_pestana",
+    "test_registro_repartidor": "test_repartidor_en_pestana",
+    "test_registro_cliente": "test_cliente_en_pestana",
+}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--tabs", type=int, default=1,
+        help="Ejecutar los casos CSV en N pestañas de un mismo navegador (1 = un caso por vez)"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--tabs") > 1 and config.getoption("numprocesses", None):
+        raise pytest.UsageError("--tabs reemplaza a -n: cada worker repetiría todos los casos")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Con --tabs > 1 y el motor de navegador ejecuta las versiones en pestañas
+    de los tests de registro; si no, las deselecciona.
+    """
+    pooled = config.getoption("--tabs") > 1 and config.getoption("--engine") == "browser"
+    replaced = set(POOLED_TESTS) if pooled else set(POOLED_TESTS.values())
+    deselected = [item for item in items if getattr(item, "originalname", None) in replaced]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item not in deselected]
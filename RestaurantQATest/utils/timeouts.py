@@ -0,0 +1,249 @@
+"""
+Timeouts aprendidos de la latencia observada.
+Cada espera registra cuánto tardó, por ruta y operación ('/Productos/Index' +
+'page', '/Clientes/Create' + 'element', ...); la que se agota registra el
+tiempo que esperó, como cota inferior de la latencia real. Las muestras
+se guardan en la caché de pytest entre ejecuciones, separadas por entorno, y
+el timeout de cada espera es un percentil alto de su historial más un margen,
+sin pasar nunca el techo del entorno (DEFAULT_TIMEOUTS o ENVIRONMENTS). Sin
+historial suficiente se usa el techo. Si una espera obligatoria agota el valor
+aprendido, WaitPolicy la extiende hasta el techo y se registra un aviso: así el
+tiempo de la suite sigue la latencia real de la aplicación sin volver frágiles
+los tests cuando el servidor se pone lento.
+"""
+import logging
+import os
+import statistics
+from collections import Counter, defaultdict
+
+import pytest
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "restaurantqa/wait_latencies"
+SERVICE_KEY = pytest.StashKey()
+WORKER_OUTPUT_KEY = "wait_latencies"
+ENV_WAIT_ENV = "RESTAURANTQA_WAIT_ENV"
+
+# Techo en segundos de cada tipo de espera
+DEFAULT_TIMEOUTS = {
+    "implicit": 0,      # espera implícita del driver (no se aprende)
+    "find": 5,          # BasePage.find_element sobre un elemento que aún no está
+    "element": 10,      # elemento visible o clickeable antes de interactuar
+    "visible": 5,       # is_element_visible sin timeout explícito
+    "page": 10,         # documento listo tras navegar
+    "submit": 10,       # documento nuevo o validación del cliente tras enviar un formulario
+    "alert": 3,         # mensaje de éxito tras un envío
+}
+
+# Techos por entorno (se combinan con DEFAULT_TIMEOUTS)
+ENVIRONMENTS = {
+    "local": {},
+    "ci": {"find": 10, "element": 20, "visible": 10, "page": 30, "submit": 30, "alert": 6},
+}
+
+# Timeout aprendido = percentil PERCENTILE * MARGIN_FACTOR + MARGIN_SECONDS
+PERCENTILE = 95
+MARGIN_FACTOR = 1.5
+MARGIN_SECONDS = 0.5
+
+# Muestras necesarias antes de confiar en el historial, y guardadas por clave
+MIN_SAMPLES = 5
+SAMPLE_LIMIT = 200
+
+# Operaciones que se fijan en el driver y no por espera
+STATIC_OPERATIONS = ("implicit",)
+
+
+def history_key(route, operation):
+    """Clave del historial: 'operación ruta' (ej. 'page /Productos/Index')."""
+    return f"{operation} {route}"
+
+
+def learned_timeout(samples):
+    """
+    Timeout derivado de las latencias observadas.
+
+    Args:
+        samples: Segundos que tardaron las esperas (o que esperaron, si se agotaron)
+
+    Returns:
+        float: Percentil PERCENTILE más el margen, o None con menos de MIN_SAMPLES
+    """
+    if len(samples) < MIN_SAMPLES:
+        return None
+    high = statistics.quantiles(samples, n=100, method="inclusive")[PERCENTILE - 1]
+    return round(high * MARGIN_FACTOR + MARGIN_SECONDS, 2)
+
+
+class TimeoutService:
+    """Techos por entorno, historial de latencias y timeouts derivados."""
+
+    def __init__(self, ceilings=None, history=None, adaptive=True):
+        """
+        Args:
+            ceilings: Techos que reemplazan a DEFAULT_TIMEOUTS
+            history: {clave: [segundos, ...]} de ejecuciones anteriores
+            adaptive: False para usar siempre el techo
+        """
+        self.ceilings = dict(DEFAULT_TIMEOUTS, **(ceilings or {}))
+        self.history = history or {}
+        self.adaptive = adaptive
+        self.samples = defaultdict(list)    # muestras de esta ejecución
+        self.fallbacks = Counter()          # esperas extendidas hasta el techo
+        self._learned = {}
+
+    def ceiling(self, operation):
+        """Techo en segundos de un tipo de espera."""
+        return self.ceilings[operation]
+
+    def timeout(self, operation, route=None):
+        """
+        Timeout de una espera.
+
+        Args:
+            operation: Tipo de espera (clave de DEFAULT_TIMEOUTS)
+            route: Ruta de la página (ver utils.page_metrics.route_of); None usa el techo
+
+        Returns:
+            float: Segundos
+        """
+        ceiling = self.ceilings[operation]
+        if not self.adaptive or route is None or operation in STATIC_OPERATIONS:
+            return ceiling
+        key = history_key(route, operation)
+        if key not in self._learned:
+            self._learned[key] = learned_timeout(self.history.get(key, []))
+        learned = self._learned[key]
+        return ceiling if learned is None else min(ceiling, learned)
+
+    def record(self, operation, route, seconds):
+        """Registra cuánto tardó una espera, o cuánto esperó si se agotó."""
+        if route is not None and operation not in STATIC_OPERATIONS:
+            self.samples[history_key(route, operation)].append(round(seconds, 3))
+
+    def fallback(self, operation, route, learned):
+        """Registra que una espera superó su valor aprendido y se extiende al techo."""
+        key = history_key(route, operation)
+        self.fallbacks[key] += 1
+        logger.warning("Espera '%s' en %s superó el valor aprendido (%.2f s); se extiende "
+                       "hasta el techo (%s s)", operation, route, learned, self.ceilings[operation])
+
+    def export(self):
+        """
+        Muestras y extensiones de esta ejecución (para enviarlas desde un worker).
+
+        Returns:
+            dict: {'samples': {clave: [...]}, 'fallbacks': {clave: n}}
+        """
+        return {"samples": {key: list(values) for key, values in self.samples.items()},
+                "fallbacks": dict(self.fallbacks)}
+
+    def merge(self, exported):
+        """Incorpora lo exportado por otro servicio (ver export)."""
+        for key, values in exported["samples"].items():
+            self.samples[key].extend(values)
+        self.fallbacks.update(exported["fallbacks"])
+
+    def merged_history(self):
+        """
+        Historial con las muestras de esta ejecución agregadas.
+
+        Returns:
+            dict: {clave: últimas SAMPLE_LIMIT muestras}
+        """
+        merged = dict(self.history)
+        for key, values in self.samples.items():
+            merged[key] = (merged.get(key, []) + values)[-SAMPLE_LIMIT:]
+        return merged
+
+
+# Servicio que usan las WaitPolicy (el plugin lo reemplaza por uno con historial)
+_service = TimeoutService()
+
+
+def current_service():
+    """
+    Returns:
+        TimeoutService: Servicio activo
+    """
+    return _service
+
+
+def use_service(service):
+    """Reemplaza el servicio activo."""
+    global _service
+    _service = service
+
+
+# ==================== PLUGIN DE PYTEST ====================
+
+def _parse_override(value):
+    name, _, seconds = value.partition("=")
+    if name not in DEFAULT_TIMEOUTS or not seconds:
+        raise pytest.UsageError(
+            f"--wait-timeout espera NOMBRE=SEGUNDOS con NOMBRE en {', '.join(DEFAULT_TIMEOUTS)}: {value!r}"
+        )
+    try:
+        return name, float(seconds)
+    except ValueError:
+        raise pytest.UsageError(f"--wait-timeout: segundos inválidos en {value!r}")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("restaurantqa", "RestaurantQA")
+    group.addoption(
+        "--wait-env", choices=tuple(ENVIRONMENTS), default=os.environ.get(ENV_WAIT_ENV, "local"),
+        help=f"Entorno de los techos de espera y de su historial (o ${ENV_WAIT_ENV})"
+    )
+    group.addoption(
+        "--wait-timeout", action="append", default=[], metavar="NOMBRE=SEGUNDOS",
+        help="Reemplaza el techo de un tipo de espera (ej. page=20); se puede repetir"
+    )
+    group.addoption(
+        "--no-adaptive-waits", action="store_true", default=False,
+        help="Usar siempre el techo en lugar de los timeouts aprendidos"
+    )
+
+
+def pytest_configure(config):
+    env = config.getoption("--wait-env")
+    ceilings = dict(ENVIRONMENTS[env])
+    ceilings.update(_parse_override(value) for value in config.getoption("--wait-timeout"))
+    history = {}
+    if getattr(config, "cache", None) is not None:
+        history = config.cache.get(f"{CACHE_KEY}/{env}", {})
+    service = TimeoutService(ceilings, history, adaptive=not config.getoption("--no-adaptive-waits"))
+    config.stash[SERVICE_KEY] = service
+    use_service(service)
+
+
+def pytest_unconfigure(config):
+    use_service(TimeoutService())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Controlador de xdist: incorpora las muestras de un worker que terminó."""
+    exported = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if exported:
+        node.config.stash[SERVICE_KEY].merge(exported)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    service = config.stash[SERVICE_KEY]
+    if hasattr(config, "workerinput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = service.export()
+    elif service.samples and getattr(config, "cache", None) is not None:
+        config.cache.set(f"{CACHE_KEY}/{config.getoption('--wait-env')}", service.merged_history())
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    service = config.stash.get(SERVICE_KEY, None)
+    if service is None or not service.fallbacks:
+        return
+    terminalreporter.section("Esperas")
+    for key, count in service.fallbacks.most_common():
+        terminalreporter.write_line(f"Extendida hasta el techo {count} vez/veces: {key}")
@@ -0,0 +1,184 @@
+"""
+Política de esperas de los Page Objects.
+Todas las esperas (buscar un elemento, esperar que sea visible o clickeable,
+esperar la carga de una página, el mensaje de éxito tras un envío) toman su
+timeout de aquí, aprendido por ruta y operación (ver utils/timeouts.py). Las
+esperas obligatorias que agotan el valor aprendido siguen hasta el techo; las
+consultas ('¿es visible?', present_within) responden con el valor aprendido.
+La espera implícita del driver queda en 0 por defecto y la
+búsqueda de BasePage.find_element la reemplaza con un polling explícito; si se
+configura una espera implícita, se desactiva durante cada espera explícita para
+que no se multipliquen (cada sondeo de WebDriverWait sobre un elemento ausente
+costaría la espera implícita completa). Las comprobaciones de ausencia son
+inmediatas.
+"""
+import time
+import weakref
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.timeouts import current_service
+
+# Intervalo de sondeo de las esperas explícitas
+POLL_INTERVAL = 0.05
+
+# Driver -> WaitPolicy
+_policies = weakref.WeakKeyDictionary()
+
+
+class WaitPolicy:
+    """Timeouts y primitivas de espera de un WebDriver."""
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: WebDriver
+        """
+        self.driver = driver
+        # Ruta del último documento al que se navegó (tras un envío sigue siendo la
+        # del formulario); junto con el tipo de espera es la clave de los timeouts
+        self.route = None
+        self._implicit = None   # espera implícita aplicada en el driver
+        self._explicit_depth = 0
+
+    @property
+    def service(self):
+        """TimeoutService activo (ver utils/timeouts.py)."""
+        return current_service()
+
+    def timeout(self, name):
+        """
+        Args:
+            name: Tipo de espera (clave de utils.timeouts.DEFAULT_TIMEOUTS)
+
+        Returns:
+            float: Segundos para la ruta actual
+        """
+        return self.service.timeout(name, self.route)
+
+    def apply(self):
+        """Aplica en el driver la espera implícita de la política."""
+        self._set_implicit(self.service.ceiling("implicit"))
+
+    @contextmanager
+    def explicit(self):
+        """Desactiva la espera implícita del driver durante un bloque."""
+        restore = self._explicit_depth == 0 and self._implicit
+        self._explicit_depth += 1
+        if restore:
+            self._set_implicit(0)
+        try:
+            yield
+        finally:
+            self._explicit_depth -= 1
+            if restore:
+                self._set_implicit(restore)
+
+    def until(self, condition, timeout="element", ignored_exceptions=None, probe=False):
+        """
+        Espera explícita sin espera implícita de por medio.
+
+        Con un tipo de espera usa el timeout aprendido para la ruta actual y
+        registra la latencia. Si se agota y no es una consulta, avisa y sigue
+        esperando hasta el techo. Una espera agotada se registra con el tiempo
+        esperado (muestra censurada: la condición tardaba al menos eso), así el
+        valor aprendido puede crecer también con las consultas.
+
+        Args:
+            condition: Función (driver) -> valor; se reintenta hasta que sea verdadero
+            timeout: Segundos o tipo de espera
+            ignored_exceptions: Excepciones que cuentan como 'todavía no'
+            probe: True si agotar el tiempo es una respuesta válida (no se extiende)
+
+        Returns:
+            Valor devuelto por condition
+
+        Raises:
+            TimeoutException: Si no se cumplió dentro del timeout
+        """
+        if not isinstance(timeout, str):
+            with self.explicit():
+                return self._wait(condition, timeout, ignored_exceptions)
+        service, route = self.service, self.route
+        seconds, ceiling = service.timeout(timeout, route), service.ceiling(timeout)
+        start = time.monotonic()
+        try:
+            with self.explicit():
+                try:
+                    value = self._wait(condition, seconds, ignored_exceptions)
+                except TimeoutException:
+                    if probe or seconds >= ceiling:
+                        raise
+                    service.fallback(timeout, route, seconds)
+                    value = self._wait(condition, ceiling - seconds, ignored_exceptions)
+        except TimeoutException:
+            service.record(timeout, route, time.monotonic() - start)
+            raise
+        service.record(timeout, route, time.monotonic() - start)
+        return value
+
+    def _wait(self, condition, seconds, ignored_exceptions):
+        wait = WebDriverWait(self.driver, seconds, poll_frequency=POLL_INTERVAL,
+                             ignored_exceptions=ignored_exceptions)
+        return wait.until(condition)
+
+    def present_within(self, locator, timeout):
+        """
+        Espera a que un elemento exista en el DOM.
+
+        Args:
+            locator: Tupla (By, valor)
+            timeout: Segundos o tipo de espera; 0 comprueba una sola vez
+
+        Returns:
+            WebElement, o None si no apareció a tiempo
+        """
+        try:
+            return self.until(_first_element(locator), timeout, probe=True)
+        except TimeoutException:
+            return None
+
+    def find(self, locator):
+        """
+        Busca un elemento esperando hasta el timeout 'find'.
+
+        Raises:
+            NoSuchElementException: Si no apareció a tiempo
+        """
+        try:
+            return self.until(_first_element(locator), "find")
+        except TimeoutException:
+            raise NoSuchElementException(f"Elemento no encontrado: {locator}")
+
+    def find_all(self, locator):
+        """Elementos que coinciden con el localizador ahora mismo (sin esperar)."""
+        with self.explicit():
+            return self.driver.find_elements(*locator)
+
+    def is_absent(self, locator):
+        """Indica, sin esperar, que ningún elemento coincide con el localizador."""
+        return not self.find_all(locator)
+
+    def _set_implicit(self, seconds):
+        if seconds != self._implicit:
+            self.driver.implicitly_wait(seconds)
+            self._implicit = seconds
+
+
+def _first_element(locator):
+    return lambda d: (d.find_elements(*locator) or [None])[0]
+
+
+def policy_for(driver):
+    """
+    Política de esperas de un driver (la misma para todos sus Page Objects).
+
+    Returns:
+        WaitPolicy
+    """
+    policy = _policies.get(driver)
+    if policy is None:
+        policy = _policies[driver] = WaitPolicy(driver)
+    return policy